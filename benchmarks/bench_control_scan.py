@@ -0,0 +1,74 @@
+"""
+TextExtractor kontrol karakteri taraması mikro-benchmark'ı
+
+Eski karakter bazlı Python döngüsü ile bayt seviyesindeki translate taramasının
+verim farkını ölçer.
+
+Kullanım:
+    python benchmarks/bench_control_scan.py --sizes 1,16,128,1024
+"""
+import argparse
+import os
+import sys
+import time
+from typing import Callable, List, Tuple
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from processor.extractors.text_extractor import TextExtractor  # noqa: E402
+
+# Tipik JSON/log satırı; kontrol karakteri içermez (en kötü durum: tamamı taranır)
+SAMPLE_LINE = b'{"ts": "2024-01-01T00:00:00Z", "level": "INFO", "msg": "istek tamamlandi", "ms": 12}\n'
+
+
+def make_payload(size_mb: int) -> bytes:
+    """Verilen boyutta metin verisi üretir"""
+    size = size_mb * 1024 * 1024
+    return (SAMPLE_LINE * (size // len(SAMPLE_LINE) + 1))[:size]
+
+
+def legacy_scan(content: str) -> bool:
+    """Eski TextExtractor.extract_text kontrolü"""
+    return any(ord(c) < 32 and c not in '\n\r\t' for c in content)
+
+
+def measure(func: Callable[[], object], repeat: int) -> float:
+    """En iyi çalışma süresini saniye olarak döndürür"""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Kontrol karakteri taraması benchmark'ı")
+    parser.add_argument('--sizes', default='1,16,128',
+                        help="Virgülle ayrılmış girdi boyutları (MB), ör. 1,16,128,1024")
+    parser.add_argument('--repeat', type=int, default=3, help="Her ölçümün tekrar sayısı")
+    parser.add_argument('--legacy-max-mb', type=int, default=128,
+                        help="Eski döngünün ölçüleceği en büyük boyut (MB)")
+    args = parser.parse_args()
+
+    extractor = TextExtractor()
+    rows: List[Tuple[int, str, float]] = []
+
+    for size_mb in (int(size) for size in args.sizes.split(',')):
+        payload = make_payload(size_mb)
+        rows.append((size_mb, 'translate (bytes)',
+                     measure(lambda: extractor.has_binary_content(payload), args.repeat)))
+        if size_mb <= args.legacy_max_mb:
+            content = payload.decode('utf-8')
+            rows.append((size_mb, 'python döngüsü (str)',
+                         measure(lambda: legacy_scan(content), 1)))
+            del content
+        del payload
+
+    print(f"{'Boyut':>8}  {'Yöntem':<22} {'Süre (s)':>10} {'MB/s':>10}")
+    for size_mb, method, seconds in rows:
+        print(f"{size_mb:>6}MB  {method:<22} {seconds:>10.4f} {size_mb / seconds:>10.1f}")
+
+
+if __name__ == '__main__':
+    main()
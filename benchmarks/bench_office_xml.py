@@ -0,0 +1,125 @@
+"""
+Office belgeleri için nesne modeli / doğrudan XML karşılaştırması
+
+Büyük DOCX, PPTX ve ODT belgeleri üretir; her belgeyi python-docx/python-pptx/odfpy
+nesne modeli yolu ve iterparse tabanlı doğrudan XML yolu ile ayrı süreçlerde
+okur. Süreyi, en yüksek RSS artışını ve iki çıktının aynı olup olmadığını raporlar.
+
+Kullanım:
+    python benchmarks/bench_office_xml.py --paragraphs 50000 --slides 500 --runs 3
+"""
+import argparse
+import multiprocessing
+import os
+import resource
+import sys
+import tempfile
+import time
+from typing import Dict, List, Tuple
+
+SRC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src')
+sys.path.insert(0, SRC_DIR)
+
+from processor.extractors.office_extractor import OfficeExtractor  # noqa: E402
+
+
+def make_docx(path: str, paragraphs: int) -> None:
+    """Biçimlendirilmiş run'lar ve tablolar içeren DOCX üretir"""
+    import docx
+    document = docx.Document()
+    for i in range(paragraphs):
+        paragraph = document.add_paragraph(f"Paragraf {i}: ")
+        paragraph.add_run("lorem ipsum dolor sit amet\t").bold = True
+        paragraph.add_run("consectetur adipiscing elit " * 4)
+        if i % 500 == 0:
+            document.add_table(rows=4, cols=4).cell(0, 0).text = f"tablo {i}"
+    document.save(path)
+
+
+def make_pptx(path: str, slides: int) -> None:
+    """Başlık, madde listesi ve metin kutusu içeren PPTX üretir"""
+    import pptx
+    from pptx.util import Inches
+    presentation = pptx.Presentation()
+    for i in range(slides):
+        slide = presentation.slides.add_slide(presentation.slide_layouts[1])
+        slide.shapes.title.text = f"Slayt {i}"
+        slide.placeholders[1].text = "\n".join(f"madde {i}.{j} lorem ipsum" for j in range(8))
+        box = slide.shapes.add_textbox(Inches(1), Inches(5), Inches(4), Inches(1))
+        box.text_frame.text = "not kutusu " * 10
+    presentation.save(path)
+
+
+def make_odt(path: str, paragraphs: int) -> None:
+    """Aralıklı paragraflar içeren ODT üretir"""
+    from odf import text
+    from odf.opendocument import OpenDocumentText
+    document = OpenDocumentText()
+    for i in range(paragraphs):
+        paragraph = text.P(text=f"Paragraf {i}: lorem ipsum dolor sit amet ")
+        paragraph.addElement(text.Span(text="consectetur adipiscing elit " * 4))
+        document.text.addElement(paragraph)
+    document.save(path)
+
+
+def run_child(path: str, use_xml: bool, queue: "multiprocessing.Queue") -> None:
+    """Tek bir okumayı temiz bir süreçte ölçer"""
+    ext = os.path.splitext(path)[1]
+    extractor = OfficeExtractor(xml_formats={ext} if use_xml else None)
+    # Kütüphane içe aktarma maliyeti ölçüme katılmasın
+    import docx, pptx, odf.opendocument  # noqa: E401,F401
+    baseline = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    start = time.perf_counter()
+    text = extractor.extract_text(path)
+    elapsed = time.perf_counter() - start
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    queue.put((elapsed, (peak - baseline) / 1024, text))
+
+
+def measure(path: str, use_xml: bool, runs: int) -> Tuple[float, float, str]:
+    """En iyi süreyi, en yüksek RSS artışını (MB) ve çıktıyı döndürür"""
+    context = multiprocessing.get_context('spawn')
+    results: List[Tuple[float, float, str]] = []
+    for _ in range(runs):
+        queue = context.Queue()
+        process = context.Process(target=run_child, args=(path, use_xml, queue))
+        process.start()
+        results.append(queue.get())
+        process.join()
+    best = min(result[0] for result in results)
+    peak = max(result[1] for result in results)
+    return best, peak, results[0][2] or ''
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Office nesne modeli / doğrudan XML benchmark'ı")
+    parser.add_argument('--paragraphs', type=int, default=20000, help="DOCX ve ODT paragraf sayısı")
+    parser.add_argument('--slides', type=int, default=300, help="PPTX slayt sayısı")
+    parser.add_argument('--runs', type=int, default=3, help="Ölçüm tekrar sayısı (en iyisi raporlanır)")
+    args = parser.parse_args()
+
+    rows: List[Tuple[str, float, Dict[str, Tuple[float, float]], bool]] = []
+    with tempfile.TemporaryDirectory() as workdir:
+        documents = [
+            (os.path.join(workdir, 'large.docx'), make_docx, args.paragraphs),
+            (os.path.join(workdir, 'large.pptx'), make_pptx, args.slides),
+            (os.path.join(workdir, 'large.odt'), make_odt, args.paragraphs),
+        ]
+        for path, make, size in documents:
+            make(path, size)
+            model_time, model_peak, model_text = measure(path, False, args.runs)
+            xml_time, xml_peak, xml_text = measure(path, True, args.runs)
+            rows.append((os.path.basename(path), os.path.getsize(path) / (1024 * 1024),
+                         {'nesne modeli': (model_time, model_peak), 'doğrudan XML': (xml_time, xml_peak)},
+                         model_text == xml_text))
+
+    print(f"{'Belge':<12} {'Boyut':>8}  {'Yöntem':<14} {'Süre (s)':>9} {'RSS artışı (MB)':>16}")
+    for name, size_mb, results, same in rows:
+        for method, (seconds, peak_mb) in results.items():
+            print(f"{name:<12} {size_mb:>6.1f}MB  {method:<14} {seconds:>9.3f} {peak_mb:>16.1f}")
+        # ODT'de XML yolu başlıkları (text:h) da okur, odfpy yolu yalnızca text:p okur
+        print(f"{'':<12} {'':>8}  çıktılar aynı: {'evet' if same else 'hayır'}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,235 @@
+"""
+Uçtan uca çıkarım hattı benchmark'ı
+
+corpus.py ile belirlenimci bir sentetik derlem üretir (veya aynı ayarlarla
+üretilmişse yeniden kullanır) ve FileProcessor.process'i her ayar için temiz
+bir Python sürecinde çalıştırır. Dosya/saniye, MB/saniye, en yüksek RSS
+(worker süreçleri dahil) ile extractor ve aşama bazında süreleri raporlar;
+extractor ve aşama süreleri FileProcessor'ın ölçüm raporundan (metrics_file)
+alınır.
+
+Sonuçlar --output ile JSON olarak kaydedilir. --baseline verilirse önceki bir
+sonuç dosyasıyla karşılaştırılır; eşikten (varsayılan %10) fazla gerileyen
+ölçümler listelenir ve program 1 koduyla çıkar (CI'da kullanılabilir).
+
+Kullanım:
+    python benchmarks/bench_pipeline.py --workers 1 4 --output baseline.json
+    python benchmarks/bench_pipeline.py --workers 1 4 --baseline baseline.json --output current.json
+    python benchmarks/bench_pipeline.py --option dedup=true --option prefetch_threads=0
+"""
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from corpus import MANIFEST_NAME, generate_corpus
+
+SRC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src')
+
+# Sonuç dosyasının biçimi değiştiğinde artırılır
+RESULTS_VERSION = 1
+# Bundan kısa extractor/aşama süreleri karşılaştırmada gürültü sayılır (saniye)
+NOISE_FLOOR_SECONDS = 0.05
+
+CHILD_SCRIPT = """
+import json, logging, resource, sys, time
+logging.disable(logging.CRITICAL)
+from processor.file_processor import FileProcessor
+options = json.loads(sys.argv[1])
+start = time.perf_counter()
+FileProcessor(**options).process(sys.argv[2])
+wall = time.perf_counter() - start
+print(json.dumps({
+    'wall_s': wall,
+    'peak_rss_kb': max(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+                       resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss),
+}))
+"""
+
+
+def parse_option(text: str) -> Tuple[str, Any]:
+    """KEY=VALUE biçimli FileProcessor seçeneğini çözümler (değer JSON ise JSON olarak)"""
+    key, sep, value = text.partition('=')
+    if not sep:
+        raise argparse.ArgumentTypeError(f"KEY=VALUE bekleniyordu: {text}")
+    try:
+        return key, json.loads(value)
+    except ValueError:
+        return key, value
+
+
+def run_once(corpus: str, options: Dict[str, Any]) -> Dict[str, Any]:
+    """Tek bir çalışmayı temiz bir süreçte ölçer, ölçüm raporunu da döndürür"""
+    env = dict(os.environ, PYTHONPATH=SRC_DIR)
+    result = subprocess.run([sys.executable, '-c', CHILD_SCRIPT, json.dumps(options), corpus],
+                            env=env, capture_output=True, text=True, check=True)
+    run = json.loads(result.stdout.strip().splitlines()[-1])
+    with open(options['metrics_file'], 'r', encoding='utf-8') as f:
+        run['metrics'] = json.load(f)
+    return run
+
+
+def measure(corpus: str, manifest: Dict[str, Any], options: Dict[str, Any], runs: int,
+            workdir: str) -> Dict[str, Any]:
+    """
+    Bir ayarı runs kez çalıştırır; en iyi süreyi ve en yüksek RSS'i raporlar
+
+    Dosya/saniye ve MB/saniye derlemdeki tüm dosyalar (atlananlar dahil) üzerinden
+    hesaplanır, böylece farklı ayarlar aynı iş miktarıyla karşılaştırılır.
+    """
+    options = dict(options, output_file=os.path.join(workdir, 'out.txt'),
+                   metrics_file=os.path.join(workdir, 'metrics.json'))
+    # Derlemin kendi manifest'i ölçüme katılmasın
+    options.setdefault('exclude', [f"/{MANIFEST_NAME}"])
+    results = [run_once(corpus, options) for _ in range(runs)]
+    best = min(results, key=lambda run: run['wall_s'])
+    metrics = best['metrics']
+    return {
+        'wall_s': round(best['wall_s'], 4),
+        'all_wall_s': [round(run['wall_s'], 4) for run in results],
+        'files_per_second': round(manifest['files'] / best['wall_s'], 2),
+        'mb_per_second': round(manifest['bytes'] / (1024 * 1024) / best['wall_s'], 3),
+        # Linux'ta ru_maxrss KB cinsindendir
+        'peak_rss_mb': round(max(run['peak_rss_kb'] for run in results) / 1024, 1),
+        'extracted_files': metrics['files'],
+        'latency': metrics['latency'],
+        'by_extractor': {name: {'files': group['files'], 'bytes': group['bytes'],
+                                'seconds': group['seconds'], 'p95': group['p95']}
+                         for name, group in metrics['by_extractor'].items()},
+        'stages': {stage: values['seconds'] for stage, values in metrics['stages'].items()},
+    }
+
+
+def compare(current: Dict[str, Any], baseline: Dict[str, Any], threshold: float) -> List[str]:
+    """
+    Sonuçları temel çalışmayla karşılaştırır, eşiği aşan gerilemeleri döndürür
+
+    Args:
+        current (Dict[str, Any]): Bu çalışmanın sonuçları
+        baseline (Dict[str, Any]): Temel alınan sonuç dosyası
+        threshold (float): İzin verilen göreli kötüleşme (0.1 = %10)
+
+    Returns:
+        List[str]: Gerileme açıklamaları
+    """
+    if current['corpus']['fingerprint'] != baseline['corpus']['fingerprint']:
+        print("UYARI: derlem temel çalışmadakiyle aynı değil, karşılaştırma yanıltıcı olabilir.")
+    if current['environment']['python'] != baseline['environment']['python']:
+        print(f"UYARI: Python sürümü farklı ({baseline['environment']['python']} -> "
+              f"{current['environment']['python']}).")
+
+    regressions: List[str] = []
+
+    def check(label: str, old: Optional[float], new: Optional[float], higher_is_better: bool,
+              floor: float = 0.0) -> None:
+        if not old or new is None or max(old, new) < floor:
+            return
+        change = (new - old) / old
+        worse = -change if higher_is_better else change
+        marker = '  <-- gerileme' if worse > threshold else ''
+        print(f"  {label:<40} {old:>10.3f} -> {new:>10.3f}  ({change * 100:+6.1f}%){marker}")
+        if marker:
+            regressions.append(f"{label}: {old:.3f} -> {new:.3f} ({change * 100:+.1f}%)")
+
+    for name, result in current['configs'].items():
+        old = baseline['configs'].get(name)
+        if old is None:
+            print(f"{name}: temel çalışmada yok, atlandı")
+            continue
+        print(f"{name}:")
+        check(f"{name} dosya/s", old['files_per_second'], result['files_per_second'], True)
+        check(f"{name} MB/s", old['mb_per_second'], result['mb_per_second'], True)
+        check(f"{name} en yüksek RSS (MB)", old['peak_rss_mb'], result['peak_rss_mb'], False)
+        for extractor, values in result['by_extractor'].items():
+            previous = old['by_extractor'].get(extractor)
+            if previous is not None:
+                check(f"{name} {extractor} süre (s)", previous['seconds'], values['seconds'], False,
+                      NOISE_FLOOR_SECONDS)
+        for stage, seconds in result['stages'].items():
+            check(f"{name} aşama {stage} (s)", old['stages'].get(stage), seconds, False, NOISE_FLOOR_SECONDS)
+    return regressions
+
+
+def print_results(results: Dict[str, Any]) -> None:
+    """Sonuçları tablo olarak yazdırır"""
+    corpus = results['corpus']
+    print(f"Derlem: {corpus['files']} dosya, {corpus['bytes'] / (1024 * 1024):.1f} MB "
+          f"(ölçek {corpus['scale']}, tohum {corpus['seed']}, parmak izi {corpus['fingerprint'][:12]})")
+    print(f"{'Ayar':<28} {'Süre (s)':>9} {'dosya/s':>9} {'MB/s':>8} {'RSS (MB)':>9} {'p95 (ms)':>9}")
+    for name, result in results['configs'].items():
+        print(f"{name:<28} {result['wall_s']:>9.3f} {result['files_per_second']:>9.1f} "
+              f"{result['mb_per_second']:>8.2f} {result['peak_rss_mb']:>9.1f} "
+              f"{result['latency']['p95'] * 1000:>9.1f}")
+        for extractor, values in sorted(result['by_extractor'].items()):
+            print(f"    {extractor:<24} {values['seconds']:>9.3f}s  {values['files']:>6} dosya  "
+                  f"p95 {values['p95'] * 1000:.1f}ms")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Uçtan uca çıkarım hattı benchmark'ı")
+    parser.add_argument('--corpus', default=os.path.join(tempfile.gettempdir(), 'textractor-bench-corpus'),
+                        help="Derlem dizini (aynı ayarlarla üretilmişse yeniden kullanılır)")
+    parser.add_argument('--scale', type=float, default=1.0, help="Derlemdeki dosya sayılarının çarpanı")
+    parser.add_argument('--seed', type=int, default=0, help="Derlem üretecinin tohumu")
+    parser.add_argument('--workers', type=int, nargs='+', default=[1], help="Denenecek worker sayıları")
+    parser.add_argument('--runs', type=int, default=3, help="Ölçüm tekrar sayısı (en iyisi raporlanır)")
+    parser.add_argument('--option', type=parse_option, action='append', default=[],
+                        help="Ek FileProcessor seçeneği, KEY=VALUE (değer JSON olarak okunur)")
+    parser.add_argument('--output', help="Sonuçların yazılacağı JSON dosyası")
+    parser.add_argument('--baseline', help="Karşılaştırılacak önceki sonuç dosyası")
+    parser.add_argument('--threshold', type=float, default=0.10,
+                        help="Gerileme sayılacak göreli kötüleşme (varsayılan 0.10)")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    manifest = generate_corpus(args.corpus, args.scale, args.seed)
+    print(f"Derlem hazır ({time.perf_counter() - start:.1f}s): {args.corpus}")
+
+    extra = dict(args.option)
+    configs: Dict[str, Any] = {}
+    with tempfile.TemporaryDirectory() as workdir:
+        for workers in args.workers:
+            options = dict(extra, workers=workers)
+            name = ' '.join(f"{key}={value}" for key, value in sorted(options.items()))
+            configs[name] = dict(measure(args.corpus, manifest, options, args.runs, workdir),
+                                 options=options)
+
+    results = {
+        'version': RESULTS_VERSION,
+        'created': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'environment': {
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'cpus': os.cpu_count(),
+        },
+        'corpus': {key: manifest[key] for key in ('scale', 'seed', 'files', 'bytes', 'fingerprint')},
+        'runs': args.runs,
+        'configs': configs,
+    }
+    print_results(results)
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+        print(f"Sonuçlar {args.output} dosyasına yazıldı.")
+
+    if args.baseline:
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+        print(f"\nTemel çalışma: {args.baseline} ({baseline['created']})")
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print(f"\n{len(regressions)} gerileme bulundu:")
+            for line in regressions:
+                print(f"  - {line}")
+            sys.exit(1)
+        print("\nGerileme yok.")
+
+
+if __name__ == '__main__':
+    main()
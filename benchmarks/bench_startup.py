@@ -0,0 +1,124 @@
+"""
+Soğuk başlangıç benchmark'ı
+
+Yalnızca .txt dosyalarından oluşan bir klasörü işleyen yeni bir Python süreci
+başlatır ve `-X importtime` çıktısından içe aktarma süresini, duvar saati
+süresini ve en yüksek RSS değerini raporlar. `--eager` ile eski davranış
+(tüm extractor kütüphanelerinin açılışta içe aktarılması) karşılaştırılır.
+
+Kullanım:
+    python benchmarks/bench_startup.py --files 200 --runs 5
+    python benchmarks/bench_startup.py --eager
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Dict, List, Tuple
+
+SRC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src')
+
+# Eski sürümde file_processor içe aktarılırken yüklenen kütüphaneler
+HEAVY_MODULES = [
+    'docx', 'odf.opendocument', 'xlrd', 'openpyxl', 'pptx',
+    'pdfminer.high_level', 'numpy', 'tensorflow', 'chardet',
+]
+
+CHILD_SCRIPT = """
+import importlib, json, logging, resource, sys
+logging.disable(logging.WARNING)
+if {eager}:
+    for name in {heavy}:
+        try:
+            importlib.import_module(name)
+        except ImportError:
+            pass
+from processor.file_processor import FileProcessor
+FileProcessor(output_file={output!r}).process({corpus!r})
+print(json.dumps({{
+    'heavy_loaded': sorted(name for name in {heavy} if name in sys.modules),
+    'peak_rss_kb': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+}}))
+"""
+
+
+def make_corpus(directory: str, count: int) -> None:
+    """Yalnızca metin dosyalarından oluşan bir klasör üretir"""
+    for i in range(count):
+        with open(os.path.join(directory, f"note_{i:05d}.txt"), 'w', encoding='utf-8') as f:
+            f.write(f"Not {i}\n" + "lorem ipsum dolor sit amet\n" * 20)
+
+
+def parse_importtime(stderr: str) -> Tuple[int, List[Tuple[int, str]]]:
+    """
+    -X importtime çıktısını çözümler
+
+    Returns:
+        Tuple[int, List[Tuple[int, str]]]: Toplam süre (µs) ve en pahalı üst seviye modüller
+    """
+    top_level: List[Tuple[int, str]] = []
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative_us, name = line.split('|')
+        # Satır biçimi: "import time: self | cumulative | <girinti>modül"; girintisiz
+        # isimler doğrudan içe aktarılan üst seviye modüllerdir
+        if not name[1:].startswith(' '):
+            top_level.append((int(cumulative_us), name.strip()))
+    total = sum(us for us, _ in top_level)
+    return total, sorted(top_level, reverse=True)[:10]
+
+
+def run_once(corpus: str, output: str, eager: bool) -> Dict[str, object]:
+    """Tek bir soğuk başlangıcı ölçer"""
+    script = CHILD_SCRIPT.format(eager=eager, heavy=HEAVY_MODULES, output=output, corpus=corpus)
+    env = dict(os.environ, PYTHONPATH=SRC_DIR)
+    start = time.perf_counter()
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', script],
+                            env=env, capture_output=True, text=True, check=True)
+    wall = time.perf_counter() - start
+    import_us, top = parse_importtime(result.stderr)
+    report = json.loads(result.stdout.strip().splitlines()[-1])
+    return {
+        'wall_s': wall,
+        'import_s': import_us / 1e6,
+        # Linux'ta ru_maxrss KB cinsindendir
+        'peak_rss_mb': report['peak_rss_kb'] / 1024,
+        'heavy_loaded': report['heavy_loaded'],
+        'top_imports': [(name, us / 1000) for us, name in top],
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Soğuk başlangıç benchmark'ı")
+    parser.add_argument('--files', type=int, default=200, help="Üretilecek .txt dosyası sayısı")
+    parser.add_argument('--runs', type=int, default=5, help="Ölçüm tekrar sayısı (en iyisi raporlanır)")
+    parser.add_argument('--eager', action='store_true',
+                        help="Tüm extractor kütüphanelerini açılışta içe aktar (eski davranış)")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as workdir:
+        corpus = os.path.join(workdir, 'corpus')
+        os.makedirs(corpus)
+        make_corpus(corpus, args.files)
+        output = os.path.join(workdir, 'out.txt')
+
+        runs = [run_once(corpus, output, args.eager) for _ in range(args.runs)]
+
+    best = min(runs, key=lambda run: run['wall_s'])
+    mode = 'eager' if args.eager else 'lazy'
+    print(f"Mod: {mode}, {args.files} metin dosyası, {args.runs} çalışma (en iyisi)")
+    print(f"  Duvar saati:      {best['wall_s'] * 1000:8.1f} ms")
+    print(f"  İçe aktarma:      {best['import_s'] * 1000:8.1f} ms")
+    print(f"  En yüksek RSS:    {best['peak_rss_mb']:8.1f} MB")
+    print(f"  Yüklenen ağır kütüphaneler: {', '.join(best['heavy_loaded']) or '-'}")
+    print("  En pahalı içe aktarmalar:")
+    for name, ms in best['top_imports']:
+        print(f"    {ms:8.1f} ms  {name}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,339 @@
+"""
+Benchmark'lar için belirlenimci sentetik derlem üreticisi
+
+Aynı tohum (seed) ve ölçekle her seferinde aynı içerikli dosyaları üretir:
+farklı kodlamalarda metin dosyaları, kaynak kodu, büyük CSV'ler, DOCX/XLSX/PPTX/ODT
+belgeleri, çok sayfalı PDF'ler, binary dosyalar ve derin dizin ağaçları. Ağ
+erişimi gerekmez; PDF'ler kütüphanesiz, Office belgeleri requirements.txt'deki
+kütüphanelerle yazılır.
+
+Derlemin kökündeki corpus.json üretim ayarlarını ve dosya listesinin parmak
+izini tutar; ayarlar aynıysa derlem yeniden üretilmez.
+
+Kullanım:
+    python benchmarks/corpus.py /tmp/corpus --scale 1 --seed 0
+"""
+import argparse
+import csv
+import datetime
+import hashlib
+import json
+import os
+import random
+import shutil
+from typing import Any, Callable, Dict, List
+
+# Üretim mantığı değiştiğinde artırılır (eski derlemler yeniden üretilir)
+CORPUS_VERSION = 1
+MANIFEST_NAME = 'corpus.json'
+# Boyutu kaydedildiği ana göre değişebilen belgeler (parmak izine yalnızca yolları katılır)
+OFFICE_EXTENSIONS = {'.docx', '.xlsx', '.pptx', '.odt'}
+
+# Office belgelerinin üst verilerine yazılan sabit tarih (çıktı çalışmadan çalışmaya değişmesin)
+FIXED_DATE = datetime.datetime(2024, 1, 1)
+
+TURKISH_WORDS = ['çalışma', 'dosya', 'içerik', 'ağaç', 'şehir', 'güneş', 'ışık', 'öğrenci',
+                 'değer', 'kitap', 'masa', 'yol', 'zaman', 'çözüm', 'örnek', 'üretim']
+LATIN_WORDS = ['café', 'naïve', 'über', 'garçon', 'señor', 'façade', 'lorem', 'ipsum',
+               'dolor', 'sit', 'amet', 'élan', 'crème', 'brûlée', 'año', 'résumé']
+ASCII_WORDS = ['lorem', 'ipsum', 'dolor', 'sit', 'amet', 'consectetur', 'adipiscing', 'elit',
+               'sed', 'do', 'eiusmod', 'tempor', 'incididunt', 'ut', 'labore', 'magna']
+
+# (kodlama, kelime listesi) çiftleri; metin dosyaları sırayla bunlara dağıtılır
+TEXT_ENCODINGS = [
+    ('utf-8', TURKISH_WORDS),
+    ('utf-8', ASCII_WORDS),
+    ('utf-8-sig', TURKISH_WORDS),
+    ('utf-16', TURKISH_WORDS),
+    ('cp1254', TURKISH_WORDS),
+    ('latin-1', LATIN_WORDS),
+]
+
+CODE_TEMPLATES = {
+    '.py': "def function_{i}(value):\n    \"\"\"{words}\"\"\"\n    return value * {i}\n\n",
+    '.js': "function handler{i}(event) {{\n  // {words}\n  return event.value + {i};\n}}\n\n",
+    '.md': "## Bölüm {i}\n\n{words}\n\n",
+}
+
+
+def sentence(rng: random.Random, words: List[str], count: int) -> str:
+    """Kelime listesinden rastgele bir cümle üretir"""
+    return ' '.join(rng.choice(words) for _ in range(count))
+
+
+def make_text_files(root: str, rng: random.Random, count: int) -> None:
+    """Farklı kodlamalarda, 1 KB ile 64 KB arasında metin dosyaları üretir"""
+    for i in range(count):
+        encoding, words = TEXT_ENCODINGS[i % len(TEXT_ENCODINGS)]
+        lines = rng.randint(10, 640)
+        text = '\n'.join(sentence(rng, words, 12) for _ in range(lines)) + '\n'
+        path = os.path.join(root, 'text', encoding, f"note_{i:05d}.txt")
+        with open(path, 'w', encoding=encoding, newline='') as f:
+            f.write(text)
+
+
+def make_code_files(root: str, rng: random.Random, count: int) -> None:
+    """Kaynak kodu ve Markdown dosyaları üretir"""
+    extensions = sorted(CODE_TEMPLATES)
+    for i in range(count):
+        ext = extensions[i % len(extensions)]
+        body = ''.join(CODE_TEMPLATES[ext].format(i=j, words=sentence(rng, ASCII_WORDS, 8))
+                       for j in range(rng.randint(5, 200)))
+        with open(os.path.join(root, 'code', f"module_{i:05d}{ext}"), 'w', encoding='utf-8') as f:
+            f.write(body)
+
+
+def make_csv_files(root: str, rng: random.Random, count: int, rows: int) -> None:
+    """Sayısal ve metin sütunlu büyük CSV dosyaları üretir"""
+    for i in range(count):
+        with open(os.path.join(root, 'csv', f"table_{i:03d}.csv"), 'w', encoding='utf-8', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(['id', 'name', 'city', 'amount', 'ratio', 'note'])
+            for row in range(rows):
+                writer.writerow([row, rng.choice(TURKISH_WORDS), rng.choice(TURKISH_WORDS),
+                                 rng.randint(0, 10 ** 6), f"{rng.random():.6f}",
+                                 sentence(rng, ASCII_WORDS, 6)])
+
+
+def make_docx_files(root: str, rng: random.Random, count: int, paragraphs: int) -> None:
+    """Paragraf, kalın run ve tablo içeren DOCX belgeleri üretir"""
+    import docx
+    for i in range(count):
+        document = docx.Document()
+        document.core_properties.created = FIXED_DATE
+        document.core_properties.modified = FIXED_DATE
+        for j in range(paragraphs):
+            paragraph = document.add_paragraph(f"Paragraf {j}: ")
+            paragraph.add_run(sentence(rng, TURKISH_WORDS, 4)).bold = True
+            paragraph.add_run(' ' + sentence(rng, ASCII_WORDS, 20))
+            if j % 100 == 0:
+                table = document.add_table(rows=3, cols=3)
+                table.cell(0, 0).text = sentence(rng, TURKISH_WORDS, 2)
+        document.save(os.path.join(root, 'office', f"report_{i:03d}.docx"))
+
+
+def make_xlsx_files(root: str, rng: random.Random, count: int, rows: int) -> None:
+    """Birden fazla sayfalı XLSX çalışma kitapları üretir"""
+    import openpyxl
+    for i in range(count):
+        workbook = openpyxl.Workbook()
+        workbook.properties.created = FIXED_DATE
+        workbook.properties.modified = FIXED_DATE
+        for sheet_index in range(2):
+            sheet = workbook.active if sheet_index == 0 else workbook.create_sheet()
+            sheet.title = f"Sayfa{sheet_index + 1}"
+            for row in range(rows):
+                sheet.append([row, rng.choice(TURKISH_WORDS), rng.randint(0, 10 ** 6),
+                              rng.random(), sentence(rng, ASCII_WORDS, 5)])
+        workbook.save(os.path.join(root, 'office', f"sheet_{i:03d}.xlsx"))
+
+
+def make_pptx_files(root: str, rng: random.Random, count: int, slides: int) -> None:
+    """Başlık ve madde listeli slaytlardan oluşan PPTX sunumları üretir"""
+    import pptx
+    for i in range(count):
+        presentation = pptx.Presentation()
+        presentation.core_properties.created = FIXED_DATE
+        presentation.core_properties.modified = FIXED_DATE
+        for j in range(slides):
+            slide = presentation.slides.add_slide(presentation.slide_layouts[1])
+            slide.shapes.title.text = f"Slayt {j}: {rng.choice(TURKISH_WORDS)}"
+            slide.placeholders[1].text = '\n'.join(sentence(rng, ASCII_WORDS, 6) for _ in range(5))
+        presentation.save(os.path.join(root, 'office', f"slides_{i:03d}.pptx"))
+
+
+def make_odt_files(root: str, rng: random.Random, count: int, paragraphs: int) -> None:
+    """Başlık ve paragraflardan oluşan ODT belgeleri üretir"""
+    from odf import text
+    from odf.opendocument import OpenDocumentText
+    for i in range(count):
+        document = OpenDocumentText()
+        for j in range(paragraphs):
+            if j % 50 == 0:
+                document.text.addElement(text.H(outlinelevel=1, text=f"Bölüm {j}"))
+            paragraph = text.P(text=sentence(rng, TURKISH_WORDS, 6) + ' ')
+            paragraph.addElement(text.Span(text=sentence(rng, ASCII_WORDS, 12)))
+            document.text.addElement(paragraph)
+        document.save(os.path.join(root, 'office', f"document_{i:03d}.odt"))
+
+
+def make_pdf_files(root: str, rng: random.Random, count: int, pages: int) -> None:
+    """Her sayfasında birkaç metin satırı olan çok sayfalı PDF'ler üretir (kütüphanesiz)"""
+    for i in range(count):
+        page_lines = [[sentence(rng, ASCII_WORDS, 8) for _ in range(20)] for _ in range(pages)]
+        with open(os.path.join(root, 'pdf', f"paper_{i:03d}.pdf"), 'wb') as f:
+            f.write(build_pdf(page_lines))
+
+
+def build_pdf(page_lines: List[List[str]]) -> bytes:
+    """
+    Verilen satırları Helvetica ile yazan en küçük geçerli PDF'i oluşturur
+
+    Args:
+        page_lines (List[List[str]]): Sayfa başına ASCII metin satırları
+
+    Returns:
+        bytes: PDF içeriği
+    """
+    pages = len(page_lines)
+    font_id = 3 + 2 * pages
+    kids = ' '.join(f"{3 + 2 * i} 0 R" for i in range(pages))
+    objects = [b'<</Type/Catalog/Pages 2 0 R>>',
+               f"<</Type/Pages/Kids[{kids}]/Count {pages}>>".encode()]
+    for i, lines in enumerate(page_lines):
+        commands = ['BT /F1 10 Tf 40 800 Td 12 TL']
+        commands += [f"({line}) '" for line in lines]
+        commands.append('ET')
+        stream = '\n'.join(commands).encode('ascii')
+        objects.append(f"<</Type/Page/Parent 2 0 R/MediaBox[0 0 595 842]/Contents {4 + 2 * i} 0 R"
+                       f"/Resources<</Font<</F1 {font_id} 0 R>>>>>>".encode())
+        objects.append(b'<</Length %d>>stream\n' % len(stream) + stream + b'\nendstream')
+    objects.append(b'<</Type/Font/Subtype/Type1/BaseFont/Helvetica>>')
+
+    out = bytearray(b'%PDF-1.4\n')
+    offsets = []
+    for number, body in enumerate(objects, 1):
+        offsets.append(len(out))
+        out += b'%d 0 obj\n' % number + body + b'\nendobj\n'
+    xref = len(out)
+    out += b'xref\n0 %d\n0000000000 65535 f \n' % (len(objects) + 1)
+    for offset in offsets:
+        out += b'%010d 00000 n \n' % offset
+    out += b'trailer<</Size %d/Root 1 0 R>>\nstartxref\n%d\n%%%%EOF\n' % (len(objects) + 1, xref)
+    return bytes(out)
+
+
+def make_binary_files(root: str, rng: random.Random, count: int) -> None:
+    """Desteklenmeyen binary dosyalar ve binary içerikli .txt dosyaları üretir"""
+    for i in range(count):
+        data = bytes(rng.getrandbits(8) for _ in range(rng.randint(1024, 65536)))
+        name = f"blob_{i:04d}.txt" if i % 4 == 0 else f"blob_{i:04d}.bin"
+        with open(os.path.join(root, 'binary', name), 'wb') as f:
+            f.write(data)
+
+
+def make_deep_tree(root: str, rng: random.Random, branches: int, depth: int) -> None:
+    """Her seviyesinde küçük dosyalar bulunan derin bir dizin ağacı ve budanacak dizinler üretir"""
+    for branch in range(branches):
+        path = os.path.join(root, 'deep', f"branch_{branch:02d}")
+        for level in range(depth):
+            path = os.path.join(path, f"level_{level:02d}")
+            os.makedirs(path, exist_ok=True)
+            with open(os.path.join(path, 'readme.md'), 'w', encoding='utf-8') as f:
+                f.write(sentence(rng, TURKISH_WORDS, 30) + '\n')
+            with open(os.path.join(path, 'config.json'), 'w', encoding='utf-8') as f:
+                json.dump({'level': level, 'name': rng.choice(ASCII_WORDS)}, f)
+    # Tarayıcının içine girmemesi gereken dizinler
+    for pruned in ('node_modules', '.git'):
+        path = os.path.join(root, 'deep', pruned, 'pkg')
+        os.makedirs(path, exist_ok=True)
+        for i in range(20):
+            with open(os.path.join(path, f"index_{i}.js"), 'w', encoding='utf-8') as f:
+                f.write('module.exports = {};\n' * 50)
+
+
+def plan(scale: float) -> Dict[str, Callable[[str, random.Random], None]]:
+    """
+    Ölçeğe göre üretilecek dosya türlerini ve üreticilerini döndürür
+
+    Args:
+        scale (float): Dosya sayılarının çarpanı (1 yaklaşık 60 MB'lık derlem üretir)
+
+    Returns:
+        Dict[str, Callable[[str, random.Random], None]]: Alt dizin ve üretici
+    """
+    def n(count: int) -> int:
+        return max(1, int(round(count * scale)))
+
+    return {
+        'text': lambda root, rng: make_text_files(root, rng, n(300)),
+        'code': lambda root, rng: make_code_files(root, rng, n(150)),
+        'csv': lambda root, rng: make_csv_files(root, rng, n(4), rows=40000),
+        'office': lambda root, rng: (make_docx_files(root, rng, n(8), paragraphs=400),
+                                     make_xlsx_files(root, rng, n(4), rows=2000),
+                                     make_pptx_files(root, rng, n(4), slides=40),
+                                     make_odt_files(root, rng, n(4), paragraphs=400)),
+        'pdf': lambda root, rng: make_pdf_files(root, rng, n(6), pages=40),
+        'binary': lambda root, rng: make_binary_files(root, rng, n(40)),
+        'deep': lambda root, rng: make_deep_tree(root, rng, n(4), depth=15),
+    }
+
+
+def fingerprint(root: str) -> Dict[str, Any]:
+    """
+    Derlemdeki dosyaların sayısını, toplam boyutunu ve yol/boyut parmak izini döndürür
+
+    İçerik değil yol ve boyut hash'lenir. Office kütüphaneleri kaydederken
+    üst verilere o anki zamanı yazabildiğinden (sıkıştırılmış boyut bir iki bayt
+    oynar) Office belgelerinde yalnızca yol hash'lenir.
+    """
+    digest = hashlib.sha1()
+    files = 0
+    total = 0
+    for directory, dirs, names in os.walk(root):
+        dirs.sort()
+        for name in sorted(names):
+            if directory == root and name == MANIFEST_NAME:
+                continue
+            path = os.path.join(directory, name)
+            size = os.path.getsize(path)
+            key = os.path.relpath(path, root)
+            if os.path.splitext(name)[1] not in OFFICE_EXTENSIONS:
+                key = f"{key}\0{size}"
+            digest.update(f"{key}\n".encode('utf-8'))
+            files += 1
+            total += size
+    return {'files': files, 'bytes': total, 'fingerprint': digest.hexdigest()}
+
+
+def generate_corpus(root: str, scale: float = 1.0, seed: int = 0, force: bool = False) -> Dict[str, Any]:
+    """
+    Derlemi üretir; aynı ayarlarla üretilmiş bir derlem varsa olduğu gibi kullanır
+
+    Args:
+        root (str): Derlemin kök dizini (yeniden üretilirken içeriği silinir)
+        scale (float): Dosya sayılarının çarpanı
+        seed (int): Rastgele üretecin tohumu
+        force (bool): Var olan derlemi yok sayıp yeniden üret
+
+    Returns:
+        Dict[str, Any]: corpus.json içeriği (ayarlar, dosya sayısı, boyut, parmak izi)
+    """
+    settings = {'version': CORPUS_VERSION, 'scale': scale, 'seed': seed}
+    manifest_path = os.path.join(root, MANIFEST_NAME)
+    if not force and os.path.exists(manifest_path):
+        with open(manifest_path, 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+        if all(manifest.get(key) == value for key, value in settings.items()):
+            return manifest
+
+    if os.path.exists(root):
+        shutil.rmtree(root)
+    for encoding, _ in TEXT_ENCODINGS:
+        os.makedirs(os.path.join(root, 'text', encoding), exist_ok=True)
+    for kind, make in plan(scale).items():
+        os.makedirs(os.path.join(root, kind), exist_ok=True)
+        # Her tür kendi üretecini kullanır; bir türün boyutu değişse de diğerleri aynı kalır
+        make(root, random.Random(f"{seed}:{kind}"))
+
+    manifest = dict(settings, **fingerprint(root))
+    with open(manifest_path, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2)
+    return manifest
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark derlemi üretici")
+    parser.add_argument('root', help="Derlemin üretileceği dizin")
+    parser.add_argument('--scale', type=float, default=1.0, help="Dosya sayılarının çarpanı")
+    parser.add_argument('--seed', type=int, default=0, help="Rastgele üretecin tohumu")
+    parser.add_argument('--force', action='store_true', help="Var olan derlemi yeniden üret")
+    args = parser.parse_args()
+
+    manifest = generate_corpus(args.root, args.scale, args.seed, args.force)
+    print(f"{manifest['files']} dosya, {manifest['bytes'] / (1024 * 1024):.1f} MB "
+          f"(parmak izi {manifest['fingerprint'][:12]})")
+
+
+if __name__ == '__main__':
+    main()
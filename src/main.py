@@ -1,31 +1,94 @@
+import argparse
+import signal
+import sys
+from typing import List, Optional
 from processor.file_processor import FileProcessor
 import logging
 
 logger = logging.getLogger(__name__)
 
-def main():
+
+def read_manifest(manifest: str) -> List[str]:
     """
-    Ana program fonksiyonu
+    Yol listesi dosyasını okur ('-' ise standart girdi)
+
+    Her satırda bir dosya veya dizin yolu bulunur; boş satırlar ve # ile
+    başlayan satırlar atlanır.
+
+    Args:
+        manifest (str): Liste dosyasının yolu veya '-'
+
+    Returns:
+        List[str]: Yollar (dosyadaki sırayla)
+    """
+    if manifest == '-':
+        lines = sys.stdin.read().splitlines()
+    else:
+        with open(manifest, 'r', encoding='utf-8') as f:
+            lines = f.read().splitlines()
+    return [line.strip() for line in lines if line.strip() and not line.lstrip().startswith('#')]
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Komut satırı argümanlarını tanımlar"""
+    parser = argparse.ArgumentParser(
+        description="Dosya ve dizinlerin içeriğini tek bir çıktıda birleştirir. "
+                    "Argümansız çalıştırılırsa yol ve ayarlar etkileşimli olarak sorulur.")
+    parser.add_argument('paths', nargs='*', help="İşlenecek dosya ve dizin yolları")
+    parser.add_argument('-m', '--manifest',
+                        help="Her satırında bir yol bulunan liste dosyası ('-' ise standart girdi)")
+    parser.add_argument('-o', '--output', default='content.txt', help="Çıktı dosyası [varsayılan: content.txt]")
+    parser.add_argument('-f', '--format', choices=sorted(FileProcessor.OUTPUT_WRITERS), default='text',
+                        help="Çıktı biçimi [varsayılan: text]")
+    parser.add_argument('-w', '--workers', type=int, default=1, help="Paralel süreç sayısı [varsayılan: 1]")
+    parser.add_argument('--max-file-size-mb', type=float, default=5.0,
+                        help="İşlenecek en büyük dosya boyutu (MB) [varsayılan: 5.0]")
+    parser.add_argument('--compression', choices=['gzip', 'zstd'], help="Çıktıyı akış halinde sıkıştır")
+    parser.add_argument('--compression-level', type=int, help="Sıkıştırma seviyesi")
+    parser.add_argument('--shard-size-mb', type=float, help="Çıktıyı bu boyutta parçalara böl (MB)")
+    parser.add_argument('--include', action='append', help="Yalnızca bu gitignore kalıbına uyan dosyalar")
+    parser.add_argument('--exclude', action='append', help="Atlanacak gitignore kalıbı")
+    parser.add_argument('--exclude-file', help=".gitignore biçimli hariç tutma dosyası")
+    parser.add_argument('--archives', action='store_true', help="Arşivlerin içindeki dosyaları da işle")
+    parser.add_argument('--dedup', action='store_true', help="Aynı içerikli dosyaları bir kez çıkar")
+    parser.add_argument('--incremental', action='store_true',
+                        help="Çıktıyı yalnızca değişen dosyalar için güncelle (tek yol, 'text' biçimi)")
+    parser.add_argument('--cache-file', help="Çıkarım önbelleği (SQLite)")
+    parser.add_argument('--file-timeout', type=float, help="Dosya başına çıkarım süresi sınırı (saniye)")
+    parser.add_argument('--file-memory-limit-mb', type=float, help="Dosya başına bellek sınırı (MB)")
+    parser.add_argument('--quarantine-file', help="Sınırı aşan dosyaların kaydedileceği JSON dosyası")
+    parser.add_argument('--metrics-file', help="Ölçüm raporunun yazılacağı JSON dosyası")
+    parser.add_argument('--prometheus-file', help="Prometheus metin biçimindeki ölçüm dosyası")
+    parser.add_argument('--checkpoint', help="İlerlemenin kaydedileceği dosya; yarıda kalan çalışma "
+                                             "aynı argümanlarla yeniden başlatılınca kaldığı yerden devam eder")
+    parser.add_argument('--checkpoint-interval', type=float, default=60.0,
+                        help="Kontrol noktaları arasındaki süre (saniye) [varsayılan: 60]")
+    return parser
+
+
+def interactive() -> None:
+    """
+    Yol ve ayarları kullanıcıdan sorarak çalışır
     """
     print("Dosya İçerik Birleştirici")
     print("-" * 30)
-    
+
     try:
         # Kullanıcıdan girdi al
         path = input("Dosya veya klasör yolu giriniz: ").strip()
-        
+
         if not path:
             print("Yol belirtilmedi!")
             return
-            
+
         # Maksimum dosya boyutunu iste (opsiyonel)
         max_size = input("Maksimum dosya boyutu (MB) [varsayılan: 5.0]: ").strip()
         max_size = float(max_size) if max_size else 5.0
-        
+
         # Çıktı dosyası adını iste (opsiyonel)
         output_file = input("Çıktı dosyası adı [varsayılan: content.txt]: ").strip()
         output_file = output_file if output_file else "content.txt"
-        
+
         # İşlemciyi başlat ve çalıştır
         processor = FileProcessor(max_file_size_mb=max_size, output_file=output_file)
         processor.process(path)
@@ -37,5 +100,55 @@ def main():
     except Exception as e:
         print(f"Beklenmeyen bir hata oluştu: {str(e)}")
 
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Ana program fonksiyonu
+
+    Args:
+        argv (Optional[List[str]]): Komut satırı argümanları (None ise sys.argv)
+
+    Returns:
+        int: Çıkış kodu (0 başarılı, 1 hata, 2 geçersiz argüman, 130 kesildi)
+    """
+    argv = sys.argv[1:] if argv is None else argv
+    if not argv:
+        interactive()
+        return 0
+
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    paths = list(args.paths)
+    if args.manifest:
+        try:
+            paths.extend(read_manifest(args.manifest))
+        except OSError as e:
+            parser.error(f"Liste dosyası okunamadı: {str(e)}")
+    if not paths:
+        parser.error("En az bir yol veya --manifest gerekli")
+
+    try:
+        processor = FileProcessor(
+            max_file_size_mb=args.max_file_size_mb, output_file=args.output, workers=args.workers,
+            output_format=args.format, output_compression=args.compression,
+            output_compression_level=args.compression_level, shard_size_mb=args.shard_size_mb,
+            include=args.include, exclude=args.exclude, exclude_file=args.exclude_file,
+            archives=args.archives, dedup=args.dedup, incremental=args.incremental,
+            cache_file=args.cache_file, file_timeout=args.file_timeout,
+            file_memory_limit_mb=args.file_memory_limit_mb, quarantine_file=args.quarantine_file,
+            metrics_file=args.metrics_file, prometheus_file=args.prometheus_file,
+            checkpoint_file=args.checkpoint, checkpoint_interval=args.checkpoint_interval)
+    except ValueError as e:
+        parser.error(str(e))
+
+    # SIGTERM'de de yazıcı düzgün kapanır ve ölçümler yazılır
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(128 + signum))
+    try:
+        return 0 if processor.process_paths(paths) else 1
+    except KeyboardInterrupt:
+        print("\nProgram kullanıcı tarafından sonlandırıldı.")
+        return 130
+
+
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    sys.exit(main())
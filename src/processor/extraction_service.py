@@ -0,0 +1,579 @@
+import inspect
+import itertools
+import json
+import multiprocessing
+import os
+import queue
+import signal
+import socketserver
+import threading
+import time
+from collections import OrderedDict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from multiprocessing.connection import Connection
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+from .file_processor import FileProcessor
+from .utils.metrics import PipelineMetrics
+from .writers.stream_writer import StreamWriter
+from .utils.logger import logger
+
+# Worker süreci mesajları: ('data', bayt) yanıt parçası, ('done', özet) işin sonu
+WorkerMessage = Tuple[str, Any]
+
+
+class ServiceBusyError(Exception):
+    """Boş worker ve bekleme kuyruğunda yer olmadığında fırlatılır"""
+
+
+class _ConnectionStream:
+    """Yazılan metni biriktirip flush edildiğinde (veya tampon dolduğunda) bağlantıya gönderir"""
+
+    # Tek mesajda gönderilecek en fazla metin (karakter); büyük kayıtlar parça parça gider
+    CHUNK_SIZE: int = 64 * 1024
+
+    def __init__(self, conn: Connection):
+        """
+        _ConnectionStream sınıfının başlatıcısı
+
+        Args:
+            conn (Connection): Ana süreçle bağlantı
+        """
+        self.conn = conn
+        self._parts: List[str] = []
+        self._size = 0
+
+    def write(self, text: str) -> int:
+        """Metni tampona ekler, tampon dolduysa gönderir"""
+        self._parts.append(text)
+        self._size += len(text)
+        if self._size >= self.CHUNK_SIZE:
+            self.flush()
+        return len(text)
+
+    def flush(self) -> None:
+        """Tampondaki metni gönderir"""
+        if self._parts:
+            self.conn.send(('data', ''.join(self._parts).encode('utf-8')))
+            self._parts = []
+            self._size = 0
+
+
+def _run_service_worker(conn: Connection, max_processors: int) -> None:
+    """
+    Servis worker sürecinde işleri alır, sonuçları bağlantı üzerinden akıtır
+
+    Aynı ayarlarla gelen işler için oluşturulan FileProcessor (ve yüklediği
+    extractor'lar) saklanır; en fazla max_processors farklı ayar tutulur.
+
+    Args:
+        conn (Connection): Ana süreçle bağlantı; iş sözlüğü alır, None alındığında döngü biter
+        max_processors (int): Sıcak tutulacak en fazla işlemci sayısı
+    """
+    # Kapanış ana süreçten yönetilir, Ctrl+C worker'ları ayrıca kesmesin
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    processors: "OrderedDict[str, FileProcessor]" = OrderedDict()
+    while True:
+        try:
+            job = conn.recv()
+        except (EOFError, OSError):
+            break
+        if job is None:
+            break
+        if job == 'cancel':
+            # İş iptal mesajı ulaşmadan bitmişti
+            continue
+        start = time.perf_counter()
+        summary: Dict[str, Any] = {}
+        processor: Optional[FileProcessor] = None
+        try:
+            processor = _get_processor(processors, job['options'], max_processors)
+            processor.reset()
+            if job.get('output'):
+                processor.process(job['path'])
+            else:
+                summary['cancelled'] = _stream_job(conn, processor, job['path'])
+        except Exception as e:
+            summary['error'] = str(e)
+        if processor is not None:
+            summary['files'] = len(processor.processed_files)
+            summary['failed'] = dict(processor.error_files)
+            summary['metrics'] = processor.metrics.take()
+        summary['seconds'] = round(time.perf_counter() - start, 6)
+        try:
+            conn.send(('done', summary))
+        except (EOFError, OSError):
+            break
+
+    for processor in processors.values():
+        if processor.supervisor:
+            processor.supervisor.close()
+
+
+def _get_processor(processors: "OrderedDict[str, FileProcessor]", options: Dict[str, Any],
+                   max_processors: int) -> FileProcessor:
+    """Ayarlara ait sıcak işlemciyi döndürür, yoksa oluşturur (en eski kullanılanı çıkarır)"""
+    key = json.dumps(options, sort_keys=True)
+    processor = processors.pop(key, None)
+    if processor is None:
+        processor = FileProcessor(**options)
+        while len(processors) >= max_processors:
+            _, evicted = processors.popitem(last=False)
+            if evicted.supervisor:
+                evicted.supervisor.close()
+    processors[key] = processor
+    return processor
+
+
+def _stream_job(conn: Connection, processor: FileProcessor, path: str) -> bool:
+    """
+    Yoldaki dosyaları işler, her dosyanın sonucunu JSON satırı olarak akıtır
+
+    Her dosyadan sonra ana süreçten iptal mesajı gelip gelmediğine bakılır.
+    İşlemci sıcak tutulsa da önbellek bağlantısı her işin sonunda kapatılır;
+    boşta bekleyen worker önbellek dosyasını diğer worker'lara kilitlemez.
+
+    Returns:
+        bool: İş iptal edildiyse True
+    """
+    stream = _ConnectionStream(conn)
+    try:
+        with StreamWriter(stream) as writer:
+            for file_path, content in processor.iter_path(path):
+                if content:
+                    writer.write_record(content)
+                elif file_path in processor.error_files:
+                    stream.write(json.dumps({'path': file_path, 'error': processor.error_files[file_path]},
+                                            ensure_ascii=False) + '\n')
+                # Küçük dosyaların sonucu beklemeden istemciye ulaşsın
+                stream.flush()
+                if conn.poll():
+                    conn.recv()
+                    return True
+        return False
+    finally:
+        if processor.cache:
+            processor.cache.close()
+
+
+class _ServiceWorker:
+    """Servis worker sürecini ve bağlantısını tutar"""
+
+    def __init__(self, context: Any, max_processors: int):
+        """
+        _ServiceWorker sınıfının başlatıcısı
+
+        Args:
+            context (Any): multiprocessing bağlamı
+            max_processors (int): Worker'da sıcak tutulacak en fazla işlemci sayısı
+        """
+        self.context = context
+        self.max_processors = max_processors
+        self.process: Optional[multiprocessing.Process] = None
+        self.conn: Optional[Connection] = None
+
+    def start(self) -> None:
+        """Worker sürecini başlatır"""
+        parent_conn, child_conn = self.context.Pipe()
+        self.process = self.context.Process(target=_run_service_worker,
+                                            args=(child_conn, self.max_processors), daemon=True)
+        self.process.start()
+        child_conn.close()
+        self.conn = parent_conn
+
+    def restart(self) -> None:
+        """Worker sürecini öldürüp yenisini başlatır"""
+        self.kill()
+        self.start()
+
+    def kill(self) -> None:
+        """Worker sürecini öldürür"""
+        if self.conn is not None:
+            self.conn.close()
+            self.conn = None
+        if self.process is not None:
+            if self.process.is_alive():
+                self.process.kill()
+            self.process.join()
+            self.process = None
+
+    def close(self) -> None:
+        """Worker sürecini kapatır"""
+        if self.process is not None and self.process.is_alive() and self.conn is not None:
+            try:
+                self.conn.send(None)
+                self.process.join(timeout=2)
+            except OSError:
+                pass
+        self.kill()
+
+
+class ExtractionService:
+    """FileProcessor'ları sıcak tutan worker süreçleri üzerinde çıkarım işleri çalıştırır"""
+
+    # İş ayarlarında verilemeyen FileProcessor argümanları
+    # (paralellik servis worker'larıyla sağlanır, çıktı dosyası 'output' ile verilir)
+    RESERVED_OPTIONS = frozenset({'workers', 'output_file'})
+    # Akış yanıtlarında kullanılamayan, yalnızca dosya çıktısında anlamlı argümanlar
+    OUTPUT_ONLY_OPTIONS = frozenset({'output_format', 'output_compression', 'output_compression_level',
+                                     'shard_size_mb', 'incremental', 'compact_ratio', 'write_buffer_size',
+                                     'metrics_file', 'prometheus_file', 'checkpoint_file',
+                                     'checkpoint_interval'})
+    # İptal edilen işin worker'ı bu süre içinde durmazsa yeniden başlatılır (saniye)
+    CANCEL_TIMEOUT: float = 5.0
+
+    def __init__(self, workers: int = 2, max_pending: int = 16, queue_timeout: float = 30.0,
+                 max_processors: int = 4):
+        """
+        ExtractionService sınıfının başlatıcısı
+
+        Her worker ayrı bir süreçtir ve aynı anda tek iş çalıştırır; aynı
+        ayarlarla gelen işler için FileProcessor ve yüklenmiş extractor'lar
+        worker'da saklanır, böylece yorumlayıcı açılışı ve kütüphane içe aktarma
+        maliyeti yalnızca ilk işte ödenir. Boş worker yoksa en fazla max_pending
+        iş queue_timeout saniye bekler; kuyruk doluysa iş hemen reddedilir
+        (ServiceBusyError). Sonuçlar worker'dan parça parça gelir; istemci yavaş
+        okursa worker da bağlantı tamponu dolunca bekler.
+
+        Args:
+            workers (int): Worker süreci sayısı
+            max_pending (int): Boş worker bekleyebilecek en fazla iş sayısı
+            queue_timeout (float): Bir işin boş worker için en fazla bekleme süresi (saniye)
+            max_processors (int): Worker başına sıcak tutulacak farklı ayar sayısı
+        """
+        if workers < 1:
+            raise ValueError("workers en az 1 olmalıdır")
+        self.workers = workers
+        self.max_pending = max_pending
+        self.queue_timeout = queue_timeout
+        self.max_processors = max_processors
+        # Worker'lar ana sürecin iş parçacıklarını (HTTP sunucusu) kopyalamasın diye spawn ile başlatılır
+        self._context = multiprocessing.get_context('spawn')
+        self._workers: List[_ServiceWorker] = []
+        self._idle: "queue.Queue[_ServiceWorker]" = queue.Queue()
+        self._slots = threading.BoundedSemaphore(workers + max_pending)
+        self._lock = threading.Lock()
+        self._allowed_options = set(inspect.signature(FileProcessor.__init__).parameters) - {'self'}
+        self.metrics = PipelineMetrics()
+        self.started = time.time()
+        self.active = 0
+        self.jobs = 0
+        self.rejected = 0
+        self.failed = 0
+
+    def start(self) -> None:
+        """Worker süreçlerini başlatır"""
+        for _ in range(self.workers):
+            worker = _ServiceWorker(self._context, self.max_processors)
+            worker.start()
+            self._workers.append(worker)
+            self._idle.put(worker)
+        logger.info(f"Çıkarım servisi {self.workers} worker ile başlatıldı.")
+
+    def close(self) -> None:
+        """Worker süreçlerini kapatır"""
+        for worker in self._workers:
+            worker.close()
+        self._workers = []
+
+    def validate(self, job: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        İş isteğini doğrular ve worker'a gönderilecek biçime getirir
+
+        İstek: {"path": "...", "options": {...}, "output": "..."}. output verilirse
+        sonuçlar bu dosyaya yazılır ve yanıtta yalnızca özet döner; verilmezse her
+        dosyanın sonucu JSONL satırı olarak yanıtta akıtılır.
+
+        Args:
+            job (Dict[str, Any]): İstemciden gelen iş
+
+        Returns:
+            Dict[str, Any]: path, options ve output alanlı iş
+
+        Raises:
+            ValueError: İstek geçersizse
+        """
+        if not isinstance(job, dict) or not isinstance(job.get('path'), str) or not job['path']:
+            raise ValueError("'path' alanı gerekli")
+        options = job.get('options') or {}
+        if not isinstance(options, dict):
+            raise ValueError("'options' bir nesne olmalıdır")
+        unknown = set(options) - self._allowed_options
+        if unknown:
+            raise ValueError(f"Bilinmeyen ayarlar: {', '.join(sorted(unknown))}")
+        reserved = set(options) & self.RESERVED_OPTIONS
+        if reserved:
+            raise ValueError(f"Servis işlerinde kullanılamayan ayarlar: {', '.join(sorted(reserved))}")
+        output = job.get('output')
+        if output is not None and not isinstance(output, str):
+            raise ValueError("'output' bir dosya yolu olmalıdır")
+        options = dict(options)
+        if output:
+            options['output_file'] = output
+        else:
+            output_only = set(options) & self.OUTPUT_ONLY_OPTIONS
+            if output_only:
+                raise ValueError(f"Yalnızca 'output' ile kullanılabilen ayarlar: {', '.join(sorted(output_only))}")
+            options['output_format'] = 'jsonl'
+        return {'path': job['path'], 'options': options, 'output': output}
+
+    def acquire(self) -> _ServiceWorker:
+        """
+        İş için boş bir worker ayırır; gerekirse queue_timeout kadar bekler
+
+        Returns:
+            _ServiceWorker: Ayrılan worker (run ile kullanılır, run bitince serbest kalır)
+
+        Raises:
+            ServiceBusyError: Bekleme kuyruğu doluysa veya süre içinde worker boşalmadıysa
+        """
+        if not self._slots.acquire(blocking=False):
+            with self._lock:
+                self.rejected += 1
+            raise ServiceBusyError("Servis meşgul, bekleme kuyruğu dolu")
+        try:
+            worker = self._idle.get(timeout=self.queue_timeout)
+        except queue.Empty:
+            self._slots.release()
+            with self._lock:
+                self.rejected += 1
+            raise ServiceBusyError(f"{self.queue_timeout:g} saniye içinde boş worker bulunamadı")
+        with self._lock:
+            self.active += 1
+        return worker
+
+    def run(self, worker: _ServiceWorker, job: Dict[str, Any]) -> Iterator[WorkerMessage]:
+        """
+        İşi ayrılmış worker'da çalıştırır, worker'dan gelen mesajları üretir
+
+        Üretici sonuna kadar tüketilmeden kapatılırsa (istemci bağlantıyı kestiyse)
+        worker'a iptal mesajı gönderilir ve kalan sonuçlar atılır.
+
+        Args:
+            worker (_ServiceWorker): acquire ile ayrılmış worker
+            job (Dict[str, Any]): validate ile doğrulanmış iş
+
+        Returns:
+            Iterator[WorkerMessage]: ('data', bayt) parçaları ve son olarak ('done', özet)
+        """
+        finished = False
+        try:
+            try:
+                worker.conn.send(job)
+                while True:
+                    kind, payload = worker.conn.recv()
+                    if kind == 'done':
+                        finished = True
+                        yield kind, self._record_done(payload)
+                        return
+                    yield kind, payload
+            except (EOFError, OSError):
+                finished = True
+                logger.error(f"Servis worker süreci beklenmedik şekilde sonlandı: {job['path']}")
+                worker.restart()
+                yield 'done', self._record_done({'error': "Worker süreci beklenmedik şekilde sonlandı"})
+        finally:
+            if not finished:
+                self._cancel(worker)
+            with self._lock:
+                self.active -= 1
+            self._idle.put(worker)
+            self._slots.release()
+
+    def _cancel(self, worker: _ServiceWorker) -> None:
+        """Yarıda bırakılan işi durdurur; worker zamanında durmazsa yeniden başlatılır"""
+        deadline = time.monotonic() + self.CANCEL_TIMEOUT
+        try:
+            worker.conn.send('cancel')
+            while time.monotonic() < deadline:
+                if worker.conn.poll(0.1):
+                    kind, payload = worker.conn.recv()
+                    if kind == 'done':
+                        self._record_done(payload)
+                        return
+        except (EOFError, OSError):
+            pass
+        worker.restart()
+
+    def _record_done(self, summary: Dict[str, Any]) -> Dict[str, Any]:
+        """Worker'ın iş özetindeki ölçümleri servis ölçümlerine ekler, istemciye gidecek özeti döndürür"""
+        metrics = summary.pop('metrics', None)
+        with self._lock:
+            self.jobs += 1
+            if summary.get('error'):
+                self.failed += 1
+            if metrics is not None:
+                self.metrics.merge(metrics)
+        return summary
+
+    def health(self) -> Dict[str, Any]:
+        """Servisin durumunu döndürür"""
+        with self._lock:
+            return {
+                'status': 'ok',
+                'workers': self.workers,
+                'active': self.active,
+                'idle': self._idle.qsize(),
+                'jobs': self.jobs,
+                'failed': self.failed,
+                'rejected': self.rejected,
+                'uptime_seconds': round(time.time() - self.started, 3),
+            }
+
+    def prometheus_text(self) -> str:
+        """Servis sayaçlarını ve toplanan çıkarım ölçümlerini Prometheus metin biçiminde döndürür"""
+        health = self.health()
+        lines = []
+        for name, key, kind, help_text in (
+                ('textractor_service_jobs_total', 'jobs', 'counter', 'Tamamlanan iş sayısı.'),
+                ('textractor_service_jobs_failed_total', 'failed', 'counter', 'Hatayla biten iş sayısı.'),
+                ('textractor_service_jobs_rejected_total', 'rejected', 'counter',
+                 'Servis meşgul olduğu için reddedilen iş sayısı.'),
+                ('textractor_service_active_jobs', 'active', 'gauge', 'Çalışmakta olan iş sayısı.')):
+            lines += [f'# HELP {name} {help_text}', f'# TYPE {name} {kind}', f'{name} {health[key]}']
+        with self._lock:
+            return '\n'.join(lines) + '\n' + self.metrics.prometheus_text()
+
+
+class _ServiceHandler(BaseHTTPRequestHandler):
+    """Servisin HTTP uç noktaları: POST /jobs, GET /health, GET /metrics"""
+
+    protocol_version = 'HTTP/1.1'
+    # İstek gövdesinin en büyük boyutu (byte)
+    MAX_BODY_SIZE: int = 1024 * 1024
+
+    @property
+    def service(self) -> ExtractionService:
+        return self.server.service
+
+    def do_GET(self) -> None:
+        if self.path == '/health':
+            self._send_json(200, self.service.health())
+        elif self.path == '/metrics':
+            self._send_body(200, self.service.prometheus_text().encode('utf-8'),
+                            'text/plain; version=0.0.4; charset=utf-8')
+        else:
+            self._send_json(404, {'error': 'Bulunamadı'})
+
+    def do_POST(self) -> None:
+        if self.path != '/jobs':
+            self._send_json(404, {'error': 'Bulunamadı'})
+            return
+        try:
+            length = int(self.headers.get('Content-Length') or 0)
+            if length < 0:
+                raise ValueError
+        except ValueError:
+            # Gövdenin nerede bittiği bilinmiyor, bağlantı yeniden kullanılamaz
+            self.close_connection = True
+            self._send_json(400, {'error': "Geçersiz Content-Length başlığı"})
+            return
+        if length > self.MAX_BODY_SIZE:
+            # Okunmayan gövde sonraki istek sanılmasın
+            self.close_connection = True
+            self._send_json(413, {'error': "İstek gövdesi çok büyük"})
+            return
+        try:
+            job = self.service.validate(json.loads(self.rfile.read(length) or b'null'))
+        except ValueError as e:
+            self._send_json(400, {'error': str(e)})
+            return
+
+        try:
+            worker = self.service.acquire()
+        except ServiceBusyError as e:
+            self._send_json(503, {'error': str(e)}, {'Retry-After': '1'})
+            return
+
+        messages = self.service.run(worker, job)
+        try:
+            # Üretici başlatılmadan kapatılırsa worker serbest kalmaz; ilk mesaj beklenir
+            first = next(messages)
+            self.send_response(200)
+            self.send_header('Content-Type', 'application/x-ndjson; charset=utf-8')
+            self.send_header('Transfer-Encoding', 'chunked')
+            self.end_headers()
+            for kind, payload in itertools.chain([first], messages):
+                if kind == 'data':
+                    self._write_chunk(payload)
+                else:
+                    summary = dict(payload, done=True)
+                    self._write_chunk(json.dumps(summary, ensure_ascii=False).encode('utf-8') + b'\n')
+            self.wfile.write(b'0\r\n\r\n')
+            self.wfile.flush()
+        except (BrokenPipeError, ConnectionResetError):
+            logger.warning(f"İstemci bağlantıyı kapattı, iş iptal edildi: {job['path']}")
+            self.close_connection = True
+        finally:
+            messages.close()
+
+    def _write_chunk(self, data: bytes) -> None:
+        """Yanıta chunked transfer biçiminde bir parça yazar"""
+        self.wfile.write(b'%x\r\n' % len(data) + data + b'\r\n')
+        self.wfile.flush()
+
+    def _send_json(self, status: int, body: Dict[str, Any], headers: Optional[Dict[str, str]] = None) -> None:
+        self._send_body(status, json.dumps(body, ensure_ascii=False).encode('utf-8') + b'\n',
+                        'application/json; charset=utf-8', headers)
+
+    def _send_body(self, status: int, body: bytes, content_type: str,
+                   headers: Optional[Dict[str, str]] = None) -> None:
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def address_string(self) -> str:
+        # Unix soketinde istemci adresi yoktur
+        return self.client_address[0] if isinstance(self.client_address, tuple) else 'unix'
+
+    def log_message(self, format: str, *args: Any) -> None:
+        logger.debug(f"{self.address_string()} - {format % args}")
+
+
+class _UnixHTTPServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """Unix soketi üzerinden HTTP sunan sunucu"""
+
+    daemon_threads = True
+
+
+def serve(service: ExtractionService, socket_path: Optional[str] = None,
+          host: str = '127.0.0.1', port: int = 8750) -> None:
+    """
+    Servisi Unix soketi veya TCP üzerinden HTTP ile sunar; SIGINT/SIGTERM ile kapanır
+
+    Args:
+        service (ExtractionService): Başlatılmamış servis
+        socket_path (Optional[str]): Verilirse bu Unix soketinde dinlenir (host/port yok sayılır)
+        host (str): TCP adresi
+        port (int): TCP portu
+    """
+    if socket_path:
+        if os.path.exists(socket_path):
+            # Önceki çalışmadan kalan soket dosyası
+            os.unlink(socket_path)
+        server = _UnixHTTPServer(socket_path, _ServiceHandler)
+        address = socket_path
+    else:
+        server = ThreadingHTTPServer((host, port), _ServiceHandler)
+        server.daemon_threads = True
+        address = f"http://{host}:{server.server_address[1]}"
+    server.service = service
+
+    def stop(signum: int, frame: Any) -> None:
+        raise KeyboardInterrupt
+
+    signal.signal(signal.SIGTERM, stop)
+    service.start()
+    logger.info(f"Çıkarım servisi dinleniyor: {address}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        logger.info("Çıkarım servisi kapatılıyor.")
+    finally:
+        server.server_close()
+        service.close()
+        if socket_path and os.path.exists(socket_path):
+            os.unlink(socket_path)
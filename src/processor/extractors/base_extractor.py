@@ -1,8 +1,21 @@
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import Iterator, Optional, Set
+from ..utils.file_probe import FileProbe
 
 class BaseExtractor(ABC):
     """Temel extractor sınıfı"""
+
+    # Desteklenen dosya uzantıları (küçük harf, noktalı)
+    SUPPORTED_EXTENSIONS: Set[str] = set()
+    # Uzantısız desteklenen dosya adları (küçük harf, ör. makefile)
+    SUPPORTED_FILENAMES: Set[str] = set()
+    # Uzantısız dosyalarda formatı tanımak için kullanılan dosya imzaları
+    MAGIC_SIGNATURES: Set[bytes] = set()
+
+    # Büyük dosyaları iter_text ile parça parça üretebilen extractor'lar True yapar
+    SUPPORTS_STREAMING: bool = False
+    # İçeriği probe üzerinden okuyan extractor'lar True bırakır (dosyayı kendisi açanlar False)
+    READS_PROBE_DATA: bool = True
     
     @abstractmethod
     def can_handle(self, file_path: str) -> bool:
@@ -10,6 +23,22 @@ class BaseExtractor(ABC):
         pass
         
     @abstractmethod
-    def extract_text(self, file_path: str) -> Optional[str]:
-        """Dosyadan text çıkarır"""
-        pass
\ No newline at end of file
+    def extract_text(self, file_path: str, probe: Optional[FileProbe] = None) -> Optional[str]:
+        """Dosyadan text çıkarır, probe verilirse önceden okunmuş içerik kullanılır"""
+        pass
+
+    @property
+    def last_encoding(self) -> Optional[str]:
+        """Son çıkarımda tespit edilen karakter kodlaması (kodlaması olmayan formatlarda None)"""
+        return None
+
+    @property
+    def last_encoding_seconds(self) -> float:
+        """Son çıkarımda kodlama tespitine harcanan süre (saniye)"""
+        return 0.0
+
+    def iter_text(self, file_path: str, probe: Optional[FileProbe] = None) -> Iterator[str]:
+        """Dosyadan text'i parça parça üretir (varsayılan: extract_text sonucu tek parça)"""
+        content = self.extract_text(file_path, probe)
+        if content:
+            yield content
@@ -0,0 +1,303 @@
+import json
+import math
+import re
+import zipfile
+from typing import Any, BinaryIO, Dict, Iterator, List, Optional, Tuple, Union
+# h5py yalnızca HDF5 dosyası görüldüğünde içe aktarılır
+from ..utils.logger import logger
+
+ModelSource = Union[str, BinaryIO]
+# (katman adı, katman sınıfı, ağırlık şekilleri)
+LayerInfo = Tuple[str, str, List[Tuple[int, ...]]]
+
+
+class KerasModelReader:
+    """Keras model dosyalarının yapısını TensorFlow/Keras yüklemeden okur"""
+
+    # Keras 3 (.keras) paketindeki dosyalar
+    CONFIG_NAME: str = 'config.json'
+    METADATA_NAME: str = 'metadata.json'
+    WEIGHTS_NAME: str = 'model.weights.h5'
+    # Keras dışı HDF5 dosyalarında listelenecek en fazla veri kümesi
+    DEFAULT_MAX_DATASETS: int = 200
+
+    def __init__(self, max_datasets: int = DEFAULT_MAX_DATASETS):
+        """
+        KerasModelReader sınıfının başlatıcısı
+
+        Yalnızca model yapılandırması (JSON) ve HDF5 veri kümelerinin üst
+        verisi (şekil, tür) okunur; ağırlıkların kendisi belleğe alınmaz.
+        .keras paketindeki ağırlık dosyası zip'ten çıkarılmadan okunur.
+
+        Args:
+            max_datasets (int): Keras modeli olmayan HDF5 dosyalarında listelenecek
+                en fazla veri kümesi
+        """
+        self.max_datasets = max_datasets
+
+    def describe(self, ext: str, source: ModelSource) -> List[str]:
+        """
+        Model dosyasının katmanlarını, ağırlık şekillerini ve parametre sayılarını döndürür
+
+        Args:
+            ext (str): Dosya uzantısı ('.keras' veya '.h5')
+            source (ModelSource): Dosya yolu veya okunabilir binary akış
+
+        Returns:
+            List[str]: Özet satırları
+        """
+        if ext == '.keras':
+            return self._describe_keras(source)
+        return self._describe_h5(source)
+
+    @staticmethod
+    def _import_h5py():
+        """h5py'yi içe aktarır"""
+        try:
+            import h5py
+        except ImportError:
+            raise ImportError("HDF5 model dosyaları için h5py gerekli: pip install h5py")
+        return h5py
+
+    def _describe_keras(self, source: ModelSource) -> List[str]:
+        """
+        Keras 3 .keras paketini (config.json, metadata.json, model.weights.h5) özetler
+
+        Args:
+            source (ModelSource): Dosya yolu veya okunabilir binary akış
+
+        Returns:
+            List[str]: Özet satırları
+        """
+        with zipfile.ZipFile(source) as archive:
+            names = set(archive.namelist())
+            config = json.loads(archive.read(self.CONFIG_NAME)) if self.CONFIG_NAME in names else {}
+            metadata = json.loads(archive.read(self.METADATA_NAME)) if self.METADATA_NAME in names else {}
+
+            weights: Dict[str, List[Tuple[int, ...]]] = {}
+            note = None
+            if self.WEIGHTS_NAME in names:
+                try:
+                    h5py = self._import_h5py()
+                except ImportError as e:
+                    # Yapılandırmadaki katman listesi h5py olmadan da yazılabilir
+                    note = f"Ağırlık şekilleri okunmadı ({str(e)})"
+                else:
+                    with archive.open(self.WEIGHTS_NAME) as member, h5py.File(member, 'r') as f:
+                        if 'layers' in f:
+                            weights = {name: self._dataset_shapes(group)
+                                       for name, group in f['layers'].items()}
+            elif any(name.endswith('.weights.npz') for name in names):
+                note = "Ağırlıklar NPZ olarak saklanmış, şekilleri okunmadı"
+
+        layers = self._match_keras3_layers(config, weights)
+        lines = self._model_header(config, metadata.get('keras_version'))
+        lines.extend(self._layer_table(layers, with_weights=note is None))
+        if note:
+            lines.append(note)
+        return lines
+
+    def _describe_h5(self, source: ModelSource) -> List[str]:
+        """
+        HDF5 dosyasını özetler: tf.keras (model_config) modelleri, yalnızca ağırlık
+        dosyaları ve Keras dışı HDF5 dosyaları
+
+        Args:
+            source (ModelSource): Dosya yolu veya okunabilir binary akış
+
+        Returns:
+            List[str]: Özet satırları
+        """
+        h5py = self._import_h5py()
+        with h5py.File(source, 'r') as f:
+            config = self._json_attr(f.attrs.get('model_config'))
+            weights_group = f['model_weights'] if 'model_weights' in f else f
+            layer_names = [self._text(name) for name in weights_group.attrs.get('layer_names', [])]
+            version = f.attrs.get('keras_version')
+            version = self._text(version) if version is not None else None
+
+            if config is None and not layer_names:
+                return self._describe_datasets(f)
+
+            weights = {name: self._dataset_shapes(weights_group[name])
+                       for name in layer_names if name in weights_group}
+            if config is not None:
+                layers = [(name, class_name, weights.pop(name, []))
+                          for name, class_name in self._config_layers(config)]
+                # Yapılandırmada olmayan ağırlık grupları da gösterilir
+                layers.extend((name, '?', shapes) for name, shapes in weights.items())
+            else:
+                layers = [(name, '?', shapes) for name, shapes in weights.items()]
+
+        lines = self._model_header(config, version) if config is not None else \
+            ["Keras ağırlık dosyası (model yapılandırması yok)"]
+        lines.extend(self._layer_table(layers))
+        return lines
+
+    def _describe_datasets(self, f: Any) -> List[str]:
+        """Keras modeli olmayan HDF5 dosyasının veri kümelerini listeler"""
+        import h5py
+        datasets: List[Tuple[str, Any]] = []
+        f.visititems(lambda name, item: datasets.append((name, item))
+                     if isinstance(item, h5py.Dataset) else None)
+        # Boş (null) veri alanlarının şekli None'dır
+        total = sum(math.prod(item.shape) for _, item in datasets if item.shape is not None)
+        lines = [f"HDF5 dosyası: {len(datasets)} veri kümesi, toplam {total} eleman"]
+        for name, item in datasets[:self.max_datasets]:
+            lines.append(f"{name}: şekil {item.shape}, tür {item.dtype}")
+        if len(datasets) > self.max_datasets:
+            lines.append(f"... {len(datasets) - self.max_datasets} veri kümesi daha")
+        return lines
+
+    def _match_keras3_layers(self, config: Dict[str, Any],
+                             weights: Dict[str, List[Tuple[int, ...]]]) -> List[LayerInfo]:
+        """
+        Yapılandırmadaki katmanları model.weights.h5'teki gruplarla eşleştirir
+
+        Keras 3 ağırlık gruplarını katman adıyla değil, sınıf adının snake_case
+        biçimiyle ve aynı sınıfın tekrarlarına _1, _2 ekleyerek adlandırır
+        (layers/dense, layers/dense_1, ...). Grup bulunamazsa katman adı denenir.
+
+        Args:
+            config (Dict[str, Any]): config.json içeriği
+            weights (Dict[str, List[Tuple[int, ...]]]): Grup adı ve ağırlık şekilleri
+
+        Returns:
+            List[LayerInfo]: Katmanlar (yapılandırma sırasıyla, eşleşmeyen gruplar sonda)
+        """
+        weights = dict(weights)
+        used: Dict[str, int] = {}
+        layers: List[LayerInfo] = []
+        for name, class_name in self._config_layers(config):
+            key = self._snake_case(class_name)
+            if key in used:
+                used[key] += 1
+                key = f"{key}_{used[key]}"
+            else:
+                used[key] = 0
+            shapes = weights.pop(key, None)
+            if shapes is None:
+                shapes = weights.pop(name, [])
+            layers.append((name, class_name, shapes))
+        layers.extend((name, '?', shapes) for name, shapes in weights.items())
+        return layers
+
+    @staticmethod
+    def _config_layers(config: Dict[str, Any]) -> Iterator[Tuple[str, str]]:
+        """Model yapılandırmasındaki katmanların (ad, sınıf) çiftlerini sırayla üretir"""
+        model_config = config.get('config') or {}
+        layers = model_config.get('layers') if isinstance(model_config, dict) else model_config
+        for layer in layers or []:
+            layer_config = layer.get('config') or {}
+            yield layer.get('name') or layer_config.get('name', '?'), layer.get('class_name', '?')
+
+    @staticmethod
+    def _snake_case(name: str) -> str:
+        """Sınıf adını Keras'ın kullandığı snake_case biçimine çevirir (Conv2D -> conv2d)"""
+        name = re.sub(r'\W+', '', name)
+        name = re.sub('(.)([A-Z][a-z]+)', r'\1_\2', name)
+        return re.sub('([a-z])([A-Z])', r'\1_\2', name).lower()
+
+    def _dataset_shapes(self, group: Any) -> List[Tuple[int, ...]]:
+        """
+        Grubun altındaki tüm veri kümelerinin şekillerini (veriyi okumadan) döndürür
+
+        tf.keras dosyalarında sıra katmanın weight_names özniteliğinden alınır
+        (kernel, bias, ...); diğerlerinde yollar sayılar sayı olarak karşılaştırılarak
+        sıralanır (Keras 3: vars/0, vars/1, ..., vars/10).
+
+        Args:
+            group (h5py.Group): Katmanın grubu
+
+        Returns:
+            List[Tuple[int, ...]]: Ağırlık şekilleri
+        """
+        import h5py
+        weight_names = [self._text(name) for name in group.attrs.get('weight_names', [])]
+        if weight_names and all(name in group for name in weight_names):
+            return [tuple(group[name].shape or ()) for name in weight_names]
+
+        datasets: List[Tuple[str, Tuple[int, ...]]] = []
+        group.visititems(lambda name, item: datasets.append((name, tuple(item.shape or ())))
+                         if isinstance(item, h5py.Dataset) else None)
+        datasets.sort(key=lambda dataset: [(0, int(part), '') if part.isdigit() else (1, 0, part)
+                                           for part in dataset[0].split('/')])
+        return [shape for _, shape in datasets]
+
+    def _model_header(self, config: Optional[Dict[str, Any]], version: Optional[str]) -> List[str]:
+        """Model sınıfı, adı, sürümü ve giriş şeklinden oluşan başlık satırlarını üretir"""
+        config = config or {}
+        model_config = config.get('config') if isinstance(config.get('config'), dict) else {}
+        title = f"Keras modeli: {config.get('class_name', '?')}"
+        if model_config.get('name'):
+            title += f" \"{model_config['name']}\""
+        if version:
+            title += f" (Keras {version})"
+        lines = [title]
+        input_shape = self._input_shape(config)
+        if input_shape is not None:
+            lines.append(f"Giriş şekli: {self._format_shape(input_shape)}")
+        return lines
+
+    @staticmethod
+    def _input_shape(config: Dict[str, Any]) -> Optional[List[Any]]:
+        """Yapılandırmadan modelin giriş şeklini bulur (yoksa None)"""
+        model_config = config.get('config') if isinstance(config.get('config'), dict) else {}
+        if model_config.get('build_input_shape'):
+            return model_config['build_input_shape']
+        build_config = config.get('build_config') or {}
+        if build_config.get('input_shape'):
+            return build_config['input_shape']
+        for layer in model_config.get('layers') or []:
+            layer_config = layer.get('config') or {}
+            shape = layer_config.get('batch_shape') or layer_config.get('batch_input_shape')
+            if shape:
+                return shape
+        return None
+
+    def _layer_table(self, layers: List[LayerInfo], with_weights: bool = True) -> List[str]:
+        """
+        Katman tablosunu ve toplam parametre sayısını üretir
+
+        Args:
+            layers (List[LayerInfo]): Katmanlar
+            with_weights (bool): False ise ağırlıklar okunamamıştır, yalnızca katman adları ve türleri yazılır
+
+        Returns:
+            List[str]: Tablo satırları
+        """
+        if not with_weights:
+            name_width = max([len('Katman')] + [len(name) for name, _, _ in layers])
+            return [f"{'Katman':<{name_width}}  Tür"] + \
+                [f"{name:<{name_width}}  {class_name}" for name, class_name, _ in layers]
+        rows = [(name, class_name, ', '.join(self._format_shape(shape) for shape in shapes) or '-',
+                 sum(math.prod(shape) for shape in shapes))
+                for name, class_name, shapes in layers]
+        name_width = max([len('Katman')] + [len(row[0]) for row in rows])
+        class_width = max([len('Tür')] + [len(row[1]) for row in rows])
+        lines = [f"{'Katman':<{name_width}}  {'Tür':<{class_width}}  {'Parametre':>10}  Ağırlık şekilleri"]
+        for name, class_name, shapes, params in rows:
+            lines.append(f"{name:<{name_width}}  {class_name:<{class_width}}  {params:>10}  {shapes}")
+        lines.append(f"Toplam parametre: {sum(row[3] for row in rows)}")
+        return lines
+
+    @staticmethod
+    def _format_shape(shape: Any) -> str:
+        """Şekli (None, 784) biçiminde yazar"""
+        shape = tuple(shape)
+        return f"({shape[0]},)" if len(shape) == 1 else str(shape)
+
+    @staticmethod
+    def _text(value: Any) -> str:
+        """HDF5 özniteliğindeki bytes veya str değeri metne çevirir"""
+        return value.decode('utf-8') if isinstance(value, bytes) else str(value)
+
+    def _json_attr(self, value: Any) -> Optional[Dict[str, Any]]:
+        """JSON içeren HDF5 özniteliğini çözümler (yoksa veya geçersizse None)"""
+        if value is None:
+            return None
+        try:
+            return json.loads(self._text(value))
+        except ValueError as e:
+            logger.warning(f"Model yapılandırması çözümlenemedi: {str(e)}")
+            return None
@@ -1,29 +1,99 @@
-from typing import Optional, Set
-import numpy as np
-from tensorflow.keras.models import load_model #type: ignore
+import ast
+import io
+import math
+import mmap
+import struct
+import zipfile
+from contextlib import contextmanager
+from typing import Any, BinaryIO, Iterator, List, Optional, Set, Tuple, TYPE_CHECKING
+# NumPy ve TensorFlow yalnızca model dosyası görüldüğünde içe aktarılır
+from ..utils.file_probe import FileProbe
+from ..utils.file_utils import FileUtils
 from ..utils.logger import logger
 from .base_extractor import BaseExtractor
+from .keras_reader import KerasModelReader
+
+if TYPE_CHECKING:
+    import numpy as np
 
 
 class ModelExtractor(BaseExtractor):
     # Desteklenen model dosyası uzantıları
     SUPPORTED_EXTENSIONS: Set[str] = {
-        '.h5', '.keras', '.npy'
+        '.h5', '.keras', '.npy', '.npz'
     }
+    # Model dosyaları yoldan okunur, probe içeriği kullanılmaz
+    READS_PROBE_DATA: bool = False
+    # İstatistikler bu boyuttaki parçalar halinde hesaplanır (byte)
+    CHUNK_BYTES: int = 4 * 1024 * 1024
+    # ZIP yerel dosya başlığının sabit kısmı
+    _ZIP_LOCAL_HEADER = struct.Struct('<4s2B4HL2L2H')
+    # .npy 2.0 ve 3.0 başlık uzunluğu alanı
+    _NPY_HEADER_LENGTH = struct.Struct('<I')
+
+    def __init__(self, preview_items: int = 5, max_scan_mb: Optional[float] = None):
+        """
+        ModelExtractor sınıfının başlatıcısı
+
+        NumPy dizilerinin tamamı belleğe alınmaz: .npy dosyaları ve .npz içindeki
+        sıkıştırılmamış diziler yalnızca başlıkları okunarak bellek eşlemesiyle
+        (mmap) açılır, sıkıştırılmış diziler akış halinde okunur. İstatistikler
+        CHUNK_BYTES boyutundaki parçalar üzerinden hesaplandığından bellek
+        kullanımı dizinin boyutundan bağımsızdır. Pickle ile saklanmış nesne
+        dizilerinin içeriği hiçbir zaman okunmaz.
+
+        Args:
+            preview_items (int): Dizinin başından ve sonundan gösterilecek eleman sayısı
+            max_scan_mb (Optional[float]): İstatistik için taranacak en fazla veri (MB); dizi
+                daha büyükse eşit aralıklı parçalardan örneklenir (None ise tamamı taranır)
+        """
+        self.preview_items = preview_items
+        self.max_scan_bytes = int(max_scan_mb * 1024 * 1024) if max_scan_mb else None
+        self.keras_reader = KerasModelReader()
 
     def can_handle(self, file_path: str) -> bool:
         """Dosya uzantısının desteklenip desteklenmediğini kontrol eder."""
-        ext = file_path.lower().split('.')[-1] if '.' in file_path else ''
-        return f'.{ext}' in self.SUPPORTED_EXTENSIONS
+        return FileUtils.get_extension(file_path) in self.SUPPORTED_EXTENSIONS
+
+    def extract_text(self, file_path: str, probe: Optional[FileProbe] = None) -> Optional[str]:
+        """
+        Model dosyasının özetini metin olarak döndürür
+
+        NumPy dizileri için şekil, tür, istatistik ve baş/son önizlemesi; Keras
+        (.keras, .h5) modelleri için TensorFlow yüklenmeden okunan katmanlar,
+        ağırlık şekilleri ve parametre sayıları üretilir.
+
+        Args:
+            file_path (str): Dosya yolu
+            probe (Optional[FileProbe]): İçeriği bellekte olabilecek probe (arşiv üyeleri)
+
+        Returns:
+            Optional[str]: Model özeti veya None
+        """
+        ext = FileUtils.get_extension(file_path)
+        try:
+            # Arşiv üyeleri diskte değildir, bellekteki içerikten kopyalanmadan okunur
+            data = probe.data if probe is not None and probe.in_memory else None
+            if ext == '.npy':
+                return self._summarize_npy(file_path, data)
+            elif ext == '.npz':
+                return self._summarize_npz(file_path, data)
+            elif ext in ('.h5', '.keras'):
+                source = io.BytesIO(data) if data is not None else file_path
+                return '\n'.join(self.keras_reader.describe(ext, source))
+            return None
+        except Exception as e:
+            logger.error(f"Model dosyası okuma hatası {file_path}: {str(e)}")
+            return None
 
     def extract_model(self, file_path: str):
         """Model dosyasını okur ve içeriğini döner."""
-        ext = file_path.lower().split('.')[-1]
-        
+        ext = FileUtils.get_extension(file_path)
+
         try:
-            if ext in ['h5', 'keras']:
+            if ext in ['.h5', '.keras']:
                 return self._extract_keras_model(file_path)
-            elif ext == 'npy':
+            elif ext == '.npy':
                 return self._extract_npy(file_path)
             else:
                 logger.warning(f"Desteklenmeyen model dosya formatı: {file_path}")
@@ -36,16 +106,387 @@ class ModelExtractor(BaseExtractor):
         """Keras modelini dosyadan yükler."""
         try:
             logger.info(f"Keras modeli yükleniyor: {file_path}")
+            from tensorflow.keras.models import load_model #type: ignore
             return load_model(file_path)
         except Exception as e:
             logger.error(f"Keras model yükleme hatası {file_path}: {str(e)}")
             raise RuntimeError(f"Keras model yükleme hatası: {e}")
 
-    def _extract_npy(self, file_path: str) -> np.ndarray:
-        """NPY dosyasını okur."""
+    def _extract_npy(self, file_path: str) -> "np.ndarray":
+        """NPY dosyasını belleğe almadan, salt okunur bellek eşlemesiyle açar."""
         try:
-            logger.info(f"NPY dosyası yükleniyor: {file_path}")
-            return np.load(file_path, allow_pickle=True)
+            logger.info(f"NPY dosyası açılıyor: {file_path}")
+            import numpy as np
+            return np.load(file_path, mmap_mode='r', allow_pickle=False)
         except Exception as e:
             logger.error(f"NPY dosya okuma hatası {file_path}: {str(e)}")
             raise RuntimeError(f"NPY dosya okuma hatası: {e}")
+
+    @staticmethod
+    def _import_numpy():
+        """NumPy'yi içe aktarır"""
+        try:
+            import numpy as np
+        except ImportError:
+            raise ImportError("NumPy dizileri için numpy gerekli: pip install numpy")
+        return np
+
+    @classmethod
+    def _read_header(cls, stream: BinaryIO) -> Tuple[Tuple[int, ...], bool, "np.dtype"]:
+        """
+        .npy başlığını okur, akışı verinin başına konumlandırır
+
+        Args:
+            stream (BinaryIO): .npy içeriğinin başındaki akış
+
+        Returns:
+            Tuple[Tuple[int, ...], bool, np.dtype]: Şekil, Fortran sırası ve veri türü
+
+        Raises:
+            ValueError: Sürüm desteklenmiyorsa veya başlık bozuksa
+        """
+        from numpy.lib import format as npy_format
+        version = npy_format.read_magic(stream)
+        if version == (1, 0):
+            return npy_format.read_array_header_1_0(stream)
+        if version == (2, 0):
+            return npy_format.read_array_header_2_0(stream)
+        if version == (3, 0):
+            return cls._read_header_3_0(stream)
+        raise ValueError(f"desteklenmeyen .npy sürümü: {version[0]}.{version[1]}")
+
+    @classmethod
+    def _read_header_3_0(cls, stream: BinaryIO) -> Tuple[Tuple[int, ...], bool, "np.dtype"]:
+        """
+        .npy 3.0 başlığını okur
+
+        3.0 başlığı 2.0 ile aynı yapıdadır, yalnızca latin1 yerine UTF-8 ile
+        kodlanır (ör. ASCII dışı alan adlı yapılı türler); NumPy bunun için
+        herkese açık bir okuyucu sunmaz.
+
+        Args:
+            stream (BinaryIO): Sürüm baytlarından sonraki akış
+
+        Returns:
+            Tuple[Tuple[int, ...], bool, np.dtype]: Şekil, Fortran sırası ve veri türü
+        """
+        from numpy.lib import format as npy_format
+        raw_length = stream.read(cls._NPY_HEADER_LENGTH.size)
+        if len(raw_length) != cls._NPY_HEADER_LENGTH.size:
+            raise ValueError(".npy başlığı eksik")
+        (length,) = cls._NPY_HEADER_LENGTH.unpack(raw_length)
+        header = stream.read(length)
+        if len(header) != length:
+            raise ValueError(".npy başlığı eksik")
+        fields = ast.literal_eval(header.decode('utf-8'))
+        if not isinstance(fields, dict) or set(fields) != {'descr', 'fortran_order', 'shape'}:
+            raise ValueError(f".npy başlığı geçersiz: {fields!r}")
+        shape, fortran_order = fields['shape'], fields['fortran_order']
+        if not isinstance(shape, tuple) or not all(isinstance(dim, int) for dim in shape) or \
+                not isinstance(fortran_order, bool):
+            raise ValueError(f".npy başlığı geçersiz: {fields!r}")
+        return shape, fortran_order, npy_format.descr_to_dtype(fields['descr'])
+
+    @staticmethod
+    @contextmanager
+    def _map_file(raw: BinaryIO, data: Optional[bytes]) -> Iterator[Optional[mmap.mmap]]:
+        """
+        Dosyayı salt okunur eşler, iş bitince eşlemeyi kapatır
+
+        Eşlemeden oluşturulan dizi görünümleri blok bitmeden bırakılmalıdır.
+
+        Args:
+            raw (BinaryIO): Açık dosya
+            data (Optional[bytes]): Bellekteki içerik; verilmişse eşleme yapılmaz
+
+        Returns:
+            Iterator[Optional[mmap.mmap]]: Eşleme veya içerik bellekteyse None
+        """
+        if data is not None:
+            yield None
+            return
+        mapping = mmap.mmap(raw.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            yield mapping
+        finally:
+            try:
+                mapping.close()
+            except BufferError:
+                # Hata izindeki dizi görünümleri eşlemeyi hâlâ tutuyor; onlarla birlikte kapanır
+                pass
+
+    def _summarize_npy(self, file_path: str, data: Optional[bytes]) -> str:
+        """
+        .npy dosyasını özetler
+
+        Args:
+            file_path (str): Dosya yolu
+            data (Optional[bytes]): Bellekteki içerik (None ise dosya eşlenir)
+
+        Returns:
+            str: Dizi özeti
+        """
+        np = self._import_numpy()
+        with open(file_path, 'rb') if data is None else io.BytesIO(data) as raw:
+            shape, fortran_order, dtype = self._read_header(raw)
+            offset = raw.tell()
+            with self._map_file(raw, data) as mapping:
+                # Görünüm yalnızca _describe çağrısında yaşar, eşleme kapanmadan bırakılır
+                array = self._view(np.frombuffer(data if mapping is None else mapping, dtype=np.uint8),
+                                   offset, shape, fortran_order, dtype)
+                lines = self._describe(array, shape, fortran_order, dtype, mapping, offset)
+                del array
+        return '\n'.join(lines)
+
+    def _summarize_npz(self, file_path: str, data: Optional[bytes]) -> str:
+        """
+        .npz arşivindeki dizileri sırayla özetler
+
+        Sıkıştırılmamış üyeler (np.savez) arşiv dosyasında yerinde eşlenir;
+        sıkıştırılmış üyeler (np.savez_compressed) parça parça açılır.
+
+        Args:
+            file_path (str): Dosya yolu
+            data (Optional[bytes]): Bellekteki içerik (None ise dosyadan okunur)
+
+        Returns:
+            str: Dizilerin özetleri
+        """
+        np = self._import_numpy()
+        with open(file_path, 'rb') if data is None else io.BytesIO(data) as raw, \
+                zipfile.ZipFile(raw) as archive, self._map_file(raw, data) as mapping:
+            members = [info for info in archive.infolist() if not info.is_dir()]
+            lines = [f"NPZ arşivi: {len(members)} dizi"]
+            for info in members:
+                name = info.filename[:-4] if info.filename.endswith('.npy') else info.filename
+                lines.append('')
+                lines.append(f"[{name}]")
+                with archive.open(info) as member:
+                    shape, fortran_order, dtype = self._read_header(member)
+                    header_size = member.tell() if info.compress_type == zipfile.ZIP_STORED else None
+                    if header_size is None or dtype.hasobject:
+                        lines.extend(self._describe_stream(member, shape, fortran_order, dtype))
+                        continue
+                offset = self._member_offset(raw, info) + header_size
+                array = self._view(np.frombuffer(data if mapping is None else mapping, dtype=np.uint8),
+                                   offset, shape, fortran_order, dtype)
+                lines.extend(self._describe(array, shape, fortran_order, dtype, mapping, offset))
+                del array
+        return '\n'.join(lines)
+
+    def _member_offset(self, raw: BinaryIO, info: zipfile.ZipInfo) -> int:
+        """ZIP üyesinin verisinin arşiv içindeki başlangıç konumunu döndürür"""
+        raw.seek(info.header_offset)
+        header = self._ZIP_LOCAL_HEADER.unpack(raw.read(self._ZIP_LOCAL_HEADER.size))
+        name_length, extra_length = header[-2], header[-1]
+        return info.header_offset + self._ZIP_LOCAL_HEADER.size + name_length + extra_length
+
+    @staticmethod
+    def _view(buffer: "np.ndarray", offset: int, shape: Tuple[int, ...], fortran_order: bool,
+              dtype: "np.dtype") -> Optional["np.ndarray"]:
+        """Bellekteki veriden kopyasız dizi görünümü oluşturur (nesne dizilerinde None)"""
+        if dtype.hasobject:
+            return None
+        count = math.prod(shape)
+        view = buffer[offset:offset + count * dtype.itemsize].view(dtype)
+        return view.reshape(shape, order='F' if fortran_order else 'C')
+
+    @staticmethod
+    def _release(mapping: mmap.mmap, start: int, end: int) -> None:
+        """
+        Eşlenmiş bölgenin işlenen sayfalarını bırakır
+
+        Dosyaya bağlı sayfalar çekirdek tarafından geri alınabilir olsa da
+        tarandıkça sürecin bellek kullanımında (RSS) birikir. Bırakılan sayfalar
+        yeniden erişilirse dosyadan tekrar okunur.
+
+        Args:
+            mapping (mmap.mmap): Dosya eşlemesi
+            start (int): Bölgenin başı (byte)
+            end (int): Bölgenin sonu (byte)
+        """
+        if not hasattr(mmap, 'MADV_DONTNEED'):
+            return
+        start -= start % mmap.PAGESIZE
+        end = min(end, len(mapping))
+        if end > start:
+            mapping.madvise(mmap.MADV_DONTNEED, start, end - start)
+
+    def _describe(self, array: Optional["np.ndarray"], shape: Tuple[int, ...], fortran_order: bool,
+                  dtype: "np.dtype", mapping: Optional[mmap.mmap] = None, offset: int = 0) -> List[str]:
+        """
+        Eşlenmiş dizinin özet satırlarını üretir
+
+        Args:
+            array (Optional[np.ndarray]): Dizi (nesne dizilerinde None)
+            shape (Tuple[int, ...]): Şekil
+            fortran_order (bool): Fortran sırasıyla saklanıyorsa True
+            dtype (np.dtype): Veri türü
+            mapping (Optional[mmap.mmap]): Dizi bir dosya eşlemesindeyse eşleme; taranan
+                parçaların sayfaları bırakılır
+            offset (int): Dizi verisinin eşleme içindeki başlangıcı (byte)
+
+        Returns:
+            List[str]: Özet satırları
+        """
+        lines = self._describe_header(shape, fortran_order, dtype)
+        if array is None:
+            lines.append("İçerik: Python nesneleri (pickle), güvenlik nedeniyle okunmadı")
+            return lines
+
+        flat = array.reshape(-1, order='A')
+        count = flat.size
+        chunk = max(1, self.CHUNK_BYTES // max(dtype.itemsize, 1))
+        starts = range(0, count, chunk)
+        sampled = False
+        if self.max_scan_bytes is not None and count * dtype.itemsize > self.max_scan_bytes:
+            # Eşit aralıklı parçalar: dizinin her bölgesinden örnek alınır
+            wanted = max(1, self.max_scan_bytes // (chunk * max(dtype.itemsize, 1)))
+            step = len(starts) / wanted
+            starts = [starts[int(i * step)] for i in range(wanted)]
+            sampled = True
+
+        def chunks() -> Iterator["np.ndarray"]:
+            for start in starts:
+                yield flat[start:start + chunk]
+                if mapping is not None:
+                    self._release(mapping, offset + start * dtype.itemsize,
+                                  offset + (start + chunk) * dtype.itemsize)
+
+        stats = self._chunk_stats(chunks(), dtype)
+        lines.extend(self._format_values(stats, flat[:self.preview_items],
+                                         flat[max(count - self.preview_items, 0):], count, dtype, sampled))
+        return lines
+
+    def _describe_stream(self, stream: BinaryIO, shape: Tuple[int, ...], fortran_order: bool,
+                         dtype: "np.dtype") -> List[str]:
+        """
+        Sıkıştırılmış .npz üyesinin özet satırlarını, veriyi parça parça okuyarak üretir
+
+        Args:
+            stream (BinaryIO): Başlığı okunmuş üye akışı
+            shape (Tuple[int, ...]): Şekil
+            fortran_order (bool): Fortran sırasıyla saklanıyorsa True
+            dtype (np.dtype): Veri türü
+
+        Returns:
+            List[str]: Özet satırları
+        """
+        lines = self._describe_header(shape, fortran_order, dtype)
+        if dtype.hasobject:
+            lines.append("İçerik: Python nesneleri (pickle), güvenlik nedeniyle okunmadı")
+            return lines
+
+        np = self._import_numpy()
+        count = math.prod(shape)
+        itemsize = max(dtype.itemsize, 1)
+        chunk = max(1, self.CHUNK_BYTES // itemsize)
+        head: List[Any] = []
+        tail = np.empty(0, dtype=dtype)
+
+        def chunks() -> Iterator["np.ndarray"]:
+            nonlocal tail
+            remaining = count
+            while remaining > 0:
+                size = min(chunk, remaining)
+                data = stream.read(size * itemsize)
+                if len(data) != size * itemsize:
+                    raise ValueError("dizi verisi eksik")
+                values = np.frombuffer(data, dtype=dtype)
+                if len(head) < self.preview_items:
+                    head.extend(values[:self.preview_items - len(head)])
+                # Son önizleme için yalnızca son birkaç eleman tutulur
+                tail = np.concatenate([tail, values[-self.preview_items:]])[-self.preview_items:] \
+                    if self.preview_items else tail
+                remaining -= size
+                yield values
+
+        stats = self._chunk_stats(chunks(), dtype)
+        lines.extend(self._format_values(stats, np.array(head, dtype=dtype), tail, count, dtype, False))
+        return lines
+
+    @staticmethod
+    def _describe_header(shape: Tuple[int, ...], fortran_order: bool, dtype: "np.dtype") -> List[str]:
+        """Şekil, tür ve boyut satırlarını üretir"""
+        count = math.prod(shape)
+        size_mb = count * dtype.itemsize / (1024 * 1024)
+        order = 'Fortran' if fortran_order else 'C'
+        return [
+            f"Şekil: {shape}, tür: {dtype.str} ({dtype}), {order} sırası",
+            f"Eleman sayısı: {count}, boyut: {size_mb:.2f} MB",
+        ]
+
+    @staticmethod
+    def _chunk_stats(chunks: Iterator["np.ndarray"], dtype: "np.dtype") -> Optional[dict]:
+        """
+        Sayısal dizinin istatistiklerini parça parça hesaplar
+
+        Ortalama ve varyans parçaların (eleman sayısı, ortalama, kare sapma
+        toplamı) üçlüleri birleştirilerek hesaplanır; böylece büyük dizilerde
+        de sayısal olarak kararlıdır. NaN ve sonsuz değerler istatistiğe katılmaz.
+
+        Args:
+            chunks (Iterator[np.ndarray]): Tek boyutlu parçalar (sayısal olmayan türlerde yine tüketilir)
+            dtype (np.dtype): Veri türü
+
+        Returns:
+            Optional[dict]: İstatistikler; sayısal olmayan türlerde None
+        """
+        import numpy as np
+        numeric = dtype.kind in 'biuf'
+        n, mean, m2 = 0, 0.0, 0.0
+        minimum = maximum = None
+        nan = inf = 0
+        for values in chunks:
+            if not numeric:
+                continue
+            if dtype.kind == 'f':
+                finite = np.isfinite(values)
+                if not finite.all():
+                    nan += int(np.isnan(values).sum())
+                    inf += int(values.size - finite.sum()) - int(np.isnan(values).sum())
+                    values = values[finite]
+            if values.size == 0:
+                continue
+            chunk_min, chunk_max = values.min(), values.max()
+            minimum = chunk_min if minimum is None else min(minimum, chunk_min)
+            maximum = chunk_max if maximum is None else max(maximum, chunk_max)
+            as_float = values.astype(np.float64)
+            chunk_n = as_float.size
+            chunk_mean = float(as_float.mean())
+            chunk_m2 = float(((as_float - chunk_mean) ** 2).sum())
+            delta = chunk_mean - mean
+            total = n + chunk_n
+            mean += delta * chunk_n / total
+            m2 += chunk_m2 + delta * delta * n * chunk_n / total
+            n = total
+        if not numeric:
+            return None
+        return {'n': n, 'min': minimum, 'max': maximum, 'mean': mean,
+                'std': math.sqrt(m2 / n) if n else 0.0, 'nan': nan, 'inf': inf}
+
+    def _format_values(self, stats: Optional[dict], head: "np.ndarray", tail: "np.ndarray", count: int,
+                       dtype: "np.dtype", sampled: bool) -> List[str]:
+        """İstatistik ve önizleme satırlarını üretir"""
+        import numpy as np
+        lines: List[str] = []
+        if stats is not None and stats['n']:
+            integer = dtype.kind in 'biu'
+            minimum = int(stats['min']) if integer else f"{float(stats['min']):.6g}"
+            maximum = int(stats['max']) if integer else f"{float(stats['max']):.6g}"
+            line = (f"İstatistik: min={minimum}, maks={maximum}, ortalama={stats['mean']:.6g}, "
+                    f"std={stats['std']:.6g}")
+            if stats['nan'] or stats['inf']:
+                line += f" (NaN: {stats['nan']}, sonsuz: {stats['inf']})"
+            if sampled:
+                line += f" [{stats['n']} elemanlık örneklemden]"
+            lines.append(line)
+        elif stats is not None and (stats['nan'] or stats['inf']):
+            lines.append(f"İstatistik: sonlu değer yok (NaN: {stats['nan']}, sonsuz: {stats['inf']})")
+        if count and self.preview_items:
+            options = {'separator': ', ', 'precision': 6, 'max_line_width': 120,
+                       'threshold': 2 * self.preview_items}
+            lines.append(f"İlk {len(head)}: {np.array2string(np.asarray(head), **options)}")
+            if count > self.preview_items:
+                lines.append(f"Son {len(tail)}: {np.array2string(np.asarray(tail), **options)}")
+        return lines
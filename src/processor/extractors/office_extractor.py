@@ -1,11 +1,9 @@
-from typing import Optional, Set
-from docx import Document
-from odf import text, teletype
-from odf.opendocument import load
-import xlrd
-from openpyxl import load_workbook
-from pptx import Presentation
+from typing import BinaryIO, Iterable, Iterator, List, Optional, Set, Union
+# docx, odfpy, xlrd, openpyxl ve pptx ağır kütüphaneler; ilgili format ilk görüldüğünde içe aktarılır
 from .base_extractor import BaseExtractor
+from .office_xml_reader import OfficeXMLReader
+from ..utils.file_probe import FileProbe
+from ..utils.file_utils import FileUtils
 from ..utils.logger import logger
 
 class OfficeExtractor(BaseExtractor):
@@ -15,67 +13,188 @@ class OfficeExtractor(BaseExtractor):
         '.odt', '.ods', '.odp',
         '.xls'
     }
+    # Nesne modeli kütüphanesi olmayan, her zaman doğrudan XML ile okunan formatlar
+    XML_ONLY_FORMATS: Set[str] = {'.ods', '.odp'}
+    # Doğrudan XML ile okunabilen formatlar
+    XML_FORMATS: Set[str] = {'.docx', '.pptx', '.odt', '.ods', '.odp'}
+    # Tablolar ve XML ile okunan belgeler satır satır yazılabilir
+    SUPPORTS_STREAMING: bool = True
+    # Akış modunda tek parçada biriktirilecek yaklaşık karakter sayısı
+    STREAM_CHUNK_SIZE: int = 1024 * 1024
+
+    def __init__(self, max_rows: Optional[int] = None, max_columns: Optional[int] = None,
+                 xml_formats: Optional[Iterable[str]] = None):
+        """
+        OfficeExtractor sınıfının başlatıcısı
+
+        Args:
+            max_rows (Optional[int]): Tablo sayfası başına okunacak en fazla satır
+            max_columns (Optional[int]): Tablo satırı başına okunacak en fazla sütun
+            xml_formats (Optional[Iterable[str]]): python-docx/python-pptx/odfpy yerine
+                doğrudan XML akışıyla okunacak formatlar (ör. {'.docx', '.pptx'})
+        """
+        self.max_rows = max_rows
+        self.max_columns = max_columns
+        self.xml_formats = (set(xml_formats or ()) & self.XML_FORMATS) | self.XML_ONLY_FORMATS
+        self.xml_reader = OfficeXMLReader(max_rows=max_rows, max_columns=max_columns)
 
     def can_handle(self, file_path: str) -> bool:
         """Dosya uzantısının desteklenip desteklenmediğini kontrol eder"""
-        ext = file_path.lower().split('.')[-1] if '.' in file_path else ''
-        return f'.{ext}' in self.SUPPORTED_EXTENSIONS
+        return FileUtils.get_extension(file_path) in self.SUPPORTED_EXTENSIONS
 
-    def extract_text(self, file_path: str) -> Optional[str]:
+    def extract_text(self, file_path: str, probe: Optional[FileProbe] = None) -> Optional[str]:
         """Dosyadan text çıkarır"""
-        ext = file_path.lower().split('.')[-1]
-        
         try:
-            if ext == 'docx':
-                return self._extract_docx(file_path)
-            elif ext == 'odt':
-                return self._extract_odt(file_path)
-            elif ext in ['xlsx', 'xls']:
-                return self._extract_excel(file_path)
-            elif ext == 'pptx':
-                return self._extract_pptx(file_path)
+            if probe is None:
+                return self._extract(file_path, file_path)
+            with probe.open_binary() as source:
+                return self._extract(file_path, source)
+        except Exception as e:
+            logger.error(f"Office dosyası okuma hatası {file_path}: {str(e)}")
+            return None
+
+    def iter_text(self, file_path: str, probe: Optional[FileProbe] = None) -> Iterator[str]:
+        """
+        Tabloları ve XML ile okunan belgeleri satır satır okuyup parça parça metin üretir,
+        nesne modeliyle okunan diğer formatlar tek parçadır
+
+        Args:
+            file_path (str): Dosya yolu
+            probe (Optional[FileProbe]): İçeriği bellekte olabilecek probe
+
+        Returns:
+            Iterator[str]: Metin parçaları
+        """
+        ext = FileUtils.get_extension(file_path)
+        if ext not in ('.xlsx', '.xls') and ext not in self.xml_formats:
+            yield from super().iter_text(file_path, probe)
+            return
+
+        try:
+            if probe is None:
+                yield from self._join_lines(self._iter_lines(ext, file_path))
             else:
-                return None
+                with probe.open_binary() as source:
+                    yield from self._join_lines(self._iter_lines(ext, source))
         except Exception as e:
             logger.error(f"Office dosyası okuma hatası {file_path}: {str(e)}")
+
+    def _extract(self, file_path: str, source: Union[str, BinaryIO]) -> Optional[str]:
+        """Uzantıya göre uygun okuyucuyu çağırır"""
+        ext = FileUtils.get_extension(file_path)
+
+        if ext in self.xml_formats:
+            return '\n'.join(self.xml_reader.iter_lines(ext, source))
+        elif ext == '.docx':
+            return self._extract_docx(source)
+        elif ext == '.odt':
+            return self._extract_odt(source)
+        elif ext in ['.xlsx', '.xls']:
+            return self._extract_excel(ext, source)
+        elif ext == '.pptx':
+            return self._extract_pptx(source)
+        else:
             return None
 
-    def _extract_docx(self, file_path: str) -> str:
+    def _iter_lines(self, ext: str, source: Union[str, BinaryIO]) -> Iterator[str]:
+        """Satır satır okunabilen formatların satırlarını üretir"""
+        if ext in self.xml_formats:
+            return self.xml_reader.iter_lines(ext, source)
+        return self._iter_excel_lines(ext, source)
+
+    def _extract_docx(self, source: Union[str, BinaryIO]) -> str:
         """DOCX dosyasından text çıkarır"""
-        doc = Document(file_path)
+        from docx import Document
+        doc = Document(source)
         return '\n'.join(paragraph.text for paragraph in doc.paragraphs)
 
-    def _extract_odt(self, file_path: str) -> str:
+    def _extract_odt(self, source: Union[str, BinaryIO]) -> str:
         """ODT dosyasından text çıkarır"""
-        textdoc = load(file_path)
+        from odf import text, teletype
+        from odf.opendocument import load
+        textdoc = load(source)
         allparas = textdoc.getElementsByType(text.P)
         return '\n'.join(teletype.extractText(para) for para in allparas)
 
-    def _extract_excel(self, file_path: str) -> str:
+    def _extract_excel(self, ext: str, source: Union[str, BinaryIO]) -> str:
         """Excel dosyasından text çıkarır"""
-        if file_path.endswith('.xlsx'):
-            wb = load_workbook(file_path, read_only=True)
-            texts = []
-            for sheet in wb.sheetnames:
-                ws = wb[sheet]
-                texts.append(f"\nSheet: {sheet}")
-                for row in ws.rows:
-                    row_texts = [str(cell.value) if cell.value is not None else '' for cell in row]
-                    texts.append('\t'.join(row_texts))
-            return '\n'.join(texts)
+        return '\n'.join(self._iter_excel_lines(ext, source))
+
+    def _iter_excel_lines(self, ext: str, source: Union[str, BinaryIO]) -> Iterator[str]:
+        """
+        Excel dosyasının sayfa başlıklarını ve satırlarını sırayla üretir
+
+        Hücre nesneleri oluşturulmaz; yalnızca değerler okunur. Satır ve sütun
+        sınırları okuma sırasında uygulanır, sınırın ötesi hiç okunmaz.
+
+        Args:
+            ext (str): '.xlsx' veya '.xls'
+            source (Union[str, BinaryIO]): Dosya yolu veya içeriği
+
+        Returns:
+            Iterator[str]: Sekmeyle ayrılmış satırlar ("\nSheet: <ad>" başlıklarıyla)
+        """
+        if ext == '.xlsx':
+            from openpyxl import load_workbook
+            wb = load_workbook(source, read_only=True)
+            try:
+                for ws in wb.worksheets:
+                    yield f"\nSheet: {ws.title}"
+                    for row in ws.iter_rows(max_row=self.max_rows, max_col=self.max_columns,
+                                            values_only=True):
+                        yield '\t'.join('' if value is None else str(value) for value in row)
+            finally:
+                # Salt okunur modda dosya tanıtıcısı ancak close ile bırakılır
+                wb.close()
         else:  # .xls dosyaları için
-            wb = xlrd.open_workbook(file_path)
-            texts = []
-            for sheet in wb.sheets():
-                texts.append(f"\nSheet: {sheet.name}")
-                for row in range(sheet.nrows):
-                    row_texts = [str(cell.value) for cell in sheet.row(row)]
-                    texts.append('\t'.join(row_texts))
-            return '\n'.join(texts)
-
-    def _extract_pptx(self, file_path: str) -> str:
+            import xlrd
+            if isinstance(source, str):
+                wb = xlrd.open_workbook(source, on_demand=True)
+            else:
+                wb = xlrd.open_workbook(file_contents=source.read(), on_demand=True)
+            try:
+                for index in range(wb.nsheets):
+                    sheet = wb.sheet_by_index(index)
+                    yield f"\nSheet: {sheet.name}"
+                    nrows = sheet.nrows if self.max_rows is None else min(sheet.nrows, self.max_rows)
+                    for row in range(nrows):
+                        values = sheet.row_values(row, 0, self.max_columns)
+                        yield '\t'.join(str(value) for value in values)
+                    # Sayfalar tek tek yüklenir, işi biten sayfa bellekten atılır
+                    wb.unload_sheet(index)
+            finally:
+                wb.release_resources()
+
+    def _join_lines(self, lines: Iterable[str]) -> Iterator[str]:
+        """
+        Satırları '\n' ile birleştirip yaklaşık STREAM_CHUNK_SIZE büyüklüğünde parçalar üretir
+
+        Parçalar art arda eklendiğinde '\n'.join(lines) ile aynı metin elde edilir.
+
+        Args:
+            lines (Iterable[str]): Satırlar
+
+        Returns:
+            Iterator[str]: Metin parçaları
+        """
+        batch: List[str] = []
+        size = 0
+        prefix = ''
+        for line in lines:
+            batch.append(line)
+            size += len(line) + 1
+            if size >= self.STREAM_CHUNK_SIZE:
+                yield prefix + '\n'.join(batch)
+                prefix = '\n'
+                batch = []
+                size = 0
+        if batch:
+            yield prefix + '\n'.join(batch)
+
+    def _extract_pptx(self, source: Union[str, BinaryIO]) -> str:
         """PPTX dosyasından text çıkarır"""
-        prs = Presentation(file_path)
+        from pptx import Presentation
+        prs = Presentation(source)
         texts = []
         for i, slide in enumerate(prs.slides, 1):
             texts.append(f"\n--- Slide {i} ---")
@@ -0,0 +1,287 @@
+import itertools
+import posixpath
+import zipfile
+from typing import BinaryIO, Dict, Iterator, List, Optional, Tuple, Union
+from xml.etree import ElementTree
+
+# Office Open XML ad alanları
+W = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}'
+P = '{http://schemas.openxmlformats.org/presentationml/2006/main}'
+A = '{http://schemas.openxmlformats.org/drawingml/2006/main}'
+R = '{http://schemas.openxmlformats.org/officeDocument/2006/relationships}'
+PKG_REL = '{http://schemas.openxmlformats.org/package/2006/relationships}'
+
+# OpenDocument ad alanları
+TEXT = '{urn:oasis:names:tc:opendocument:xmlns:text:1.0}'
+TABLE = '{urn:oasis:names:tc:opendocument:xmlns:table:1.0}'
+DRAW = '{urn:oasis:names:tc:opendocument:xmlns:drawing:1.0}'
+PRESENTATION = '{urn:oasis:names:tc:opendocument:xmlns:presentation:1.0}'
+
+# python-docx'in run metnine kattığı öğeler
+DOCX_RUN_TEXT = {W + 'tab': '\t', W + 'ptab': '\t', W + 'cr': '\n', W + 'noBreakHyphen': '-'}
+ODF_PARAGRAPHS = (TEXT + 'p', TEXT + 'h')
+ODF_CELLS = (TABLE + 'table-cell', TABLE + 'covered-table-cell')
+
+XMLSource = Union[str, BinaryIO]
+
+
+class OfficeXMLReader:
+    """Office belgelerinin XML parçalarını nesne modeli kurmadan akış halinde okur"""
+
+    def __init__(self, max_rows: Optional[int] = None, max_columns: Optional[int] = None):
+        """
+        OfficeXMLReader sınıfının başlatıcısı
+
+        Zip paketindeki XML iterparse ile okunur; işi biten paragraf, satır ve
+        şekiller ağaçtan hemen çıkarılır, böylece bellekte yalnızca o an okunan
+        blok tutulur. Çıktı, DOCX ve PPTX için python-docx/python-pptx yolu ile aynıdır.
+
+        Args:
+            max_rows (Optional[int]): ODS sayfası başına okunacak en fazla satır
+            max_columns (Optional[int]): ODS satırı başına okunacak en fazla sütun
+        """
+        self.max_rows = max_rows
+        self.max_columns = max_columns
+
+    def iter_lines(self, ext: str, source: XMLSource) -> Iterator[str]:
+        """
+        Uzantıya göre belgenin satırlarını üretir
+
+        Args:
+            ext (str): '.docx', '.pptx', '.odt', '.ods' veya '.odp'
+            source (XMLSource): Dosya yolu veya içeriği
+
+        Returns:
+            Iterator[str]: '\\n' ile birleştirildiğinde belge metnini veren satırlar
+        """
+        with zipfile.ZipFile(source) as package:
+            if ext == '.docx':
+                yield from self._iter_docx(package)
+            elif ext == '.pptx':
+                yield from self._iter_pptx(package)
+            elif ext == '.odt':
+                yield from self._iter_odt(package)
+            elif ext == '.ods':
+                yield from self._iter_ods(package)
+            elif ext == '.odp':
+                yield from self._iter_odp(package)
+
+    @staticmethod
+    def _iterparse(package: zipfile.ZipFile,
+                   name: str) -> Iterator[Tuple[str, ElementTree.Element, List[ElementTree.Element]]]:
+        """
+        Zip içindeki XML parçasını ata yığınıyla birlikte olay olay üretir
+
+        Args:
+            package (zipfile.ZipFile): Açık paket
+            name (str): XML parçasının adı
+
+        Returns:
+            Iterator[Tuple[str, Element, List[Element]]]: (olay, öğe, atalar); 'end' olayında
+                atalar listesinin son öğesi öğenin ebeveynidir
+        """
+        ancestors: List[ElementTree.Element] = []
+        with package.open(name) as stream:
+            for event, elem in ElementTree.iterparse(stream, events=('start', 'end')):
+                if event == 'start':
+                    yield event, elem, ancestors
+                    ancestors.append(elem)
+                else:
+                    ancestors.pop()
+                    yield event, elem, ancestors
+
+    @staticmethod
+    def _release(elem: ElementTree.Element, ancestors: List[ElementTree.Element]) -> None:
+        """İşi biten öğeyi ebeveyninden koparır"""
+        if ancestors:
+            ancestors[-1].remove(elem)
+
+    # --- DOCX ---
+
+    def _iter_docx(self, package: zipfile.ZipFile) -> Iterator[str]:
+        """Gövdenin doğrudan altındaki paragrafları üretir (python-docx'teki document.paragraphs)"""
+        for event, elem, ancestors in self._iterparse(package, 'word/document.xml'):
+            if event != 'end' or not ancestors or ancestors[-1].tag != W + 'body':
+                continue
+            if elem.tag == W + 'p':
+                yield ''.join(self._docx_run_text(run) for child in elem
+                              for run in self._docx_runs(child))
+            self._release(elem, ancestors)
+
+    @staticmethod
+    def _docx_runs(elem: ElementTree.Element) -> List[ElementTree.Element]:
+        """Paragraf çocuğunun metin taşıyan run'larını döndürür (köprü içindekiler dahil)"""
+        if elem.tag == W + 'r':
+            return [elem]
+        if elem.tag == W + 'hyperlink':
+            return elem.findall(W + 'r')
+        return []
+
+    @staticmethod
+    def _docx_run_text(run: ElementTree.Element) -> str:
+        """Run'ın metnini python-docx ile aynı kurallarla döndürür"""
+        parts = []
+        for child in run:
+            if child.tag == W + 't':
+                parts.append(child.text or '')
+            elif child.tag == W + 'br':
+                # Sayfa ve sütun sonları metne katılmaz
+                if child.get(W + 'type', 'textWrapping') == 'textWrapping':
+                    parts.append('\n')
+            elif child.tag in DOCX_RUN_TEXT:
+                parts.append(DOCX_RUN_TEXT[child.tag])
+        return ''.join(parts)
+
+    # --- PPTX ---
+
+    def _pptx_slide_names(self, package: zipfile.ZipFile) -> List[str]:
+        """Slaytların zip içindeki adlarını sunumdaki sırayla döndürür"""
+        with package.open('ppt/_rels/presentation.xml.rels') as stream:
+            targets: Dict[str, str] = {
+                rel.get('Id'): rel.get('Target')
+                for rel in ElementTree.parse(stream).getroot().iter(PKG_REL + 'Relationship')
+            }
+        with package.open('ppt/presentation.xml') as stream:
+            slide_ids = ElementTree.parse(stream).getroot().iter(P + 'sldId')
+            names = []
+            for slide_id in slide_ids:
+                target = targets[slide_id.get(R + 'id')]
+                if target.startswith('/'):
+                    names.append(target.lstrip('/'))
+                else:
+                    names.append(posixpath.normpath(posixpath.join('ppt', target)))
+        return names
+
+    def _iter_pptx(self, package: zipfile.ZipFile) -> Iterator[str]:
+        """Her slayt için başlığı ve üst seviye şekillerin metnini üretir"""
+        for index, name in enumerate(self._pptx_slide_names(package), 1):
+            yield f"\n--- Slide {index} ---"
+            for event, elem, ancestors in self._iterparse(package, name):
+                if event != 'end' or not ancestors or ancestors[-1].tag != P + 'spTree':
+                    continue
+                # Yalnızca p:sp şekillerinin metni vardır (gruplar, resimler, tablolar hariç)
+                if elem.tag == P + 'sp':
+                    body = elem.find(P + 'txBody')
+                    paragraphs = body.findall(A + 'p') if body is not None else []
+                    yield '\n'.join(self._pptx_paragraph_text(p) for p in paragraphs)
+                self._release(elem, ancestors)
+
+    @staticmethod
+    def _pptx_paragraph_text(paragraph: ElementTree.Element) -> str:
+        """Paragraf metnini python-pptx ile aynı kurallarla döndürür (satır sonu '\\v')"""
+        parts = []
+        for child in paragraph:
+            if child.tag in (A + 'r', A + 'fld'):
+                parts.append(child.findtext(A + 't') or '')
+            elif child.tag == A + 'br':
+                parts.append('\v')
+        return ''.join(parts)
+
+    # --- OpenDocument ---
+
+    @classmethod
+    def _odf_text(cls, elem: ElementTree.Element) -> str:
+        """Öğenin metnini odfpy teletype.extractText ile aynı kurallarla döndürür"""
+        parts = [elem.text or '']
+        for child in elem:
+            if child.tag == TEXT + 's':
+                parts.append(' ' * int(child.get(TEXT + 'c', '1')))
+            elif child.tag == TEXT + 'tab':
+                parts.append('\t')
+            elif child.tag == TEXT + 'line-break':
+                parts.append('\n')
+            else:
+                parts.append(cls._odf_text(child))
+            parts.append(child.tail or '')
+        return ''.join(parts)
+
+    def _iter_odt(self, package: zipfile.ZipFile) -> Iterator[str]:
+        """content.xml'deki, ardından styles.xml'deki (üst/alt bilgi) paragrafları odfpy'deki sırayla üretir"""
+        # odfpy yedeğindeki getElementsByType(text.P) ile aynı: başlıklar (text:h) alınmaz,
+        # iç içe paragraflar (ör. metin kutuları) dıştaki paragraftan sonra ayrıca üretilir
+        names = set(package.namelist())
+        for name in ('content.xml', 'styles.xml'):
+            if name not in names:
+                continue
+            for event, elem, ancestors in self._iterparse(package, name):
+                if event == 'end' and elem.tag == TEXT + 'p' and \
+                        not any(ancestor.tag == TEXT + 'p' for ancestor in ancestors):
+                    for paragraph in elem.iter(TEXT + 'p'):
+                        yield self._odf_text(paragraph)
+                    self._release(elem, ancestors)
+
+    def _iter_odp(self, package: zipfile.ZipFile) -> Iterator[str]:
+        """Her slayt için başlığı ve konuşmacı notları dışındaki paragrafları üretir"""
+        index = 0
+        in_notes = 0
+        for event, elem, ancestors in self._iterparse(package, 'content.xml'):
+            if elem.tag == DRAW + 'page':
+                if event == 'start':
+                    index += 1
+                    yield f"\n--- Slide {index} ---"
+                else:
+                    self._release(elem, ancestors)
+            elif elem.tag == PRESENTATION + 'notes':
+                in_notes += 1 if event == 'start' else -1
+            elif event == 'end' and elem.tag in ODF_PARAGRAPHS and not in_notes and \
+                    not any(ancestor.tag in ODF_PARAGRAPHS for ancestor in ancestors):
+                yield self._odf_text(elem)
+                self._release(elem, ancestors)
+
+    def _iter_ods(self, package: zipfile.ZipFile) -> Iterator[str]:
+        """
+        Her tablo sayfası için "Sheet: <ad>" başlığını ve sekmeyle ayrılmış satırları üretir
+
+        ODS dosyalarında boş satır ve hücreler tekrar sayısıyla saklanır; sondaki
+        boş hücreler ve sayfa sonundaki boş satırlar atlanır.
+        """
+        rows_emitted = 0
+        pending_empty = 0
+        for event, elem, ancestors in self._iterparse(package, 'content.xml'):
+            if elem.tag == TABLE + 'table':
+                if event == 'start':
+                    rows_emitted = 0
+                    pending_empty = 0
+                    yield f"\nSheet: {elem.get(TABLE + 'name', '')}"
+                else:
+                    self._release(elem, ancestors)
+            elif event == 'end' and elem.tag == TABLE + 'table-row':
+                room = None if self.max_rows is None else self.max_rows - rows_emitted
+                if room is not None and room <= 0:
+                    self._release(elem, ancestors)
+                    continue
+                repeat = int(elem.get(TABLE + 'number-rows-repeated', '1'))
+                cells = self._ods_row_cells(elem)
+                self._release(elem, ancestors)
+                if not cells:
+                    pending_empty += repeat
+                    continue
+                lines = itertools.chain(itertools.repeat('', pending_empty),
+                                        itertools.repeat('\t'.join(cells), repeat))
+                for line in itertools.islice(lines, room):
+                    rows_emitted += 1
+                    yield line
+                pending_empty = 0
+
+    def _ods_row_cells(self, row: ElementTree.Element) -> List[str]:
+        """Satırdaki hücre metinlerini tekrarları açarak, sondaki boş hücreleri atarak döndürür"""
+        cells: List[str] = []
+        pending_empty = 0
+        for cell in row:
+            if cell.tag not in ODF_CELLS:
+                continue
+            repeat = int(cell.get(TABLE + 'number-columns-repeated', '1'))
+            value = '\n'.join(self._odf_text(p) for p in cell if p.tag in ODF_PARAGRAPHS)
+            if not value:
+                # Boş tekrarlar (genelde satırın sonuna kadar) ancak arkalarından dolu hücre gelirse açılır
+                pending_empty += repeat
+                continue
+            if self.max_columns is not None:
+                room = self.max_columns - len(cells) - pending_empty
+                if room <= 0:
+                    break
+                repeat = min(repeat, room)
+            cells.extend([''] * pending_empty)
+            cells.extend([value] * repeat)
+            pending_empty = 0
+        return cells
@@ -1,17 +1,203 @@
-from typing import Optional
-from pdfminer.high_level import extract_text
+import io
+import multiprocessing
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, BinaryIO, Dict, Iterator, List, Optional, Set
+# pdfminer ilk PDF dosyası görüldüğünde içe aktarılır
 from .base_extractor import BaseExtractor
+from ..utils.file_probe import FileProbe
+from ..utils.file_utils import FileUtils
 from ..utils.logger import logger
 
+
+def _extract_page_range(file_path: str, start: int, end: int, laparams: Optional[Dict[str, Any]],
+                        layout_analysis: bool) -> List[str]:
+    """
+    Worker sürecinde PDF'in [start, end) aralığındaki sayfaların metnini çıkarır
+
+    Args:
+        file_path (str): PDF dosyasının yolu
+        start (int): İlk sayfa (0'dan başlar)
+        end (int): Son sayfadan bir sonrası
+        laparams (Optional[Dict[str, Any]]): LAParams argümanları
+        layout_analysis (bool): Yerleşim analizi yapılsın mı
+
+    Returns:
+        List[str]: Sayfa metinleri
+    """
+    extractor = PDFExtractor(laparams=laparams, layout_analysis=layout_analysis)
+    with open(file_path, 'rb') as source:
+        return list(extractor._iter_pages(source, range(start, end), end))
+
+
 class PDFExtractor(BaseExtractor):
+    # Desteklenen PDF dosyası uzantıları
+    SUPPORTED_EXTENSIONS: Set[str] = {'.pdf'}
+    # Uzantısız PDF dosyalarını tanımak için imza
+    MAGIC_SIGNATURES: Set[bytes] = {b'%PDF'}
+    # Sayfalar bittikçe yazılabilir
+    SUPPORTS_STREAMING: bool = True
+    # Her page worker için aynı anda kuyrukta bekleyebilecek sayfa aralığı sayısı
+    PENDING_RANGES_PER_WORKER: int = 2
+
+    def __init__(self, max_pages: Optional[int] = None, laparams: Optional[Dict[str, Any]] = None,
+                 layout_analysis: bool = True, page_workers: int = 1, pages_per_task: int = 50):
+        """
+        PDFExtractor sınıfının başlatıcısı
+
+        Metin pdfminer'ın extract_text ile aynı dönüştürücüyle, sayfa sayfa çıkarılır.
+        page_workers > 1 ise pages_per_task'tan uzun belgelerin sayfa aralıkları
+        süreç havuzuna dağıtılır; sayfalar yine belge sırasıyla üretilir.
+
+        Args:
+            max_pages (Optional[int]): Okunacak en fazla sayfa sayısı (None ise tamamı)
+            laparams (Optional[Dict[str, Any]]): pdfminer LAParams argümanları (None ise varsayılanlar)
+            layout_analysis (bool): False ise yerleşim analizi atlanır (daha hızlı, sıra daha kaba)
+            page_workers (int): Tek bir PDF'in sayfalarını işleyecek süreç sayısı
+            pages_per_task (int): Bir worker'a tek seferde verilen sayfa sayısı
+        """
+        self.max_pages = max_pages
+        self.laparams = laparams
+        self.layout_analysis = layout_analysis
+        self.page_workers = max(1, page_workers)
+        self.pages_per_task = max(1, pages_per_task)
+
     def can_handle(self, file_path: str) -> bool:
         """Dosya uzantısının PDF olup olmadığını kontrol eder"""
-        return file_path.lower().endswith('.pdf')
+        return FileUtils.get_extension(file_path) == '.pdf'
 
-    def extract_text(self, file_path: str) -> Optional[str]:
+    def extract_text(self, file_path: str, probe: Optional[FileProbe] = None) -> Optional[str]:
         """PDF dosyasından text çıkarır"""
         try:
-            return extract_text(file_path)
+            return ''.join(self._iter_document(file_path, probe)) or None
         except Exception as e:
             logger.error(f"PDF okuma hatası {file_path}: {str(e)}")
-            return None
\ No newline at end of file
+            return None
+
+    def iter_text(self, file_path: str, probe: Optional[FileProbe] = None) -> Iterator[str]:
+        """
+        PDF dosyasının metnini sayfa sayfa üretir
+
+        Args:
+            file_path (str): Dosya yolu
+            probe (Optional[FileProbe]): İçeriği bellekte olabilecek probe
+
+        Returns:
+            Iterator[str]: Boş olmayan sayfa metinleri (pdfminer'daki gibi '\\f' ile biter)
+        """
+        try:
+            yield from self._iter_document(file_path, probe)
+        except Exception as e:
+            logger.error(f"PDF okuma hatası {file_path}: {str(e)}")
+
+    def _iter_document(self, file_path: str, probe: Optional[FileProbe] = None) -> Iterator[str]:
+        """Belgeyi uzunluğuna ve ayarlara göre sıralı veya paralel işler"""
+        page_count = self._parallel_page_count(file_path)
+        if page_count:
+            yield from self._iter_pages_parallel(file_path, page_count)
+        elif probe is not None:
+            with probe.open_binary() as source:
+                yield from self._iter_pages(source, None, self.max_pages or 0)
+        else:
+            with open(file_path, 'rb') as source:
+                yield from self._iter_pages(source, None, self.max_pages or 0)
+
+    def _iter_pages(self, source: BinaryIO, page_numbers: Optional[range],
+                    maxpages: int) -> Iterator[str]:
+        """
+        Sayfaları sırayla işler ve her sayfanın metnini üretir
+
+        Args:
+            source (BinaryIO): PDF içeriği
+            page_numbers (Optional[range]): İşlenecek sayfalar (None ise tamamı)
+            maxpages (int): Bu sayfa numarasından sonra dur (0 ise sınırsız)
+
+        Returns:
+            Iterator[str]: Boş olmayan sayfa metinleri
+        """
+        from pdfminer.converter import TextConverter
+        from pdfminer.layout import LAParams
+        from pdfminer.pdfinterp import PDFPageInterpreter, PDFResourceManager
+        from pdfminer.pdfpage import PDFPage
+
+        laparams = LAParams(**(self.laparams or {})) if self.layout_analysis else None
+        output = io.StringIO()
+        resource_manager = PDFResourceManager(caching=True)
+        device = TextConverter(resource_manager, output, codec='utf-8', laparams=laparams)
+        try:
+            interpreter = PDFPageInterpreter(resource_manager, device)
+            for page in PDFPage.get_pages(source, page_numbers, maxpages=maxpages, caching=True):
+                interpreter.process_page(page)
+                text = output.getvalue()
+                if text:
+                    output.seek(0)
+                    output.truncate()
+                    yield text
+        finally:
+            device.close()
+
+    def _parallel_page_count(self, file_path: str) -> Optional[int]:
+        """
+        Belge paralel işlenecekse işlenecek sayfa sayısını döndürür
+
+        Args:
+            file_path (str): Dosya yolu
+
+        Returns:
+            Optional[int]: Sayfa sayısı veya None (sıralı işlenecek)
+        """
+        if self.page_workers < 2 or not os.path.isfile(file_path):
+            return None
+        # Gözetimli alt süreç gibi daemon süreçler yeni süreç başlatamaz
+        if multiprocessing.current_process().daemon:
+            return None
+
+        page_count = self._count_pages(file_path)
+        if page_count is None:
+            return None
+        if self.max_pages:
+            page_count = min(page_count, self.max_pages)
+        return page_count if page_count > self.pages_per_task else None
+
+    def _count_pages(self, file_path: str) -> Optional[int]:
+        """Sayfa ağacındaki sayfa sayısını sayfaları işlemeden döndürür"""
+        from pdfminer.pdfdocument import PDFDocument
+        from pdfminer.pdfparser import PDFParser
+        from pdfminer.pdftypes import resolve1
+
+        try:
+            with open(file_path, 'rb') as source:
+                document = PDFDocument(PDFParser(source))
+                count = resolve1(document.catalog['Pages']).get('Count')
+                return int(count) if count is not None else None
+        except Exception as e:
+            logger.debug(f"PDF sayfa sayısı okunamadı {file_path}: {str(e)}")
+            return None
+
+    def _iter_pages_parallel(self, file_path: str, page_count: int) -> Iterator[str]:
+        """
+        Sayfa aralıklarını süreç havuzunda işler, sayfaları belge sırasıyla üretir
+
+        Args:
+            file_path (str): Dosya yolu
+            page_count (int): İşlenecek sayfa sayısı
+
+        Returns:
+            Iterator[str]: Boş olmayan sayfa metinleri
+        """
+        ranges = ((start, min(start + self.pages_per_task, page_count))
+                  for start in range(0, page_count, self.pages_per_task))
+        max_pending = self.page_workers * self.PENDING_RANGES_PER_WORKER
+        logger.debug(f"{file_path}: {page_count} sayfa {self.page_workers} süreçte işleniyor")
+
+        with ProcessPoolExecutor(max_workers=self.page_workers) as executor:
+            pending = deque()
+            for start, end in ranges:
+                pending.append(executor.submit(_extract_page_range, file_path, start, end,
+                                               self.laparams, self.layout_analysis))
+                # Bellek sınırlı kalsın diye bekleyen aralık sayısını sınırla
+                if len(pending) >= max_pending:
+                    yield from pending.popleft().result()
+            while pending:
+                yield from pending.popleft().result()
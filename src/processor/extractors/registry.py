@@ -0,0 +1,135 @@
+import os
+from typing import Any, Dict, List, Optional, Tuple, Type
+from .base_extractor import BaseExtractor
+from ..utils.file_probe import FileProbe
+from ..utils.file_utils import FileUtils
+from ..utils.logger import logger
+
+
+class ExtractorRegistry:
+    """Uzantıları önceden kaydeden, extractor'ları ilk ihtiyaçta oluşturan kayıt defteri"""
+
+    def __init__(self, magic_fallback: bool = True):
+        """
+        ExtractorRegistry sınıfının başlatıcısı
+
+        Kayıt sırasında yalnızca extractor sınıfının SUPPORTED_EXTENSIONS,
+        SUPPORTED_FILENAMES ve MAGIC_SIGNATURES kümeleri okunur. Extractor nesnesi
+        (ve arkasındaki ağır kütüphaneler) ancak eşleşen bir dosya ilk kez
+        görüldüğünde oluşturulur.
+
+        Args:
+            magic_fallback (bool): Uzantısız dosyalarda dosya imzasına göre eşleştir
+        """
+        self.magic_fallback = magic_fallback
+        self._classes: List[Type[BaseExtractor]] = []
+        self._options: Dict[Type[BaseExtractor], Dict[str, Any]] = {}
+        self._by_extension: Dict[str, Type[BaseExtractor]] = {}
+        self._by_filename: Dict[str, Type[BaseExtractor]] = {}
+        self._by_signature: List[Tuple[bytes, Type[BaseExtractor]]] = []
+        self._instances: Dict[Type[BaseExtractor], BaseExtractor] = {}
+
+    def register(self, extractor_class: Type[BaseExtractor], **options: Any) -> None:
+        """
+        Extractor sınıfını kaydeder; aynı uzantıyı önce kaydedilen sınıf üstlenir
+
+        Args:
+            extractor_class (Type[BaseExtractor]): Extractor sınıfı
+            **options: Extractor oluşturulurken verilecek argümanlar
+        """
+        self._classes.append(extractor_class)
+        self._options[extractor_class] = options
+        for ext in extractor_class.SUPPORTED_EXTENSIONS:
+            self._by_extension.setdefault(ext, extractor_class)
+        for name in extractor_class.SUPPORTED_FILENAMES:
+            self._by_filename.setdefault(name, extractor_class)
+        for signature in extractor_class.MAGIC_SIGNATURES:
+            self._by_signature.append((signature, extractor_class))
+
+    def get(self, extractor_class: Type[BaseExtractor]) -> BaseExtractor:
+        """
+        Extractor nesnesini döndürür, ilk çağrıda oluşturur
+
+        Args:
+            extractor_class (Type[BaseExtractor]): Extractor sınıfı
+
+        Returns:
+            BaseExtractor: Sürece özel tek extractor nesnesi
+        """
+        extractor = self._instances.get(extractor_class)
+        if extractor is None:
+            logger.debug(f"{extractor_class.__name__} yükleniyor")
+            extractor = extractor_class(**self._options[extractor_class])
+            self._instances[extractor_class] = extractor
+        return extractor
+
+    def class_for_path(self, file_path: str,
+                       probe: Optional[FileProbe] = None) -> Optional[Type[BaseExtractor]]:
+        """
+        Dosyaya karşılık gelen extractor sınıfını, nesne oluşturmadan döndürür
+
+        Önce uzantı, sonra dosya adı (Makefile gibi) tek sözlük aramasıyla denenir.
+        Uzantısız dosyalarda probe verilmişse dosya imzasına bakılır.
+
+        Args:
+            file_path (str): Dosya yolu
+            probe (Optional[FileProbe]): Uzantısı önceden hesaplanmış probe
+
+        Returns:
+            Optional[Type[BaseExtractor]]: Extractor sınıfı veya None
+        """
+        if probe is not None:
+            ext, name = probe.extension, probe.name
+        else:
+            ext, name = FileUtils.get_extension(file_path), os.path.basename(file_path).lower()
+
+        extractor_class = self._by_extension.get(ext) if ext else None
+        if extractor_class is None:
+            extractor_class = self._by_filename.get(name)
+        if extractor_class is None and not ext and probe is not None and self.magic_fallback:
+            extractor_class = self._class_for_signature(probe)
+        return extractor_class
+
+    def _class_for_signature(self, probe: FileProbe) -> Optional[Type[BaseExtractor]]:
+        """Dosyanın baş kısmındaki imzaya karşılık gelen extractor sınıfını döndürür"""
+        if not self._by_signature or probe.size == 0:
+            return None
+        head = probe.head
+        for signature, extractor_class in self._by_signature:
+            if head.startswith(signature):
+                return extractor_class
+        return None
+
+    def supports(self, file_path: str, probe: Optional[FileProbe] = None) -> bool:
+        """
+        Dosya için kayıtlı bir extractor olup olmadığını, extractor'ı oluşturmadan döndürür
+
+        Args:
+            file_path (str): Dosya yolu
+            probe (Optional[FileProbe]): Uzantısı önceden hesaplanmış probe
+
+        Returns:
+            bool: Destekleniyorsa True
+        """
+        return self.class_for_path(file_path, probe) is not None
+
+    def for_path(self, file_path: str, probe: Optional[FileProbe] = None) -> Optional[BaseExtractor]:
+        """
+        Dosyayı işleyecek extractor'ı döndürür
+
+        Args:
+            file_path (str): Dosya yolu
+            probe (Optional[FileProbe]): Uzantısı önceden hesaplanmış probe
+
+        Returns:
+            Optional[BaseExtractor]: Extractor veya None
+        """
+        extractor_class = self.class_for_path(file_path, probe)
+        if extractor_class is None:
+            return None
+        return self.get(extractor_class)
+
+    @property
+    def loaded(self) -> List[BaseExtractor]:
+        """Şimdiye kadar oluşturulmuş extractor'ları kayıt sırasıyla döndürür"""
+        return [self._instances[cls] for cls in self._classes if cls in self._instances]
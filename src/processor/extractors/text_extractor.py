@@ -1,6 +1,11 @@
-import chardet
-from typing import Optional, Set
+import codecs
+import mmap
+import os
+import time
+from typing import Dict, Iterator, List, Optional, Set, Tuple, Union
 from .base_extractor import BaseExtractor
+from ..utils.file_probe import FileProbe
+from ..utils.file_utils import FileUtils
 from ..utils.logger import logger
 
 class TextExtractor(BaseExtractor):
@@ -18,31 +23,300 @@ class TextExtractor(BaseExtractor):
         '.csproj', '.env', '.gitignore', '.editorconfig'
     }
 
+    # Uzantısı olmayan metin dosyaları
+    SUPPORTED_FILENAMES: Set[str] = {
+        'makefile', 'gnumakefile', 'dockerfile', 'containerfile', 'jenkinsfile',
+        'vagrantfile', 'gemfile', 'rakefile', 'procfile', 'brewfile',
+        'readme', 'license', 'copying', 'authors', 'changelog', 'notice'
+    }
+
+    # BOM imzaları (UTF-32 imzaları UTF-16 imzalarını kapsadığı için önce kontrol edilir)
+    BOMS: List[Tuple[bytes, str]] = [
+        (codecs.BOM_UTF32_LE, 'utf-32'),
+        (codecs.BOM_UTF32_BE, 'utf-32'),
+        (codecs.BOM_UTF8, 'utf-8-sig'),
+        (codecs.BOM_UTF16_LE, 'utf-16'),
+        (codecs.BOM_UTF16_BE, 'utf-16'),
+    ]
+
+    # chardet'e verilecek varsayılan örnek boyutu (byte)
+    DEFAULT_SAMPLE_BYTES: int = 64 * 1024
+    # UniversalDetector'a tek seferde verilen parça boyutu (byte)
+    DETECTOR_CHUNK_SIZE: int = 4096
+
+    # Metin dosyasında beklenmeyen kontrol baytları (\t, \n ve \r hariç)
+    CONTROL_BYTES: bytes = bytes(b for b in range(32) if b not in (9, 10, 13))
+    # Aynı karakterleri str üzerinde silmek için çeviri tablosu
+    CONTROL_CHAR_TABLE: Dict[int, None] = dict.fromkeys(CONTROL_BYTES)
+    # Kontrol karakteri oranı bunu aşarsa dosya binary sayılır
+    DEFAULT_CONTROL_THRESHOLD: float = 0.01
+    # Kontrol karakteri taraması parça boyutu (ek bellek bununla sınırlı kalır)
+    SCAN_CHUNK_SIZE: int = 1024 * 1024
+
+    # Büyük dosyalar mmap ile açılıp parça parça çözülebilir
+    SUPPORTS_STREAMING: bool = True
+    # Akış modunda tek seferde çözülen bayt sayısı
+    STREAM_CHUNK_SIZE: int = 1024 * 1024
+
+    def __init__(self, sample_bytes: int = DEFAULT_SAMPLE_BYTES,
+                 control_threshold: float = DEFAULT_CONTROL_THRESHOLD):
+        """
+        TextExtractor sınıfının başlatıcısı
+
+        Args:
+            sample_bytes (int): Kodlama UTF-8 değilse chardet'e verilecek en fazla bayt
+            control_threshold (float): İzin verilen kontrol karakteri oranı (0 ise hiç izin verilmez)
+        """
+        self.sample_bytes = sample_bytes
+        self.control_threshold = control_threshold
+        # Son tespitin sonucu: (kodlama, yöntem, süre saniye)
+        self.last_detection: Optional[Tuple[str, str, float]] = None
+
+    @property
+    def last_encoding(self) -> Optional[str]:
+        """Son tespit edilen kodlamayı döndürür"""
+        return self.last_detection[0] if self.last_detection else None
+
+    @property
+    def last_encoding_seconds(self) -> float:
+        """Son kodlama tespitinin süresini döndürür"""
+        return self.last_detection[2] if self.last_detection else 0.0
+
     def can_handle(self, file_path: str) -> bool:
-        """Dosya uzantısının desteklenip desteklenmediğini kontrol eder"""
-        ext = file_path.lower().split('.')[-1] if '.' in file_path else ''
-        return f'.{ext}' in self.SUPPORTED_EXTENSIONS
+        """Dosya uzantısının veya adının desteklenip desteklenmediğini kontrol eder"""
+        name = os.path.basename(file_path).lower()
+        return FileUtils.get_extension(name) in self.SUPPORTED_EXTENSIONS or name in self.SUPPORTED_FILENAMES
 
-    def detect_encoding(self, file_path: str) -> str:
-        """Dosyanın karakter kodlamasını tespit eder"""
+    def detect_encoding(self, file_path: str, raw_data: Optional[Union[bytes, mmap.mmap]] = None) -> str:
+        """
+        Dosyanın karakter kodlamasını kademeli olarak tespit eder
+        
+        Sırasıyla BOM, saf ASCII ve katı UTF-8 çözümü denenir. Bunlar tutmazsa
+        chardet yalnızca sınırlı bir örnek üzerinde, emin olduğu anda duracak
+        şekilde çalıştırılır. Sonuç ve kullanılan yöntem dosya bazında loglanır.
+        
+        Args:
+            file_path (str): Dosya yolu
+            raw_data (Optional[Union[bytes, mmap.mmap]]): Önceden okunmuş veya eşlenmiş içerik
+                (verilirse dosya tekrar okunmaz)
+            
+        Returns:
+            str: Kodlama adı
+        """
+        start = time.perf_counter()
         try:
-            with open(file_path, 'rb') as file:
-                raw_data = file.read()
-                result = chardet.detect(raw_data)
-                return result['encoding'] if result['encoding'] else 'utf-8'
+            if raw_data is None:
+                with open(file_path, 'rb') as file:
+                    raw_data = file.read()
+            encoding, method = self._detect(raw_data)
         except Exception:
-            return 'utf-8'
+            encoding, method = 'utf-8', 'default'
+
+        elapsed = time.perf_counter() - start
+        self.last_detection = (encoding, method, elapsed)
+        if method == 'chardet':
+            logger.info(f"Kodlama chardet ile tespit edildi {file_path}: {encoding} ({elapsed * 1000:.1f}ms)")
+        else:
+            logger.debug(f"Kodlama tespit edildi {file_path}: {encoding} ({method})")
+        return encoding
+
+    def _detect(self, raw_data: Union[bytes, mmap.mmap]) -> Tuple[str, str]:
+        """
+        Kodlamayı ve tespitte kullanılan yöntemi döndürür
+        
+        Args:
+            raw_data (Union[bytes, mmap.mmap]): Dosya içeriği
+            
+        Returns:
+            Tuple[str, str]: (kodlama, yöntem) - yöntem: bom, ascii, utf-8 veya chardet
+        """
+        head = raw_data[:4]
+        for bom, encoding in self.BOMS:
+            if head.startswith(bom):
+                return encoding, 'bom'
+
+        if isinstance(raw_data, bytes) and raw_data.isascii():
+            return 'utf-8', 'ascii'
+
+        error_offset = self._find_utf8_error(raw_data)
+        if error_offset is None:
+            return 'utf-8', 'utf-8'
+        # Örneği ilk geçersiz baytın çevresinden al, ASCII başlık chardet'i yanıltmasın
+        sample_start = max(0, error_offset - self.sample_bytes // 4)
 
-    def extract_text(self, file_path: str) -> Optional[str]:
+        # chardet yalnızca UTF-8 olmayan bir dosya ilk görüldüğünde içe aktarılır
+        from chardet.universaldetector import UniversalDetector
+        detector = UniversalDetector()
+        sample_end = min(len(raw_data), sample_start + self.sample_bytes)
+        for offset in range(sample_start, sample_end, self.DETECTOR_CHUNK_SIZE):
+            detector.feed(raw_data[offset:min(offset + self.DETECTOR_CHUNK_SIZE, sample_end)])
+            if detector.done:
+                break
+        detector.close()
+
+        encoding = detector.result['encoding']
+        # Örnek saf ASCII çıkarsa tam içerik yine de UTF-8 değildir
+        if not encoding or encoding.lower() == 'ascii':
+            encoding = 'windows-1252'
+        return encoding, 'chardet'
+
+    def _find_utf8_error(self, raw_data: Union[bytes, mmap.mmap]) -> Optional[int]:
+        """
+        İçeriği parça parça katı UTF-8 ile çözerek ilk geçersiz baytın konumunu bulur
+        
+        Args:
+            raw_data (Union[bytes, mmap.mmap]): Dosya içeriği
+            
+        Returns:
+            Optional[int]: İlk geçersiz baytın yaklaşık konumu, içerik geçerliyse None
+        """
+        decoder = codecs.getincrementaldecoder('utf-8')()
+        size = len(raw_data)
+        for offset in range(0, size, self.SCAN_CHUNK_SIZE):
+            end = offset + self.SCAN_CHUNK_SIZE
+            try:
+                decoder.decode(raw_data[offset:end], final=end >= size)
+            except UnicodeDecodeError as e:
+                return offset + e.start
+        return None
+
+    @classmethod
+    def count_control_chars(cls, data: Union[bytes, str], limit: Optional[int] = None) -> int:
+        """
+        Kontrol karakterlerini parça parça, C seviyesindeki translate ile sayar
+        
+        Args:
+            data (Union[bytes, str]): Ham içerik (ASCII uyumlu kodlama) veya çözülmüş metin
+            limit (Optional[int]): Sayı bu değeri aşınca taramayı erken bitir
+            
+        Returns:
+            int: Bulunan kontrol karakteri sayısı (erken bittiyse en az limit + 1)
+        """
+        count = 0
+        for offset in range(0, len(data), cls.SCAN_CHUNK_SIZE):
+            chunk = data[offset:offset + cls.SCAN_CHUNK_SIZE]
+            if isinstance(chunk, str):
+                count += len(chunk) - len(chunk.translate(cls.CONTROL_CHAR_TABLE))
+            else:
+                count += len(chunk) - len(chunk.translate(None, cls.CONTROL_BYTES))
+            if limit is not None and count > limit:
+                break
+        return count
+
+    def has_binary_content(self, data: Union[bytes, str]) -> bool:
+        """
+        Kontrol karakteri oranının eşiği aşıp aşmadığını döndürür
+        
+        Args:
+            data (Union[bytes, str]): Ham içerik (ASCII uyumlu kodlama) veya çözülmüş metin
+            
+        Returns:
+            bool: Eşik aşıldıysa True
+        """
+        limit = int(len(data) * self.control_threshold)
+        return self.count_control_chars(data, limit) > limit
+
+    @staticmethod
+    def is_ascii_compatible(encoding: str) -> bool:
+        """ASCII aralığındaki baytların kodlamada aynı karakterlere karşılık gelip gelmediğini döndürür"""
+        return not codecs.lookup(encoding).name.startswith(('utf-16', 'utf-32'))
+
+    def iter_text(self, file_path: str, probe: Optional[FileProbe] = None) -> Iterator[str]:
+        """
+        Dosyayı mmap ile açar ve artımlı çözücüyle parça parça metin üretir
+        
+        Çözülmüş metnin tamamı hiçbir zaman bellekte tutulmaz. Kodlama tespiti ve
+        kontrol karakteri taraması parça parça yapılır, ilk parça ancak bunlar
+        geçildikten sonra üretilir.
+        
+        Args:
+            file_path (str): Dosya yolu
+            probe (Optional[FileProbe]): Kullanılmaz, arayüz uyumluluğu için
+            
+        Returns:
+            Iterator[str]: Metin parçaları
+        """
+        try:
+            with open(file_path, 'rb') as file:
+                if os.fstat(file.fileno()).st_size == 0:
+                    return
+                with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    encoding = self.detect_encoding(file_path, mapped)
+                    if self.is_ascii_compatible(encoding):
+                        binary = self.has_binary_content(mapped)
+                    else:
+                        binary = self._has_binary_decoded(mapped, encoding)
+                    if binary:
+                        logger.warning(f"{file_path} binary içerik içeriyor olabilir.")
+                        return
+                    yield from self._decode_chunks(mapped, encoding)
+        except Exception as e:
+            logger.error(f"Text okuma hatası {file_path}: {str(e)}")
+
+    def _decode_chunks(self, mapped: mmap.mmap, encoding: str) -> Iterator[str]:
+        """
+        Eşlenmiş içeriği artımlı çözücüyle çözer, satır sonlarını '\n'e çevirir
+        
+        Args:
+            mapped (mmap.mmap): Eşlenmiş dosya içeriği
+            encoding (str): Kodlama adı
+            
+        Returns:
+            Iterator[str]: Boş olmayan metin parçaları
+        """
+        decoder = codecs.getincrementaldecoder(encoding)(errors='replace')
+        size = len(mapped)
+        carry = ''
+        for offset in range(0, size, self.STREAM_CHUNK_SIZE):
+            end = offset + self.STREAM_CHUNK_SIZE
+            text = carry + decoder.decode(mapped[offset:end], final=end >= size)
+            # Parça sonundaki '\r' bir sonraki parçanın '\n'i ile birleşebilir
+            carry = '\r' if text.endswith('\r') else ''
+            if carry:
+                text = text[:-1]
+            text = text.replace('\r\n', '\n').replace('\r', '\n')
+            if text:
+                yield text
+        if carry:
+            yield '\n'
+
+    def _has_binary_decoded(self, mapped: mmap.mmap, encoding: str) -> bool:
+        """ASCII uyumlu olmayan kodlamalarda kontrol karakteri oranını çözülmüş metin üzerinden hesaplar"""
+        length = 0
+        count = 0
+        for text in self._decode_chunks(mapped, encoding):
+            length += len(text)
+            count += self.count_control_chars(text)
+        return count > int(length * self.control_threshold)
+
+    def extract_text(self, file_path: str, probe: Optional[FileProbe] = None) -> Optional[str]:
         """Dosyadan text çıkarır"""
         try:
-            encoding = self.detect_encoding(file_path)
-            with open(file_path, 'r', encoding=encoding) as file:
-                content = file.read()
-                if any(ord(c) < 32 and c not in '\n\r\t' for c in content):
-                    logger.warning(f"{file_path} binary içerik içeriyor olabilir.")
-                    return None
-                return content
+            if probe is not None and probe.complete:
+                raw_data = probe.data
+            else:
+                with open(file_path, 'rb') as file:
+                    raw_data = file.read()
+
+            encoding = self.detect_encoding(file_path, raw_data)
+            # ASCII uyumlu kodlamalarda kontrol baytları çözmeden ham veride aranır
+            ascii_compatible = self.is_ascii_compatible(encoding)
+            if ascii_compatible and self.has_binary_content(raw_data):
+                logger.warning(f"{file_path} binary içerik içeriyor olabilir.")
+                return None
+
+            try:
+                content = raw_data.decode(encoding)
+            except UnicodeDecodeError:
+                # Örnekten tespit edilen kodlama dosyanın tamamına uymuyor
+                logger.warning(f"{file_path} {encoding} ile çözülemedi, geçersiz baytlar değiştirildi.")
+                content = raw_data.decode(encoding, errors='replace')
+            # Metin modunda okumadaki gibi satır sonlarını '\n'e çevir
+            content = content.replace('\r\n', '\n').replace('\r', '\n')
+            if not ascii_compatible and self.has_binary_content(content):
+                logger.warning(f"{file_path} binary içerik içeriyor olabilir.")
+                return None
+            return content
         except Exception as e:
             logger.error(f"Text okuma hatası {file_path}: {str(e)}")
             return None
\ No newline at end of file
@@ -1,142 +1,964 @@
+import hashlib
 import os
-from typing import List, Set, Dict, Optional
-from .extractors.base_extractor import BaseExtractor
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.connection import Connection
+from typing import Any, List, Set, Dict, Optional, Iterable, Iterator, Tuple, Type, Union
+from .extractors.registry import ExtractorRegistry
 from .extractors.text_extractor import TextExtractor
 from .extractors.office_extractor import OfficeExtractor
 from .extractors.pdf_extractor import PDFExtractor
 from .extractors.model_extractor import ModelExtractor
+from .writers.base_writer import BaseWriter
+from .writers.text_writer import TextWriter
+from .writers.jsonl_writer import JSONLWriter
+from .writers.parquet_writer import ParquetWriter
+from .writers.incremental_writer import IncrementalWriter
+from .utils.archive_reader import ArchiveReader
+from .utils.checkpoint import Checkpoint
+from .utils.deduplicator import ContentDeduplicator
+from .utils.directory_scanner import DirectoryScanner, ScanEntry
+from .utils.extraction_cache import ExtractionCache
+from .utils.extraction_record import ExtractionRecord
+from .utils.file_probe import FileProbe
 from .utils.file_utils import FileUtils
+from .utils.manifest import OutputManifest
+from .utils.metrics import PipelineMetrics
+from .utils.prefetcher import Prefetcher
+from .utils.quarantine import Quarantine
+from .utils.streamed_content import StreamedContent
+from .utils.supervisor import ExtractionLimitError, ExtractionSupervisor
 from .utils.logger import logger
 
+# İşlenmiş içerik: biçimlendirilmiş metin, yazılırken parça parça üretilen kayıt
+# veya yapılandırılmış çıktı biçimleri için üst verili kayıt
+Content = Union[str, StreamedContent, ExtractionRecord]
+# Worker sonucu: (dosya yolu, içerik, hata, süre, hata verdiyse stat sonucu)
+WorkerResult = Tuple[str, Optional[Content], Optional[str], float, Optional[os.stat_result]]
+
+# Worker süreçlerinde bir kez oluşturulan işlemci (extractor'lar dahil)
+_worker_processor: Optional["FileProcessor"] = None
+
+
+def _init_worker(options: Dict[str, Any]) -> None:
+    """Worker sürecini başlatır, extractor'lar her worker'da yalnızca bir kez oluşturulur"""
+    global _worker_processor
+    _worker_processor = FileProcessor(**options)
+    # Akış kaydı ana süreçte tüketilirken çıkarılırdı; büyük dosyalar worker'da tamamen çıkarılır
+    _worker_processor.streaming = False
+    # Worker'lar karantinadaki arşiv üyelerini atlamak için listeyi okur, listeyi ana süreç yazar
+    if _worker_processor.quarantine is not None:
+        _worker_processor.quarantine.read_only = True
+
+
+def _process_batch_in_worker(
+        entries: List[ScanEntry], duplicates: Dict[str, str]
+) -> Tuple[List[WorkerResult], Dict[str, Any]]:
+    """
+    Worker sürecinde bir grup dosyayı işler
+
+    Args:
+        entries (List[ScanEntry]): (dosya yolu, stat sonucu) çiftleri
+        duplicates (Dict[str, str]): Ana süreçte tekrar olduğu anlaşılan dosyalar ve ilk kopyaları
+
+    Returns:
+        Tuple[List[WorkerResult], Dict[str, Any]]: Dosya ve üye sonuçları ile ana sürece
+            aktarılacak sayaçlar ve ölçümler
+    """
+    results = []
+    for probe in _worker_processor._iter_probes(entries):
+        start = time.perf_counter()
+        for entry_path, entry_probe, content in _worker_processor._process_path(
+                probe.path, probe, duplicates.get(probe.path)):
+            error = _worker_processor.error_files.pop(entry_path, None)
+            # Tekrar kontrolü ana süreçte yapılır, worker'da küme büyümesin
+            _worker_processor.processed_files.discard(entry_path)
+            # Arşiv üyelerinin stat sonucu ana süreçte alınamaz, karantina için gönderilir
+            stat_result = entry_probe.stat if error is not None and entry_probe is not None else None
+            results.append((entry_path, content, error, time.perf_counter() - start, stat_result))
+            start = time.perf_counter()
+    return results, _worker_processor._take_worker_counters()
+
+
+def _run_supervised_extractor(conn: Connection, options: Dict[str, Any]) -> None:
+    """
+    Gözetimli alt süreçte dosya yollarını alır, çıkarılan metni geri gönderir
+
+    Args:
+        conn (Connection): Ana süreçle bağlantı; (dosya yolu, bellekteki içerik) alır,
+            None alındığında döngü biter
+        options (Dict[str, Any]): FileProcessor başlatıcı argümanları
+    """
+    processor = FileProcessor(**options)
+    while True:
+        try:
+            request = conn.recv()
+        except EOFError:
+            break
+        if request is None:
+            break
+        file_path, data = request
+        try:
+            if data is not None:
+                probe = FileProbe.from_bytes(file_path, data)
+            else:
+                probe = processor._probe(file_path)
+            extractor = processor.registry.for_path(file_path, probe)
+            conn.send(('ok', extractor.extract_text(file_path, probe) if extractor else None))
+        except MemoryError:
+            conn.send(('memory', None))
+        except Exception as e:
+            conn.send(('error', str(e)))
+
+
 class FileProcessor:
-    def __init__(self, max_file_size_mb: float = 5.0, output_file: str = "merged_content.txt"):
+    # Her worker için aynı anda kuyrukta bekleyebilecek grup sayısı
+    PENDING_BATCHES_PER_WORKER: int = 4
+    # format_content çıktısı değiştiğinde artırılır (artımlı çıktı baştan oluşturulur)
+    FORMAT_VERSION: int = 1
+    # output_format değerleri ve yazıcıları
+    OUTPUT_WRITERS: Dict[str, Type[BaseWriter]] = {
+        'text': TextWriter,
+        'jsonl': JSONLWriter,
+        'parquet': ParquetWriter,
+    }
+
+    def __init__(self, max_file_size_mb: float = 5.0, output_file: str = "merged_content.txt",
+                 workers: int = 1, batch_size: int = 16,
+                 write_buffer_size: int = TextWriter.DEFAULT_BUFFER_SIZE,
+                 cache_file: Optional[str] = None, cache_max_size_mb: Optional[float] = None,
+                 cache_max_age_days: Optional[float] = None, cache_use_hash: bool = False,
+                 incremental: bool = False, compact_ratio: float = 0.25,
+                 encoding_sample_bytes: int = TextExtractor.DEFAULT_SAMPLE_BYTES,
+                 control_char_threshold: float = TextExtractor.DEFAULT_CONTROL_THRESHOLD,
+                 stream_threshold_mb: float = 64.0, magic_fallback: bool = True,
+                 file_timeout: Optional[float] = None, file_memory_limit_mb: Optional[float] = None,
+                 quarantine_file: Optional[str] = None, pdf_max_pages: Optional[int] = None,
+                 pdf_laparams: Optional[Dict[str, Any]] = None, pdf_layout_analysis: bool = True,
+                 pdf_page_workers: int = 1, pdf_pages_per_task: int = 50,
+                 spreadsheet_max_rows: Optional[int] = None,
+                 spreadsheet_max_columns: Optional[int] = None,
+                 office_xml_formats: Optional[Iterable[str]] = None,
+                 array_preview_items: int = 5, array_max_scan_mb: Optional[float] = None,
+                 archives: bool = False, archive_max_depth: int = 3,
+                 archive_max_total_mb: Optional[float] = 1024.0,
+                 include: Optional[Iterable[str]] = None, exclude: Optional[Iterable[str]] = None,
+                 exclude_file: Optional[str] = None,
+                 prune_dirs: Iterable[str] = DirectoryScanner.DEFAULT_PRUNE_DIRS,
+                 prefetch_threads: int = 2, dedup: bool = False, output_format: str = 'text',
+                 output_compression: Optional[str] = None, output_compression_level: Optional[int] = None,
+                 shard_size_mb: Optional[float] = None, metrics_file: Optional[str] = None,
+                 prometheus_file: Optional[str] = None,
+                 metrics_top_n: int = PipelineMetrics.DEFAULT_TOP_N,
+                 checkpoint_file: Optional[str] = None, checkpoint_interval: float = 60.0):
         """
         FileProcessor sınıfının başlatıcısı
         
         Args:
             max_file_size_mb (float): İşlenecek maksimum dosya boyutu (MB)
             output_file (str): Çıktı dosyasının adı
+            workers (int): Paralel çalışacak süreç sayısı (1 ise sıralı işlenir)
+            batch_size (int): Paralel modda bir worker'a tek seferde gönderilen dosya sayısı
+            write_buffer_size (int): Çıktı yazma tamponunun boyutu (byte)
+            cache_file (Optional[str]): Çıkarım önbelleği için SQLite dosyası (None ise kapalı)
+            cache_max_size_mb (Optional[float]): Önbellekte tutulacak toplam metin boyutu (MB)
+            cache_max_age_days (Optional[float]): Erişilmeyen önbellek kayıtlarının ömrü (gün)
+            cache_use_hash (bool): Önbellek anahtarına dosya içeriğinin hash'ini de kat
+            incremental (bool): Çıktıyı yalnızca değişen dosyalar için yerinde güncelle
+            compact_ratio (float): Artımlı modda çıktının sıkıştırılacağı boş bayt oranı
+            encoding_sample_bytes (int): Kodlama UTF-8 değilse chardet'e verilecek en fazla bayt
+            control_char_threshold (float): Metin dosyalarında izin verilen kontrol karakteri oranı
+            stream_threshold_mb (float): Bu boyutu aşan dosyalar belleğe alınmadan parça parça yazılır (MB);
+                file_timeout veya file_memory_limit_mb verilmişse ya da workers > 1 ise akış kullanılmaz
+            magic_fallback (bool): Uzantısız dosyaların formatını dosya imzasından tanı
+            file_timeout (Optional[float]): Dosya başına çıkarım süresi sınırı (saniye)
+            file_memory_limit_mb (Optional[float]): Çıkarım sürecinin kullanabileceği en fazla bellek (MB);
+                bu sınır veya file_timeout verildiğinde tüm dosyalar (büyükler dahil) gözetimli alt süreçte çıkarılır
+            quarantine_file (Optional[str]): Sınırı aşan dosyaların kaydedileceği JSON dosyası;
+                listedeki dosyalar değişmedikçe sonraki çalışmalarda atlanır
+            pdf_max_pages (Optional[int]): PDF başına okunacak en fazla sayfa sayısı
+            pdf_laparams (Optional[Dict[str, Any]]): pdfminer LAParams argümanları (ör. {'boxes_flow': None})
+            pdf_layout_analysis (bool): False ise PDF yerleşim analizi atlanır (daha hızlı)
+            pdf_page_workers (int): Uzun bir PDF'in sayfa aralıklarını işleyecek süreç sayısı
+            pdf_pages_per_task (int): Bir sayfa worker'ına tek seferde verilen sayfa sayısı
+            spreadsheet_max_rows (Optional[int]): XLSX/XLS sayfası başına okunacak en fazla satır
+            spreadsheet_max_columns (Optional[int]): XLSX/XLS satırı başına okunacak en fazla sütun
+            office_xml_formats (Optional[Iterable[str]]): Nesne modeli kurmadan doğrudan XML akışıyla
+                okunacak formatlar ('.docx', '.pptx', '.odt'); '.ods' ve '.odp' her zaman böyle okunur
+            array_preview_items (int): .npy/.npz dizilerinin başından ve sonundan gösterilecek eleman sayısı
+            array_max_scan_mb (Optional[float]): Dizi istatistikleri için taranacak en fazla veri (MB);
+                daha büyük dizilerde eşit aralıklı parçalardan örneklenir (None ise tamamı taranır)
+            archives (bool): ZIP/TAR/GZ/BZ2/XZ arşivlerinin içindeki dosyaları da işle
+                (arsiv.zip!/klasor/dosya.py biçiminde raporlanır)
+            archive_max_depth (int): İç içe açılacak en fazla arşiv seviyesi
+            archive_max_total_mb (Optional[float]): Tek bir arşivden açılacak toplam veri (MB)
+            include (Optional[Iterable[str]]): Dizin taranırken yalnızca bu gitignore kalıplarına
+                uyan dosyalar işlenir (ör. ['*.py', 'docs/**'])
+            exclude (Optional[Iterable[str]]): Dizin taranırken atlanacak gitignore kalıpları;
+                uyan dizinlerin içine girilmez (ör. ['build/', '*.min.js'])
+            exclude_file (Optional[str]): Hariç tutma kalıplarının okunacağı .gitignore biçimli dosya
+            prune_dirs (Iterable[str]): Adı bunlardan biri olan dizinlerin içine girilmez
+                (varsayılan: .git, node_modules, venv vb.)
+            prefetch_threads (int): İşlenmekte olan dosyanın ardından gelen dosyaları önceden
+                okuyacak iş parçacığı sayısı (0 ise kapalı)
+            dedup (bool): Aynı içerikli dosyaların yalnızca ilk kopyasını çıkar, diğerleri için
+                ilk kopyayı gösteren kısa bir kayıt yaz (artımlı modda kullanılmaz); paralel
+                modda arşivlerin üyeleri ana süreçte sırayla işlenir
+            output_format (str): Çıktı biçimi: 'text' (başlıklı düz metin), 'jsonl' veya 'parquet'
+                (yol, boyut, MIME type, extractor, kodlama, süre ve metin alanlarıyla; parquet için
+                pyarrow gerekir). Artımlı mod yalnızca 'text' ile kullanılabilir.
+            output_compression (Optional[str]): 'text' ve 'jsonl' çıktısını yazarken akış halinde
+                sıkıştır: 'gzip' veya 'zstd' (zstandard gerekir); dosya adına .gz/.zst eklenir
+            output_compression_level (Optional[int]): Sıkıştırma seviyesi (None ise gzip 6, zstd 3)
+            shard_size_mb (Optional[float]): Çıktıyı yaklaşık bu boyutta parçalara böl
+                (content-00001.txt.zst, ...); kayıtlar parçalar arasında bölünmez
+            metrics_file (Optional[str]): Aşama süreleri, extractor/uzantı bazında verim ve
+                gecikme yüzdelikleri ile en yavaş dosyaların yazılacağı JSON raporu
+            prometheus_file (Optional[str]): Aynı ölçümlerin Prometheus metin biçiminde yazılacağı
+                dosya (node_exporter textfile collector için, ör. textractor.prom)
+            metrics_top_n (int): Raporda listelenecek en yavaş dosya sayısı
+            checkpoint_file (Optional[str]): İlerlemenin düzenli olarak kaydedileceği JSON dosyası;
+                yarıda kalan çalışma aynı ayarlarla yeniden başlatılırsa tamamlanan dosyalar atlanır
+                ve çıktıya kaldığı yerden devam edilir ('text' ve 'jsonl' çıktısıyla)
+            checkpoint_interval (float): Kontrol noktaları arasındaki en kısa süre (saniye)
         """
+        if workers < 1:
+            raise ValueError("workers en az 1 olmalıdır")
+        if batch_size < 1:
+            raise ValueError("batch_size en az 1 olmalıdır")
+        if output_format not in self.OUTPUT_WRITERS:
+            raise ValueError(f"Bilinmeyen çıktı biçimi: {output_format} "
+                             f"(desteklenenler: {', '.join(self.OUTPUT_WRITERS)})")
+        if incremental and output_format != 'text':
+            raise ValueError("Artımlı mod yalnızca 'text' çıktı biçimiyle kullanılabilir")
+        if output_compression and output_compression not in TextWriter.COMPRESSION_SUFFIXES:
+            raise ValueError(f"Desteklenmeyen sıkıştırma: {output_compression} "
+                             f"(desteklenenler: {', '.join(TextWriter.COMPRESSION_SUFFIXES)})")
+        if (output_compression or shard_size_mb) and \
+                not issubclass(self.OUTPUT_WRITERS[output_format], TextWriter):
+            raise ValueError(f"'{output_format}' çıktısında sıkıştırma ve parçalama kullanılamaz")
+        if (output_compression or shard_size_mb) and incremental:
+            raise ValueError("Artımlı mod sıkıştırılmış veya parçalanmış çıktıyla kullanılamaz")
+        if checkpoint_file and (incremental or not issubclass(self.OUTPUT_WRITERS[output_format], TextWriter)):
+            raise ValueError("Kontrol noktası yalnızca artımlı olmayan 'text' ve 'jsonl' çıktısıyla kullanılabilir")
+
         self.max_file_size_mb = max_file_size_mb
         self.output_file = output_file
+        self.workers = workers
+        self.batch_size = batch_size
+        self.write_buffer_size = write_buffer_size
+        self.cache_file = cache_file
+        self.cache_max_size_mb = cache_max_size_mb
+        self.cache_max_age_days = cache_max_age_days
+        self.cache_use_hash = cache_use_hash
+        self.incremental = incremental
+        self.compact_ratio = compact_ratio
+        self.manifest_file = f"{output_file}.manifest.json"
+        self.encoding_sample_bytes = encoding_sample_bytes
+        self.control_char_threshold = control_char_threshold
+        self.stream_threshold_mb = stream_threshold_mb
+        # Worker süreçlerinde kapatılır (bkz. _init_worker)
+        self.streaming = True
+        self.magic_fallback = magic_fallback
+        self.file_timeout = file_timeout
+        self.file_memory_limit_mb = file_memory_limit_mb
+        self.quarantine_file = quarantine_file
+        self.pdf_max_pages = pdf_max_pages
+        self.pdf_laparams = pdf_laparams
+        self.pdf_layout_analysis = pdf_layout_analysis
+        self.pdf_page_workers = pdf_page_workers
+        self.pdf_pages_per_task = pdf_pages_per_task
+        self.spreadsheet_max_rows = spreadsheet_max_rows
+        self.spreadsheet_max_columns = spreadsheet_max_columns
+        self.office_xml_formats = sorted(office_xml_formats) if office_xml_formats else None
+        self.array_preview_items = array_preview_items
+        self.array_max_scan_mb = array_max_scan_mb
+        self.archives = archives
+        self.archive_max_depth = archive_max_depth
+        self.archive_max_total_mb = archive_max_total_mb
+        self.prefetch_threads = prefetch_threads
+        self.output_format = output_format
+        self.output_compression = output_compression
+        self.output_compression_level = output_compression_level
+        self.shard_size_mb = shard_size_mb
+        self.metrics_file = metrics_file
+        self.prometheus_file = prometheus_file
+        self.metrics_top_n = metrics_top_n
+        self.checkpoint_file = checkpoint_file
+        self.checkpoint_interval = checkpoint_interval
         self.processed_files: Set[str] = set()
         self.error_files: Dict[str, str] = {}
         
-        # Extractors'ları başlat
-        self.extractors: List[BaseExtractor] = [
-            TextExtractor(),
-            OfficeExtractor(),
-            PDFExtractor(),
-            ModelExtractor()
-        ]
+        # Extractor'ları kaydet (ilgili dosya türü ilk görüldüğünde yüklenirler)
+        self.registry = ExtractorRegistry(magic_fallback=magic_fallback)
+        self.registry.register(TextExtractor, sample_bytes=encoding_sample_bytes,
+                               control_threshold=control_char_threshold)
+        self.registry.register(OfficeExtractor, max_rows=spreadsheet_max_rows,
+                               max_columns=spreadsheet_max_columns,
+                               xml_formats=self.office_xml_formats)
+        self.registry.register(PDFExtractor, max_pages=pdf_max_pages, laparams=pdf_laparams,
+                               layout_analysis=pdf_layout_analysis, page_workers=pdf_page_workers,
+                               pages_per_task=pdf_pages_per_task)
+        self.registry.register(ModelExtractor, preview_items=array_preview_items,
+                               max_scan_mb=array_max_scan_mb)
         
         # File utils'i başlat
         self.file_utils = FileUtils()
 
-    def can_process_file(self, file_path: str) -> bool:
+        # Önbelleği başlat
+        self.cache: Optional[ExtractionCache] = None
+        if cache_file:
+            self.cache = ExtractionCache(cache_file, max_size_mb=cache_max_size_mb,
+                                         max_age_days=cache_max_age_days, use_hash=cache_use_hash,
+                                         settings=self._extraction_settings())
+
+        # Sınır verildiyse çıkarım gözetimli bir alt süreçte yapılır
+        self.supervisor: Optional[ExtractionSupervisor] = None
+        if file_timeout or file_memory_limit_mb:
+            self.supervisor = ExtractionSupervisor(_run_supervised_extractor, self._supervised_options(),
+                                                   timeout=file_timeout,
+                                                   memory_limit_mb=file_memory_limit_mb)
+        self.quarantine: Optional[Quarantine] = Quarantine(quarantine_file) if quarantine_file else None
+
+        # Arşiv üyeleri diske açılmadan okunur, boyut sınırı üyelere de uygulanır
+        self.archive_reader: Optional[ArchiveReader] = None
+        if archives:
+            self.archive_reader = ArchiveReader(
+                max_depth=archive_max_depth,
+                max_total_bytes=int(archive_max_total_mb * 1024 * 1024) if archive_max_total_mb else None,
+                max_member_bytes=int(max_file_size_mb * 1024 * 1024))
+
+        # Dizinler os.scandir ile taranır, dosyaların stat sonucu probe'lara aktarılır
+        self.scanner = DirectoryScanner(include=include, exclude=exclude, exclude_file=exclude_file,
+                                        prune_dirs=prune_dirs)
+        self.prefetcher: Optional[Prefetcher] = Prefetcher(prefetch_threads) if prefetch_threads > 0 else None
+
+        # Artımlı modda ilk kopya sonradan değişirse kopyaların kaydı bayatlar
+        self.deduplicator: Optional[ContentDeduplicator] = None
+        if dedup and incremental:
+            logger.warning("Artımlı modda tekrar eden içerik kontrolü yapılmaz.")
+        elif dedup:
+            self.deduplicator = ContentDeduplicator()
+
+        # Ölçümler her zaman toplanır (dosya başına birkaç perf_counter çağrısı), istenirse yazılır
+        self.metrics = PipelineMetrics(top_n=metrics_top_n)
+
+    def _worker_options(self) -> Dict[str, Any]:
+        """
+        Worker süreçlerindeki işlemcinin oluşturulacağı ayarları döndürür
+        
+        Returns:
+            Dict[str, Any]: FileProcessor başlatıcı argümanları
+        """
+        return {
+            'max_file_size_mb': self.max_file_size_mb,
+            'cache_file': self.cache_file,
+            'cache_use_hash': self.cache_use_hash,
+            'encoding_sample_bytes': self.encoding_sample_bytes,
+            'control_char_threshold': self.control_char_threshold,
+            'stream_threshold_mb': self.stream_threshold_mb,
+            'magic_fallback': self.magic_fallback,
+            'file_timeout': self.file_timeout,
+            'file_memory_limit_mb': self.file_memory_limit_mb,
+            'quarantine_file': self.quarantine_file,
+            'pdf_max_pages': self.pdf_max_pages,
+            'pdf_laparams': self.pdf_laparams,
+            'pdf_layout_analysis': self.pdf_layout_analysis,
+            'pdf_page_workers': self.pdf_page_workers,
+            'pdf_pages_per_task': self.pdf_pages_per_task,
+            'spreadsheet_max_rows': self.spreadsheet_max_rows,
+            'spreadsheet_max_columns': self.spreadsheet_max_columns,
+            'office_xml_formats': self.office_xml_formats,
+            'array_preview_items': self.array_preview_items,
+            'array_max_scan_mb': self.array_max_scan_mb,
+            'archives': self.archives,
+            'archive_max_depth': self.archive_max_depth,
+            'archive_max_total_mb': self.archive_max_total_mb,
+            'prefetch_threads': self.prefetch_threads,
+            'output_format': self.output_format,
+            'metrics_top_n': self.metrics_top_n,
+        }
+
+    def _supervised_options(self) -> Dict[str, Any]:
+        """
+        Gözetimli alt süreçteki işlemcinin ayarlarını döndürür
+        
+        Returns:
+            Dict[str, Any]: Önbelleksiz, karantinasız ve sınırsız FileProcessor başlatıcı argümanları
+        """
+        return dict(self._worker_options(), cache_file=None, quarantine_file=None,
+                    file_timeout=None, file_memory_limit_mb=None)
+
+    def _take_worker_counters(self) -> Dict[str, Any]:
+        """
+        Worker'da biriken sayaçları ve ölçümleri döndürür ve sıfırlar
+        
+        Returns:
+            Dict[str, Any]: Sayaç adı ve değeri, 'metrics' altında PipelineMetrics
+        """
+        counters: Dict[str, Any] = {'metrics': self.metrics.take()}
+        if self.cache:
+            counters['cache_hits'], counters['cache_misses'] = self.cache.take_counters()
+        return counters
+
+    def _merge_worker_counters(self, counters: Dict[str, Any]) -> None:
+        """
+        Worker'dan gelen sayaçları ve ölçümleri ana süreçtekilere ekler
+        
+        Args:
+            counters (Dict[str, Any]): Sayaç adı ve değeri
+        """
+        if 'metrics' in counters:
+            self.metrics.merge(counters['metrics'])
+        if self.cache:
+            self.cache.hits += counters.get('cache_hits', 0)
+            self.cache.misses += counters.get('cache_misses', 0)
+
+    def can_process_file(self, file_path: str, probe: Optional[FileProbe] = None) -> bool:
         """
         Dosyanın işlenip işlenemeyeceğini kontrol eder
         
         Args:
             file_path (str): Dosya yolu
+            probe (Optional[FileProbe]): Dosyanın önceden toplanmış bilgileri
             
         Returns:
             bool: İşlenebilir ise True, değilse False
         """
+        if probe is None:
+            probe = self._probe(file_path)
+
         # Dosya boyutunu kontrol et
-        if self.file_utils.get_file_size_mb(file_path) > self.max_file_size_mb:
+        if probe.size_mb > self.max_file_size_mb:
             logger.warning(f"{file_path} dosyası boyut limitini ({self.max_file_size_mb}MB) aşıyor.")
             return False
 
-        # Binary kontrolü
-        if self.file_utils.is_binary_file(file_path):
-            # Extractorların desteklediği binary dosyalar için devam et
-            for extractor in self.extractors:
-                if extractor.can_handle(file_path):
-                    return True
-            return False
+        # Binary olsun olmasın, uzantısı kayıtlı bir extractor'a ait dosyalar işlenir.
+        # Extractor burada oluşturulmaz, böylece kütüphaneleri gereksiz yere yüklenmez.
+        return self.registry.supports(file_path, probe)
+
+    def _probe(self, file_path: str, stat_result: Optional[os.stat_result] = None) -> FileProbe:
+        """
+        Dosya için tek okumalık probe oluşturur
+        
+        Args:
+            file_path (str): Dosya yolu
+            stat_result (Optional[os.stat_result]): Tarama sırasında alınmış stat sonucu
+            
+        Returns:
+            FileProbe: Boyut sınırına kadar içeriği tek seferde okuyacak probe
+        """
+        read_limit_mb = min(self.max_file_size_mb, self.stream_threshold_mb)
+        return FileProbe(file_path, read_limit=int(read_limit_mb * 1024 * 1024), stat_result=stat_result)
+
+    def _iter_probes(self, entries: Iterable[ScanEntry]) -> Iterator[FileProbe]:
+        """
+        Taranan dosyaların probe'larını, açıksa içeriklerini önceden okuyarak üretir
+        
+        Args:
+            entries (Iterable[ScanEntry]): (dosya yolu, stat sonucu) çiftleri
+            
+        Returns:
+            Iterator[FileProbe]: Giriş sırasıyla probe'lar
+        """
+        probes = (self._probe(file_path, stat_result) for file_path, stat_result in entries)
+        if self.prefetcher is None:
+            return probes
+        return self.prefetcher.iter_probes(probes, self._should_prefetch)
+
+    def _should_prefetch(self, probe: FileProbe) -> bool:
+        """
+        Dosyanın içeriğinin önceden okunmaya değer olup olmadığını döndürür
+        
+        Tamamı belleğe alınmayacak dosyalar, arşivler, uzantısı hiçbir extractor'a
+        ait olmayan dosyalar ve dosyayı kendisi açan extractor'ların (READS_PROBE_DATA
+        False) dosyaları okunmaz. Uzantısız dosyalar imza kontrolü için okunur.
 
-        # Text dosyaları için TextExtractor'ı kontrol et
-        return any(extractor.can_handle(file_path) for extractor in self.extractors)
+        Args:
+            probe (FileProbe): Dosyanın probe'u
 
-    def extract_content(self, file_path: str) -> Optional[str]:
+        Returns:
+            bool: Okunacaksa True
+        """
+        if probe.size > probe.read_limit:
+            return False
+        if self.archive_reader is not None and self.archive_reader.is_archive(probe.path):
+            return False
+        if not probe.extension:
+            return True
+        extractor_class = self.registry.class_for_path(probe.path, probe)
+        return extractor_class is not None and extractor_class.READS_PROBE_DATA
+
+    def extract_content(self, file_path: str, probe: Optional[FileProbe] = None) -> Optional[Content]:
         """
         Dosyadan içerik çıkarır
         
         Args:
             file_path (str): Dosya yolu
+            probe (Optional[FileProbe]): Dosyanın önceden toplanmış bilgileri
             
         Returns:
-            Optional[str]: Çıkarılan içerik veya None
+            Optional[Content]: Çıkarılan içerik, büyük dosyalarda akış kaydı veya None
         """
-        for extractor in self.extractors:
-            if extractor.can_handle(file_path):
-                content = extractor.extract_text(file_path)
-                if content:
-                    return self.format_content(file_path, content)
+        if probe is None:
+            probe = self._probe(file_path)
+
+        extractor_class = self.registry.class_for_path(file_path, probe)
+        if extractor_class is None:
+            return None
+
+        # Sınır verildiyse büyük dosyalar da gözetimli alt süreçte çıkarılır; akış ana süreçte
+        # çalışacağından süre ve bellek sınırının dışında kalırdı
+        if self.streaming and self.supervisor is None and probe.size_mb > self.stream_threshold_mb and \
+                extractor_class.SUPPORTS_STREAMING and not probe.in_memory:
+            extractor = self.registry.get(extractor_class)
+            if self.output_format != 'text':
+                return ExtractionRecord(file_path, probe.size, probe.mime_type, extractor_class.__name__,
+                                        streamer=extractor)
+            return StreamedContent(file_path, extractor,
+                                   self.format_header(file_path, probe), self.format_footer())
+
+        # Önbellek isabetinde extractor (ve kütüphaneleri) hiç yüklenmez
+        start = time.perf_counter()
+        if self.cache:
+            cached = self.cache.get(file_path, probe.stat, probe)
+            now = time.perf_counter()
+            self.metrics.add_stage('cache', now - start)
+            if cached is not None:
+                content = self._build_content(file_path, cached[0], probe, cached[1], now - start)
+                self.metrics.add_stage('format', time.perf_counter() - now)
+                return content
+
+        encoding = None
+        if self.supervisor is not None:
+            stage_start = time.perf_counter()
+            content = self.supervisor.extract(file_path, probe.data if probe.in_memory else None)
+        else:
+            if extractor_class.READS_PROBE_DATA and not probe.in_memory and \
+                    (probe.read_limit is None or probe.size <= probe.read_limit):
+                # Okuma extractor'dan ayrı ölçülsün diye içerik burada yüklenir (önceden okunduysa anında döner)
+                stage_start = time.perf_counter()
+                probe.data
+                self.metrics.add_stage('read', time.perf_counter() - stage_start)
+            extractor = self.registry.get(extractor_class)
+            stage_start = time.perf_counter()
+            content = extractor.extract_text(file_path, probe)
+            encoding = extractor.last_encoding
+            if encoding is not None:
+                self.metrics.add_stage('encoding', extractor.last_encoding_seconds)
+        now = time.perf_counter()
+        self.metrics.add_stage('extract', now - stage_start)
+        if content:
+            if self.cache:
+                self.cache.put(file_path, content, extractor_class.__name__, probe.stat, probe=probe)
+            built = self._build_content(file_path, content, probe, extractor_class.__name__,
+                                        now - start, encoding)
+            self.metrics.add_stage('format', time.perf_counter() - now)
+            return built
         return None
 
-    def format_content(self, file_path: str, content: str) -> str:
+    def _build_content(self, file_path: str, text: str, probe: FileProbe, extractor_name: str,
+                       seconds: float, encoding: Optional[str] = None) -> Content:
+        """
+        Çıkarılan metni çıktı biçimine uygun içeriğe dönüştürür
+        
+        Args:
+            file_path (str): Dosya yolu
+            text (str): Çıkarılan metin
+            probe (FileProbe): Dosyanın önceden toplanmış bilgileri
+            extractor_name (str): Metni çıkaran extractor'ın sınıf adı
+            seconds (float): Çıkarım süresi
+            encoding (Optional[str]): Tespit edilen kodlama
+            
+        Returns:
+            Content: 'text' biçiminde formatlanmış metin, diğer biçimlerde ExtractionRecord
+        """
+        if self.output_format == 'text':
+            return self.format_content(file_path, text, probe)
+        return ExtractionRecord(file_path, probe.size, probe.mime_type, extractor_name,
+                                encoding=encoding, seconds=seconds, text=text)
+
+    def format_content(self, file_path: str, content: str, probe: Optional[FileProbe] = None) -> str:
         """
         Dosya içeriğini formatlar
         
         Args:
             file_path (str): Dosya yolu
             content (str): Dosya içeriği
+            probe (Optional[FileProbe]): Dosyanın önceden toplanmış bilgileri
             
         Returns:
             str: Formatlanmış içerik
         """
+        return self.format_header(file_path, probe) + content + self.format_footer()
+
+    def format_header(self, file_path: str, probe: Optional[FileProbe] = None) -> str:
+        """
+        Dosya kaydının başlığını oluşturur
+        
+        Args:
+            file_path (str): Dosya yolu
+            probe (Optional[FileProbe]): Dosyanın önceden toplanmış bilgileri
+            
+        Returns:
+            str: İçerikten önce yazılan başlık
+        """
+        if probe is None:
+            probe = self._probe(file_path)
+
         separator = "-" * 80
         return f"""
 {separator}
 Dosya: {file_path}
-Boyut: {self.file_utils.get_file_size_mb(file_path):.2f}MB
-MIME Type: {self.file_utils.get_mime_type(file_path)}
+Boyut: {probe.size_mb:.2f}MB
+MIME Type: {probe.mime_type}
 {separator}
-{content}
+"""
+
+    def format_footer(self) -> str:
+        """
+        Dosya kaydının kapanışını oluşturur
+        
+        Returns:
+            str: İçerikten sonra yazılan kapanış
+        """
+        separator = "-" * 80
+        return f"""
 {separator}
 
 """
 
-    def process_file(self, file_path: str) -> Optional[str]:
+    def format_reference(self, file_path: str, original: str, probe: Optional[FileProbe] = None) -> Content:
+        """
+        Aynı içerikli dosyanın ilk kopyasını gösteren kaydı oluşturur
+        
+        Args:
+            file_path (str): Dosya yolu
+            original (str): İçeriğin ilk kopyasının yolu
+            probe (Optional[FileProbe]): Dosyanın önceden toplanmış bilgileri
+            
+        Returns:
+            Content: Formatlanmış kayıt, yapılandırılmış biçimlerde metinsiz ExtractionRecord
+        """
+        if self.output_format != 'text':
+            if probe is None:
+                probe = self._probe(file_path)
+            return ExtractionRecord(file_path, probe.size, probe.mime_type, None, duplicate_of=original)
+        return self.format_content(file_path, f"[Aynı içerik: {original}]", probe)
+
+    def process_file(self, file_path: str, probe: Optional[FileProbe] = None,
+                     duplicate_of: Optional[str] = None) -> Optional[Content]:
         """
         Tek bir dosyayı işler
         
         Args:
             file_path (str): Dosya yolu
+            probe (Optional[FileProbe]): Dosyanın önceden toplanmış bilgileri (arşiv üyelerinde içerik)
+            duplicate_of (Optional[str]): Aynı içerikli ilk kopya önceden biliniyorsa yolu
             
         Returns:
-            Optional[str]: İşlenmiş dosya içeriği veya None
+            Optional[Content]: İşlenmiş dosya içeriği veya None
         """
         if file_path in self.processed_files:
             return None
 
+        started = time.perf_counter()
+        extract_started: Optional[float] = None
+        status = 'error'
         try:
-            if not os.path.exists(file_path):
-                logger.error(f"Dosya bulunamadı: {file_path}")
+            if probe is None:
+                try:
+                    probe = self._probe(file_path)
+                except FileNotFoundError:
+                    logger.error(f"Dosya bulunamadı: {file_path}")
+                    return None
+
+            if self._is_quarantined(file_path, probe.stat):
                 return None
 
-            if not self.can_process_file(file_path):
+            supported = self.can_process_file(file_path, probe)
+            checked = time.perf_counter()
+            self.metrics.add_stage('check', checked - started)
+            if not supported:
                 logger.warning(f"Dosya desteklenmiyor: {file_path}")
                 return None
 
-            content = self.extract_content(file_path)
+            if duplicate_of is None and self.deduplicator is not None:
+                duplicate_of = self.deduplicator.check(probe)
+                if duplicate_of is not None:
+                    self.deduplicator.record(probe.size, duplicate_of)
+                self.metrics.add_stage('dedup', time.perf_counter() - checked)
+            if duplicate_of is not None:
+                self.processed_files.add(file_path)
+                return self.format_reference(file_path, duplicate_of, probe)
+
+            extract_started = time.perf_counter()
+            content = self.extract_content(file_path, probe)
             if content:
+                status = 'ok'
                 self.processed_files.add(file_path)
+                if self.deduplicator is not None:
+                    self.deduplicator.confirm(file_path, time.perf_counter() - extract_started)
                 return content
             else:
+                status = 'empty'
                 logger.warning(f"Dosya boş: {file_path}")
                 return None
+
+        except ExtractionLimitError as e:
+            self.error_files[file_path] = e.reason
+            logger.error(f"Dosya sınırı aştığı için durduruldu {file_path}: {str(e)}")
+            if self.quarantine is not None:
+                self.quarantine.add(file_path, e.reason, probe.stat)
+            return None
             
         except Exception as e:
             self.error_files[file_path] = str(e)
             logger.error(f"Dosya işlenirken hata oluştu {file_path}: {str(e)}")
+
+        finally:
+            # Çıkarımı tamamlanmayan ilk kopyanın kaydı geri alınır (onaylananlarda etkisizdir)
+            if self.deduplicator is not None:
+                self.deduplicator.release(file_path)
+            if extract_started is not None:
+                extractor_class = self.registry.class_for_path(file_path, probe)
+                self.metrics.add_file(file_path, probe.extension,
+                                      extractor_class.__name__ if extractor_class else '-',
+                                      probe.size, time.perf_counter() - started, status)
         
         logger.warning(f"Hesapta olmayan bir sorun var: {file_path}")
         return None
 
-    def process_directory(self, directory_path: str) -> List[str]:
+    def process_path(self, file_path: str, probe: Optional[FileProbe] = None,
+                     duplicate_of: Optional[str] = None) -> Iterator[Tuple[str, Optional[Content]]]:
+        """
+        Dosyayı işler; arşiv modunda arşivlerin üyelerini tek tek işler
+        
+        Args:
+            file_path (str): Dosya yolu
+            probe (Optional[FileProbe]): Dosyanın önceden toplanmış bilgileri
+            duplicate_of (Optional[str]): Aynı içerikli ilk kopya önceden biliniyorsa yolu
+            
+        Returns:
+            Iterator[Tuple[str, Optional[Content]]]: (dosya veya üye yolu, işlenmiş içerik) çiftleri
+        """
+        for entry_path, _, content in self._process_path(file_path, probe, duplicate_of):
+            yield entry_path, content
+
+    def _process_path(self, file_path: str, probe: Optional[FileProbe] = None,
+                      duplicate_of: Optional[str] = None
+                      ) -> Iterator[Tuple[str, Optional[FileProbe], Optional[Content]]]:
+        """
+        process_path ile aynıdır; arşiv üyelerinin bellekteki probe'larını da üretir
+        
+        Args:
+            file_path (str): Dosya yolu
+            probe (Optional[FileProbe]): Dosyanın önceden toplanmış bilgileri
+            duplicate_of (Optional[str]): Aynı içerikli ilk kopya önceden biliniyorsa yolu
+            
+        Returns:
+            Iterator[Tuple[str, Optional[FileProbe], Optional[Content]]]: (dosya veya üye yolu,
+                probe, işlenmiş içerik) üçlüleri; probe verilmemiş dosyalarda None
+        """
+        if self.archive_reader is None or not self.archive_reader.is_archive(file_path):
+            yield file_path, probe, self.process_file(file_path, probe, duplicate_of)
+            return
+
+        try:
+            for member_path, data, stat_result in self.archive_reader.iter_members(file_path):
+                probe = FileProbe.from_bytes(member_path, data, stat_result)
+                yield member_path, probe, self.process_file(member_path, probe)
+        except Exception as e:
+            self.error_files[file_path] = str(e)
+            logger.error(f"Arşiv okunurken hata oluştu {file_path}: {str(e)}")
+
+    def _is_quarantined(self, file_path: str, stat_result: Optional[os.stat_result] = None) -> bool:
+        """
+        Dosyanın karantinada olup olmadığını kontrol eder
+        
+        Args:
+            file_path (str): Dosya yolu
+            stat_result (Optional[os.stat_result]): Önceden alınmış stat sonucu
+            
+        Returns:
+            bool: Dosya değişmeden karantinada duruyorsa True
+        """
+        if not self.quarantine:
+            return False
+        reason = self.quarantine.reason_for(file_path, stat_result)
+        if reason is None:
+            return False
+        logger.warning(f"Karantinadaki dosya atlandı ({reason}): {file_path}")
+        return True
+
+    def _iter_results(self, entries: Iterable[ScanEntry]) -> Iterator[Tuple[str, Optional[Content]]]:
+        """
+        Dosyaları ayarlara göre sıralı veya paralel işler
+        
+        Args:
+            entries (Iterable[ScanEntry]): (dosya yolu, stat sonucu) çiftleri
+            
+        Returns:
+            Iterator[Tuple[str, Optional[Content]]]: (dosya yolu, işlenmiş içerik) çiftleri, giriş sırasıyla
+        """
+        if self.workers > 1:
+            return self._process_parallel(entries)
+        return (entry for probe in self._iter_probes(entries)
+                for entry in self.process_path(probe.path, probe))
+
+    def _process_parallel(self, entries: Iterable[ScanEntry]) -> Iterator[Tuple[str, Optional[Content]]]:
+        """
+        Dosyaları süreç havuzunda işler, sonuçları giriş sırasıyla döndürür
+        
+        Args:
+            entries (Iterable[ScanEntry]): (dosya yolu, stat sonucu) çiftleri
+            
+        Returns:
+            Iterator[Tuple[str, Optional[Content]]]: (dosya yolu, işlenmiş içerik) çiftleri, giriş sırasıyla
+        """
+        max_pending = self.workers * self.PENDING_BATCHES_PER_WORKER
+
+        with ProcessPoolExecutor(max_workers=self.workers,
+                                 initializer=_init_worker,
+                                 initargs=(self._worker_options(),)) as executor:
+            pending = deque()
+            batch: List[ScanEntry] = []
+            seen: Set[str] = set()
+            # Tekrarlar ana süreçte bulunur: dosya yolu -> (ilk kopya, boyut)
+            duplicates: Dict[str, Tuple[str, int]] = {}
+            batch_duplicates: Dict[str, str] = {}
+
+            def drain_one() -> Iterator[Tuple[str, Optional[Content]]]:
+                results, counters = pending.popleft().result()
+                self._merge_worker_counters(counters)
+                for file_path, content, error, seconds, stat_result in results:
+                    duplicate = duplicates.pop(file_path, None)
+                    if duplicate is not None and not self.deduplicator.is_confirmed(duplicate[0]):
+                        # İlk kopya işlenemedi, bu kopya ana süreçte baştan işlenir
+                        yield file_path, self.process_file(file_path)
+                        continue
+                    if duplicate is not None:
+                        self.deduplicator.record(duplicate[1], duplicate[0])
+                    elif self.deduplicator is not None:
+                        if content and error is None:
+                            self.deduplicator.confirm(file_path, seconds)
+                        else:
+                            self.deduplicator.release(file_path)
+                    yield file_path, self._merge_worker_result(file_path, content, error, stat_result)
+
+            for file_path, stat_result in entries:
+                if file_path in self.processed_files or file_path in seen:
+                    continue
+                if self._is_quarantined(file_path, stat_result):
+                    continue
+                seen.add(file_path)
+                if self.deduplicator is not None and self.archive_reader is not None and \
+                        self.archive_reader.is_archive(file_path):
+                    # Üyelerin tekrar kontrolü tarama sırasıyla yapılmalı; önceki sonuçlar
+                    # alınır ve arşiv ana süreçte açılır, çıktı worker sayısına bağlı kalmaz
+                    if batch:
+                        pending.append(executor.submit(_process_batch_in_worker, batch, batch_duplicates))
+                        batch = []
+                        batch_duplicates = {}
+                    while pending:
+                        yield from drain_one()
+                    yield from self.process_path(file_path)
+                    continue
+                batch.append((file_path, stat_result))
+                original = self._find_duplicate(file_path, stat_result)
+                if original is not None:
+                    duplicates[file_path] = (original, stat_result.st_size)
+                    batch_duplicates[file_path] = original
+                if len(batch) >= self.batch_size:
+                    pending.append(executor.submit(_process_batch_in_worker, batch, batch_duplicates))
+                    batch = []
+                    batch_duplicates = {}
+                    # Bellek sınırlı kalsın diye bekleyen grup sayısını sınırla
+                    if len(pending) >= max_pending:
+                        yield from drain_one()
+
+            if batch:
+                pending.append(executor.submit(_process_batch_in_worker, batch, batch_duplicates))
+            while pending:
+                yield from drain_one()
+
+    def _find_duplicate(self, file_path: str, stat_result: os.stat_result) -> Optional[str]:
+        """
+        Paralel modda, worker'a gönderilmeden önce dosyanın tekrar olup olmadığını kontrol eder
+        
+        İlk kopya henüz işleniyor olabilir; sonucu birleştirilirken doğrulanır.
+        
+        Args:
+            file_path (str): Dosya yolu
+            stat_result (os.stat_result): Tarama sırasında alınmış stat sonucu
+            
+        Returns:
+            Optional[str]: Aynı içerikli ilk kopyanın yolu veya None
+        """
+        if self.deduplicator is None:
+            return None
+        try:
+            probe = self._probe(file_path, stat_result)
+            if probe.size_mb > self.max_file_size_mb or not self.registry.supports(file_path, probe):
+                return None
+            return self.deduplicator.check(probe)
+        except OSError as e:
+            logger.warning(f"Tekrar kontrolü için dosya okunamadı {file_path}: {str(e)}")
+            return None
+
+    def _merge_worker_result(self, file_path: str, content: Optional[Content], error: Optional[str],
+                             stat_result: Optional[os.stat_result] = None) -> Optional[Content]:
+        """
+        Worker sonucunu ana süreçteki durum ile birleştirir
+        
+        Args:
+            file_path (str): Dosya veya arşiv üyesi yolu
+            content (Optional[Content]): İşlenmiş içerik
+            error (Optional[str]): Hata mesajı
+            stat_result (Optional[os.stat_result]): Worker'da alınmış stat sonucu (arşiv
+                üyelerinde diskte karşılığı olmadığından gereklidir)
+            
+        Returns:
+            Optional[Content]: İşlenmiş içerik veya None
+        """
+        if error is not None:
+            self.error_files[file_path] = error
+            if self.quarantine is not None and error in ('timeout', 'memory'):
+                self.quarantine.add(file_path, error, stat_result)
+        if content:
+            self.processed_files.add(file_path)
+        return content
+
+    def iter_path(self, path: str) -> Iterator[Tuple[str, Optional[Content]]]:
+        """
+        Dosyayı veya dizini işler, her dosya (ve arşiv üyesi) için sonucu üretir
+        
+        Args:
+            path (str): Dosya veya dizin yolu
+            
+        Returns:
+            Iterator[Tuple[str, Optional[Content]]]: (dosya yolu, işlenmiş içerik) çiftleri;
+                içerik None ise hata error_files'a yazılmıştır veya dosya atlanmıştır
+            
+        Raises:
+            FileNotFoundError: Yol yoksa
+        """
+        if os.path.isfile(path):
+            return self.process_path(path)
+        if os.path.isdir(path):
+            return self._iter_results(self.metrics.timed('scan', self.scanner.scan(path)))
+        raise FileNotFoundError(f"Geçersiz yol: {path}")
+
+    def reset(self) -> None:
+        """İşlemci yeniden kullanılırken önceki çalışmadan kalan durumu sıfırlar"""
+        self.processed_files = set()
+        self.error_files = {}
+        if self.deduplicator is not None:
+            self.deduplicator = ContentDeduplicator()
+        self.metrics = PipelineMetrics(top_n=self.metrics_top_n)
+
+    def process_directory(self, directory_path: str) -> Iterator[Content]:
         """
         Bir dizini ve alt dizinlerini işler
         
@@ -144,66 +966,461 @@ MIME Type: {self.file_utils.get_mime_type(file_path)}
             directory_path (str): Dizin yolu
             
         Returns:
-            List[str]: İşlenmiş içerikler listesi
+            Iterator[Content]: İşlenmiş içerikler (hazır oldukça üretilir)
         """
-        contents = []
-        
         try:
-            for root, _, files in os.walk(directory_path):
-                for file in files:
-                    file_path = os.path.join(root, file)
-                    content = self.process_file(file_path)
-                    if content:
-                        contents.append(content)
+            entries = self.metrics.timed('scan', self.scanner.scan(directory_path))
+            for _, content in self._iter_results(entries):
+                if content:
+                    yield content
                         
         except Exception as e:
             logger.error(f"Dizin işlenirken hata oluştu: {str(e)}")
-            
-        return contents
 
-    def save_output(self, contents: List[str]) -> None:
+    def save_output(self, contents: Iterable[Content]) -> int:
         """
-        İşlenmiş içerikleri dosyaya kaydeder
+        İşlenmiş içerikleri hazır oldukça dosyaya yazar
         
         Args:
-            contents (List[str]): İşlenmiş içerikler listesi
+            contents (Iterable[Content]): İşlenmiş içerikler
+            
+        Returns:
+            int: Yazılan kayıt sayısı
         """
+        writer = self._create_writer()
         try:
-            with open(self.output_file, 'w', encoding='utf-8') as f:
-                f.write('\n'.join(contents))
-            logger.info(f"İçerikler {self.output_file} dosyasına kaydedildi.")
+            with writer:
+                for content in contents:
+                    start = time.perf_counter()
+                    writer.write_record(content)
+                    self.metrics.add_stage('write', time.perf_counter() - start)
+            outputs = writer.outputs
+            if writer.records_written and len(outputs) == 1:
+                logger.info(f"İçerikler {outputs[0]} dosyasına kaydedildi.")
+            elif writer.records_written:
+                logger.info(f"İçerikler {len(outputs)} parçaya kaydedildi: {outputs[0]} ... {outputs[-1]}")
         except Exception as e:
             logger.error(f"Dosya kaydedilirken hata oluştu: {str(e)}")
+            return 0
+        return writer.records_written
 
-    def process(self, path: str) -> None:
+    def _create_writer(self) -> BaseWriter:
+        """
+        output_format'a karşılık gelen yazıcıyı oluşturur
+        
+        Returns:
+            BaseWriter: Açılmamış yazıcı
+        """
+        writer_class = self.OUTPUT_WRITERS[self.output_format]
+        if issubclass(writer_class, TextWriter):
+            return writer_class(self.output_file, buffer_size=self.write_buffer_size,
+                                compression=self.output_compression,
+                                compression_level=self.output_compression_level,
+                                shard_size_mb=self.shard_size_mb)
+        return writer_class(self.output_file)
+
+    def process(self, path: str) -> bool:
         """
         Ana işleme fonksiyonu
         
         Args:
             path (str): İşlenecek dosya veya dizin yolu
+            
+        Returns:
+            bool: Çalışma beklenmeyen bir hata olmadan tamamlandıysa True
         """
-        contents = []
+        return self.process_paths([path])
+
+    def process_paths(self, paths: List[str]) -> bool:
+        """
+        Birden çok dosya ve dizini tarama sırasıyla işleyip tek çıktıda birleştirir
+        
+        checkpoint_file verilmişse tamamlanan dosyalar ve yazıcının durumu en fazla
+        checkpoint_interval saniyede bir kaydedilir. Çalışma yarıda kalırsa (çökme,
+        kill, Ctrl+C) aynı yollar ve ayarlarla yeniden başlatıldığında tamamlanan
+        dosyalar atlanır, çıktıya son kontrol noktasından devam edilir. Çalışma
+        başarıyla biterse kontrol noktası silinir.
         
+        Args:
+            paths (List[str]): İşlenecek dosya ve dizin yolları (artımlı modda tek yol)
+            
+        Returns:
+            bool: Çalışma beklenmeyen bir hata olmadan tamamlandıysa True
+        """
+        # Rapor yalnızca bu çalışmayı kapsar
+        self.metrics = PipelineMetrics(top_n=self.metrics_top_n)
+        started = time.perf_counter()
         try:
-            if os.path.isfile(path):
-                content = self.process_file(path)
-                if content:
-                    contents.append(content)
-            elif os.path.isdir(path):
-                contents.extend(self.process_directory(path))
-            else:
-                logger.error(f"Geçersiz yol: {path}")
-                return
-
-            if contents:
-                self.save_output(contents)
-                logger.info(f"Toplam {len(self.processed_files)} dosya başarıyla işlendi.")
-                if self.error_files:
-                    logger.warning(f"{len(self.error_files)} dosya işlenemedi:")
-                    for file_path, error in self.error_files.items():
-                        logger.warning(f"- {file_path}: {error}")
+            if self.incremental:
+                if len(paths) != 1:
+                    logger.error("Artımlı mod tek bir dosya veya dizin yoluyla kullanılabilir")
+                    return False
+                self.process_incremental(paths[0])
+                return True
+
+            writer = self._create_writer()
+            checkpoint = self._open_writer(writer, paths)
+            completed = checkpoint.completed if checkpoint is not None else set()
+            try:
+                entries = self.metrics.timed('scan', self._iter_entries(paths, completed))
+                self._write_results(writer, self._iter_results(entries), checkpoint)
+            except BaseException:
+                if checkpoint is not None:
+                    # Geçici çıktı korunur, sonraki çalışma kontrol noktasından devam eder
+                    writer.suspend()
+                else:
+                    writer.close(success=False)
+                raise
+            writer.close()
+            if checkpoint is not None:
+                checkpoint.remove()
+
+            outputs = writer.outputs
+            if writer.records_written and len(outputs) == 1:
+                logger.info(f"İçerikler {outputs[0]} dosyasına kaydedildi.")
+            elif writer.records_written:
+                logger.info(f"İçerikler {len(outputs)} parçaya kaydedildi: {outputs[0]} ... {outputs[-1]}")
+            if writer.records_written:
+                self._report_results()
             else:
                 logger.warning("İşlenebilecek dosya bulunamadı.")
+
+            if self.cache:
+                self._report_cache()
+            return True
                 
         except Exception as e:
-            logger.error(f"İşlem sırasında beklenmeyen hata: {str(e)}")
\ No newline at end of file
+            logger.error(f"İşlem sırasında beklenmeyen hata: {str(e)}")
+            return False
+        finally:
+            if self.supervisor:
+                self.supervisor.close()
+            # Önbellek bağlantısı kesintide de kapatılır (sonraki çalışmada yeniden açılır)
+            if self.cache:
+                self.cache.close()
+            self._report_metrics(time.perf_counter() - started)
+
+    def _iter_entries(self, paths: Iterable[str], skip: Set[str]) -> Iterator[ScanEntry]:
+        """
+        Verilen yolların dosyalarını sırayla üretir; dizinler taranır
+        
+        Args:
+            paths (Iterable[str]): Dosya ve dizin yolları
+            skip (Set[str]): Atlanacak (önceki çalışmada tamamlanmış) dosyalar
+            
+        Returns:
+            Iterator[ScanEntry]: (dosya yolu, stat sonucu) çiftleri
+        """
+        for path in paths:
+            if os.path.isdir(path):
+                entries: Iterable[ScanEntry] = self.scanner.scan(path)
+            elif os.path.isfile(path):
+                try:
+                    entries = [(path, os.stat(path))]
+                except OSError as e:
+                    logger.warning(f"Dosya durumu okunamadı {path}: {str(e)}")
+                    continue
+            else:
+                logger.error(f"Geçersiz yol: {path}")
+                continue
+            for entry in entries:
+                if entry[0] not in skip:
+                    yield entry
+
+    def _write_results(self, writer: BaseWriter, results: Iterable[Tuple[str, Optional[Content]]],
+                       checkpoint: Optional[Checkpoint]) -> None:
+        """
+        Sonuçları hazır oldukça yazar, kontrol noktası açıksa düzenli olarak kaydeder
+        
+        Kontrol noktası yalnızca dosyalar arasında alınır; bir arşivin üyeleri
+        yazılırken alınmaz, böylece devam edilirken arşiv baştan işlenir.
+        
+        Args:
+            writer (BaseWriter): Açık yazıcı
+            results (Iterable[Tuple[str, Optional[Content]]]): (dosya yolu, işlenmiş içerik) çiftleri
+            checkpoint (Optional[Checkpoint]): Kontrol noktası veya None
+        """
+        completed: List[str] = []
+        current: Optional[str] = None
+        last_saved = time.monotonic()
+        for file_path, content in results:
+            root = self._archive_root(file_path) if self.archive_reader is not None else file_path
+            if root != current:
+                if current is not None:
+                    completed.append(current)
+                current = root
+                if checkpoint is not None and time.monotonic() - last_saved >= self.checkpoint_interval:
+                    self._save_checkpoint(writer, checkpoint, completed)
+                    completed = []
+                    last_saved = time.monotonic()
+            if content:
+                start = time.perf_counter()
+                writer.write_record(content)
+                self.metrics.add_stage('write', time.perf_counter() - start)
+
+    def _checkpoint_fingerprint(self, paths: List[str]) -> Dict[str, Any]:
+        """
+        Kontrol noktasından devam edilebilmesi için aynı kalması gereken ayarları döndürür
+        
+        Args:
+            paths (List[str]): İşlenen dosya ve dizin yolları
+            
+        Returns:
+            Dict[str, Any]: Girdi yollarının özeti, çıktı ve çıkarım ayarları
+        """
+        digest = hashlib.sha256()
+        for path in paths:
+            digest.update(os.path.abspath(path).encode('utf-8', 'surrogateescape') + b'\0')
+        fingerprint = self._output_fingerprint('')
+        fingerprint.update({
+            'path': digest.hexdigest(),
+            'output_file': os.path.abspath(self.output_file),
+            'output_format': self.output_format,
+            'output_compression': self.output_compression,
+            'output_compression_level': self.output_compression_level,
+            'shard_size_mb': self.shard_size_mb,
+            'dedup': self.deduplicator is not None,
+        })
+        return fingerprint
+
+    def _open_writer(self, writer: BaseWriter, paths: List[str]) -> Optional[Checkpoint]:
+        """
+        Yazıcıyı açar; geçerli bir kontrol noktası varsa kaldığı yerden devam ettirir
+        
+        Args:
+            writer (BaseWriter): Açılmamış yazıcı
+            paths (List[str]): İşlenecek dosya ve dizin yolları
+            
+        Returns:
+            Optional[Checkpoint]: Kontrol noktası kapalıysa None
+        """
+        if not self.checkpoint_file:
+            writer.open()
+            return None
+
+        fingerprint = self._checkpoint_fingerprint(paths)
+        checkpoint = Checkpoint.load(self.checkpoint_file, fingerprint)
+        if checkpoint is not None:
+            try:
+                writer.resume(checkpoint.writer_state)
+            except OSError as e:
+                logger.warning(f"Çıktıya devam edilemedi, çalışma baştan başlayacak: {str(e)}")
+                checkpoint = None
+        if checkpoint is None:
+            writer.open()
+            return Checkpoint(self.checkpoint_file, fingerprint)
+
+        self.error_files.update(checkpoint.errors)
+        logger.info(f"Kontrol noktasından devam ediliyor: {len(checkpoint.completed)} dosya tamamlanmış, "
+                    f"{writer.records_written} kayıt yazılmış.")
+        if self.deduplicator is not None:
+            logger.info("Tekrar eden içerik kontrolü yalnızca devam edilen kısmı kapsar.")
+        return checkpoint
+
+    def _save_checkpoint(self, writer: BaseWriter, checkpoint: Checkpoint, completed: List[str]) -> None:
+        """
+        Yazıcının çıktısını diske aktarır ve kontrol noktasını kaydeder
+        
+        Args:
+            writer (BaseWriter): Açık yazıcı
+            checkpoint (Checkpoint): Kontrol noktası
+            completed (List[str]): Son kayıttan bu yana tamamlanan dosyalar
+        """
+        start = time.perf_counter()
+        checkpoint.save(completed, writer.checkpoint_state(), self.error_files)
+        self.metrics.add_stage('write', time.perf_counter() - start)
+        logger.info(f"Kontrol noktası kaydedildi: {len(checkpoint.completed)} dosya tamamlandı.")
+
+    def _output_fingerprint(self, path: str) -> Dict[str, Any]:
+        """
+        Artımlı çıktının formatını belirleyen ayarları döndürür
+        
+        Args:
+            path (str): İşlenen dosya veya dizin yolu
+            
+        Returns:
+            Dict[str, Any]: Format ayarları; değişirse çıktı baştan oluşturulur
+        """
+        return dict(self._extraction_settings(),
+                    format_version=self.FORMAT_VERSION,
+                    path=os.path.abspath(path),
+                    max_file_size_mb=self.max_file_size_mb,
+                    archives=self.archives)
+
+    def _extraction_settings(self) -> Dict[str, Any]:
+        """
+        Bir dosyadan çıkarılan metni etkileyen ayarları döndürür
+        
+        Önbellek kayıtları bu ayarlarla eşleştirilir; artımlı çıktı ve kontrol
+        noktası da bunlar değişince geçersiz sayılır.
+        
+        Returns:
+            Dict[str, Any]: Extractor ayarları
+        """
+        return {
+            'encoding_sample_bytes': self.encoding_sample_bytes,
+            'control_char_threshold': self.control_char_threshold,
+            'magic_fallback': self.magic_fallback,
+            'pdf_max_pages': self.pdf_max_pages,
+            'pdf_laparams': self.pdf_laparams,
+            'pdf_layout_analysis': self.pdf_layout_analysis,
+            'spreadsheet_max_rows': self.spreadsheet_max_rows,
+            'spreadsheet_max_columns': self.spreadsheet_max_columns,
+            'office_xml_formats': self.office_xml_formats,
+            'array_preview_items': self.array_preview_items,
+            'array_max_scan_mb': self.array_max_scan_mb,
+        }
+
+    def _stat_files(self, path: str) -> Dict[str, os.stat_result]:
+        """
+        Tek bir stat geçişiyle tüm dosyaların durumunu toplar
+        
+        Args:
+            path (str): Dosya veya dizin yolu
+            
+        Returns:
+            Dict[str, os.stat_result]: Dosya yolu ve stat sonucu (tarama sırasıyla)
+        """
+        if not os.path.isfile(path):
+            return dict(self.metrics.timed('scan', self.scanner.scan(path)))
+        try:
+            return {path: os.stat(path)}
+        except OSError as e:
+            logger.warning(f"Dosya durumu okunamadı {path}: {str(e)}")
+            return {}
+
+    def process_incremental(self, path: str) -> None:
+        """
+        Çıktıyı yalnızca eklenen, değişen ve silinen dosyalar için günceller
+        
+        Manifest yoksa veya format ayarları değiştiyse çıktı baştan oluşturulur.
+        
+        Args:
+            path (str): İşlenecek dosya veya dizin yolu
+        """
+        if not os.path.exists(path):
+            logger.error(f"Geçersiz yol: {path}")
+            return
+
+        fingerprint = self._output_fingerprint(path)
+        manifest = OutputManifest.load(self.manifest_file, fingerprint)
+        if manifest is not None and (not os.path.exists(self.output_file) or
+                                     os.path.getsize(self.output_file) != manifest.output_size):
+            logger.warning("Çıktı dosyası manifest ile uyuşmuyor, çıktı baştan oluşturulacak.")
+            manifest = None
+        if manifest is None:
+            manifest = OutputManifest(self.manifest_file, fingerprint)
+
+        stats = self._stat_files(path)
+        # Arşiv üyeleri, arşivin kendisi diskte durdukça silinmiş sayılmaz
+        deleted = [file_path for file_path in manifest.entries
+                   if self._archive_root(file_path) not in stats]
+        changed = []
+        for file_path, st in stats.items():
+            entry = manifest.entries.get(file_path)
+            if entry is None or entry['mtime_ns'] != st.st_mtime_ns or entry['size'] != st.st_size:
+                changed.append(file_path)
+
+        if not changed and not deleted:
+            logger.info(f"Değişiklik yok, {self.output_file} güncel.")
+            return
+
+        added = sum(1 for file_path in changed if file_path not in manifest.entries)
+        emitted: Set[str] = set()
+        with IncrementalWriter(self.output_file, manifest, compact_ratio=self.compact_ratio) as writer:
+            for file_path in deleted:
+                writer.remove(file_path)
+            for file_path, content in self._iter_results((file_path, stats[file_path])
+                                                          for file_path in changed):
+                emitted.add(file_path)
+                if file_path in self.error_files:
+                    # Hatalı dosyalar manifest'e yazılmaz, sonraki çalışmada tekrar denenir
+                    writer.remove(file_path)
+                else:
+                    start = time.perf_counter()
+                    writer.upsert(file_path, content, stats[self._archive_root(file_path)])
+                    self.metrics.add_stage('write', time.perf_counter() - start)
+            if self.archive_reader is not None:
+                archives = [file_path for file_path in changed if self.archive_reader.is_archive(file_path)]
+                self._sync_archive_entries(writer, archives, emitted, stats)
+
+        logger.info(f"Artımlı güncelleme: {added} eklendi, {len(changed) - added} değişti, "
+                    f"{len(deleted)} silindi.")
+        self._report_results()
+        if self.cache:
+            self._report_cache()
+
+    @staticmethod
+    def _archive_root(file_path: str) -> str:
+        """Arşiv üyesinin diskteki arşivinin yolunu, diğer dosyalarda yolun kendisini döndürür"""
+        return file_path.split(ArchiveReader.SEPARATOR, 1)[0]
+
+    def _sync_archive_entries(self, writer: IncrementalWriter, archives: List[str], emitted: Set[str],
+                              stats: Dict[str, os.stat_result]) -> None:
+        """
+        Yeniden okunan arşivlerin manifest kayıtlarını günceller
+        
+        Arşivden artık çıkmayan üyelerin kayıtları silinir. Arşivin kendisi çıktı
+        üretmeyen bir kayıt olarak işaretlenir; böylece değişmedikçe tekrar açılmaz.
+        
+        Args:
+            writer (IncrementalWriter): Açık artımlı yazıcı
+            archives (List[str]): Bu çalışmada okunan arşivler
+            emitted (Set[str]): Bu çalışmada işlenen dosya ve üye yolları
+            stats (Dict[str, os.stat_result]): Diskteki dosyaların stat sonuçları
+        """
+        if not archives:
+            return
+        archive_set = set(archives)
+        stale = [file_path for file_path in writer.manifest.entries
+                 if ArchiveReader.SEPARATOR in file_path and file_path not in emitted and
+                 self._archive_root(file_path) in archive_set]
+        for file_path in stale:
+            writer.remove(file_path)
+        for archive_path in archives:
+            if archive_path in self.error_files:
+                writer.remove(archive_path)
+            else:
+                writer.upsert(archive_path, None, stats[archive_path])
+
+    def _report_results(self) -> None:
+        """İşlenen ve hata veren dosyaların özetini raporlar"""
+        logger.info(f"Toplam {len(self.processed_files)} dosya başarıyla işlendi.")
+        if self.error_files:
+            logger.warning(f"{len(self.error_files)} dosya işlenemedi:")
+            for file_path, error in self.error_files.items():
+                logger.warning(f"- {file_path}: {error}")
+        if self.deduplicator and self.deduplicator.duplicates:
+            logger.info(f"Tekrar eden içerik: {self.deduplicator.duplicates} kopya "
+                        f"({self.deduplicator.saved_bytes / (1024 * 1024):.2f}MB) yeniden çıkarılmadı, "
+                        f"yaklaşık {self.deduplicator.saved_seconds:.2f} saniye kazanıldı.")
+        if self.quarantine:
+            logger.info(f"Karantinada {len(self.quarantine)} dosya var ({self.quarantine_file}).")
+
+    def _report_metrics(self, wall_seconds: float) -> None:
+        """
+        Verim özetini loglar, istenen ölçüm raporlarını yazar
+        
+        Args:
+            wall_seconds (float): Çalışmanın toplam süresi
+        """
+        metrics = self.metrics
+        if metrics.total.files and wall_seconds > 0:
+            busiest = max(metrics.STAGES, key=lambda stage: metrics.stage_seconds[stage])
+            logger.info(f"Verim: {metrics.total.files / wall_seconds:.1f} dosya/s, "
+                        f"{metrics.total.bytes / (1024 * 1024) / wall_seconds:.2f} MB/s "
+                        f"(p95 {metrics.total.latency.percentile(0.95) * 1000:.1f}ms, "
+                        f"en uzun aşama: {busiest} {metrics.stage_seconds[busiest]:.2f}s)")
+        if self.metrics_file:
+            metrics.write_json(self.metrics_file, wall_seconds)
+        if self.prometheus_file:
+            metrics.write_prometheus(self.prometheus_file, wall_seconds)
+
+    def _report_cache(self) -> None:
+        """Önbellek sayaçlarını raporlar ve sınırları aşan kayıtları temizler"""
+        total = self.cache.hits + self.cache.misses
+        ratio = (self.cache.hits / total * 100) if total else 0.0
+        logger.info(f"Önbellek: {self.cache.hits} isabet, {self.cache.misses} ıskalama (%{ratio:.1f} isabet)")
+        removed = self.cache.evict()
+        if removed:
+            logger.info(f"Önbellekten {removed} eski kayıt silindi.")
\ No newline at end of file
@@ -0,0 +1,199 @@
+import bz2
+import gzip
+import io
+import lzma
+import os
+import tarfile
+import time
+import zipfile
+from typing import BinaryIO, Callable, Dict, Iterator, List, Optional, Tuple, Union
+from .logger import logger
+
+# Arşiv üyesi: (sanal yol, içerik, stat sonucu)
+ArchiveMember = Tuple[str, bytes, os.stat_result]
+
+
+class ArchiveLimitError(Exception):
+    """Arşivden okunan toplam bayt sınırı aşıldığında fırlatılır"""
+
+
+class ArchiveReader:
+    """ZIP/TAR/GZ/BZ2/XZ arşivlerinin üyelerini diske açmadan bellekte okur"""
+
+    # Sanal yolda arşiv ile üye arasındaki ayraç (arsiv.zip!/klasor/dosya.py)
+    SEPARATOR: str = '!/'
+    # Üyeler okunurken kullanılan parça boyutu (byte)
+    CHUNK_SIZE: int = 1024 * 1024
+    # Tar arşivi olarak açılan adlar
+    TAR_SUFFIXES: Tuple[str, ...] = ('.tar', '.tar.gz', '.tgz', '.tar.bz2', '.tbz2', '.tbz',
+                                     '.tar.xz', '.txz')
+    # Tek dosyalık sıkıştırılmış akışlar
+    COMPRESSED_OPENERS: Dict[str, Callable[[BinaryIO], BinaryIO]] = {
+        '.gz': lambda source: gzip.GzipFile(fileobj=source),
+        '.bz2': lambda source: bz2.BZ2File(source),
+        '.xz': lambda source: lzma.LZMAFile(source),
+    }
+
+    def __init__(self, max_depth: int = 3, max_total_bytes: Optional[int] = None,
+                 max_member_bytes: Optional[int] = None):
+        """
+        ArchiveReader sınıfının başlatıcısı
+
+        Args:
+            max_depth (int): İç içe açılacak en fazla arşiv seviyesi (1 ise iç arşivler açılmaz)
+            max_total_bytes (Optional[int]): Bir arşivden (iç arşivler dahil) açılacak toplam bayt
+            max_member_bytes (Optional[int]): Belleğe alınacak en büyük üye boyutu (byte)
+        """
+        self.max_depth = max_depth
+        self.max_total_bytes = max_total_bytes
+        self.max_member_bytes = max_member_bytes
+
+    def is_archive(self, file_path: str) -> bool:
+        """Dosya adının desteklenen bir arşive ait olup olmadığını döndürür"""
+        name = os.path.basename(file_path).lower()
+        return (name.endswith('.zip') or name.endswith(self.TAR_SUFFIXES) or
+                os.path.splitext(name)[1] in self.COMPRESSED_OPENERS)
+
+    def iter_members(self, archive_path: str, source: Optional[BinaryIO] = None) -> Iterator[ArchiveMember]:
+        """
+        Arşivdeki normal dosyaları arşiv sırasıyla üretir
+
+        Boyut sınırını aşan üyeler uyarıyla atlanır. Toplam bayt sınırı aşılırsa
+        o ana kadar üretilen üyeler geçerli kalır ve ArchiveLimitError fırlatılır.
+
+        Args:
+            archive_path (str): Arşivin yolu
+            source (Optional[BinaryIO]): Arşiv içeriği (None ise dosya açılır)
+
+        Returns:
+            Iterator[ArchiveMember]: (sanal yol, içerik, stat sonucu) üçlüleri
+
+        Raises:
+            ArchiveLimitError: Toplam bayt sınırı aşılırsa
+        """
+        budget = [self.max_total_bytes]
+        if source is not None:
+            yield from self._walk(archive_path, source, 0, 1, budget)
+            return
+        with open(archive_path, 'rb') as f:
+            yield from self._walk(archive_path, f, os.fstat(f.fileno()).st_mtime, 1, budget)
+
+    def _walk(self, archive_path: str, source: BinaryIO, mtime: float, depth: int,
+              budget: List[Optional[int]]) -> Iterator[ArchiveMember]:
+        """Arşivin türüne göre üyeleri okur, iç arşivlere derinlik sınırı içinde iner"""
+        name = os.path.basename(archive_path).lower()
+        if name.endswith('.zip'):
+            members = self._iter_zip(archive_path, source, depth, budget)
+        elif name.endswith(self.TAR_SUFFIXES):
+            members = self._iter_tar(archive_path, source, depth, budget)
+        else:
+            members = self._iter_compressed(archive_path, source, mtime, depth, budget)
+
+        for member_path, data, stat_result in members:
+            if self.is_archive(member_path):
+                yield from self._walk(member_path, io.BytesIO(data), stat_result.st_mtime,
+                                      depth + 1, budget)
+            else:
+                yield member_path, data, stat_result
+
+    def _iter_zip(self, archive_path: str, source: BinaryIO, depth: int,
+                  budget: List[Optional[int]]) -> Iterator[ArchiveMember]:
+        """ZIP üyelerini okur"""
+        with zipfile.ZipFile(source) as archive:
+            for info in archive.infolist():
+                if info.is_dir():
+                    continue
+                member_path = f"{archive_path}{self.SEPARATOR}{info.filename}"
+                if not self._wanted(member_path, info.file_size, depth):
+                    continue
+                try:
+                    with archive.open(info) as stream:
+                        data = self._read(member_path, stream, budget)
+                except (RuntimeError, zipfile.BadZipFile, NotImplementedError) as e:
+                    # Şifreli veya bozuk üye; diğer üyeler okunmaya devam eder
+                    logger.warning(f"Arşiv üyesi okunamadı {member_path}: {str(e)}")
+                    continue
+                if data is not None:
+                    mtime = time.mktime(info.date_time + (0, 0, -1))
+                    yield member_path, data, self._member_stat(len(data), mtime)
+
+    def _iter_tar(self, archive_path: str, source: BinaryIO, depth: int,
+                  budget: List[Optional[int]]) -> Iterator[ArchiveMember]:
+        """TAR üyelerini (sıkıştırılmış olsalar da) tek geçişte, geri sarmadan okur"""
+        with tarfile.open(fileobj=source, mode='r|*') as archive:
+            for info in archive:
+                if not info.isfile():
+                    continue
+                member_path = f"{archive_path}{self.SEPARATOR}{info.name}"
+                if not self._wanted(member_path, info.size, depth):
+                    continue
+                data = self._read(member_path, archive.extractfile(info), budget)
+                if data is not None:
+                    yield member_path, data, self._member_stat(len(data), info.mtime)
+
+    def _iter_compressed(self, archive_path: str, source: BinaryIO, mtime: float, depth: int,
+                         budget: List[Optional[int]]) -> Iterator[ArchiveMember]:
+        """Tek dosyalık GZ/BZ2/XZ akışını açar; üyenin adı ve zamanı arşivinkidir"""
+        root, ext = os.path.splitext(os.path.basename(archive_path))
+        member_path = f"{archive_path}{self.SEPARATOR}{root}"
+        if not self._wanted(member_path, 0, depth):
+            return
+        with self.COMPRESSED_OPENERS[ext.lower()](source) as stream:
+            data = self._read(member_path, stream, budget)
+        if data is not None:
+            yield member_path, data, self._member_stat(len(data), mtime)
+
+    def _wanted(self, member_path: str, size: int, depth: int) -> bool:
+        """
+        Üyenin okunup okunmayacağını döndürür, atlanan üyeler için uyarır
+
+        İç arşivlere boyut sınırı değil derinlik ve toplam bayt sınırı uygulanır.
+        """
+        if self.is_archive(member_path):
+            if depth >= self.max_depth:
+                logger.warning(f"Arşiv derinlik sınırı ({self.max_depth}) aşıldı, atlandı: {member_path}")
+                return False
+            return True
+        return not self._too_large(member_path, size)
+
+    def _too_large(self, member_path: str, size: int) -> bool:
+        """Üye boyutu sınırı aşıyorsa uyarır; iç arşivler bu sınıra tabi değildir"""
+        if self.max_member_bytes is not None and size > self.max_member_bytes and \
+                not self.is_archive(member_path):
+            logger.warning(f"{member_path} dosyası boyut limitini aşıyor.")
+            return True
+        return False
+
+    def _read(self, member_path: str, stream: BinaryIO,
+              budget: List[Optional[int]]) -> Optional[bytes]:
+        """
+        Üyeyi parça parça okur; bildirilen boyuta güvenilmez, sınırlar okurken uygulanır
+
+        Returns:
+            Optional[bytes]: İçerik veya None (üye boyut sınırını aşıyorsa)
+
+        Raises:
+            ArchiveLimitError: Toplam bayt sınırı aşılırsa
+        """
+        chunks = []
+        size = 0
+        while True:
+            chunk = stream.read(self.CHUNK_SIZE)
+            if not chunk:
+                break
+            size += len(chunk)
+            if budget[0] is not None:
+                budget[0] -= len(chunk)
+                if budget[0] < 0:
+                    raise ArchiveLimitError(
+                        f"Arşivden açılan toplam bayt sınırı ({self.max_total_bytes} byte) aşıldı: {member_path}")
+            if self._too_large(member_path, size):
+                return None
+            chunks.append(chunk)
+        return b''.join(chunks)
+
+    @staticmethod
+    def _member_stat(size: int, mtime: Union[int, float]) -> os.stat_result:
+        """Üye için önbellek ve artımlı mod anahtarında kullanılacak stat sonucu oluşturur"""
+        return os.stat_result((0o100644, 0, 0, 1, 0, 0, size, int(mtime), int(mtime), int(mtime)),
+                              {'st_mtime_ns': int(mtime * 1_000_000_000)})
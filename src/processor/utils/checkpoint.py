@@ -0,0 +1,121 @@
+import json
+import os
+import time
+from typing import Any, Dict, Iterable, Optional, Set
+from .logger import logger
+
+
+class Checkpoint:
+    """Yarıda kalan bir çalışmanın kaldığı yerden devam edebilmesi için ilerlemeyi kaydeder"""
+
+    # Kontrol noktası dosyasının yapısı değiştiğinde artırılır
+    CHECKPOINT_VERSION: int = 1
+
+    def __init__(self, checkpoint_file: str, fingerprint: Dict[str, Any]):
+        """
+        Checkpoint sınıfının başlatıcısı
+
+        İki dosya kullanılır: checkpoint_file (JSON) yazıcının durumunu, hataları
+        ve günlüğün geçerli boyutunu; checkpoint_file.paths ise tamamlanan dosya
+        yollarını satır başına bir JSON dizesi olarak tutar. Günlüğe yalnızca
+        yeni yollar eklendiğinden kayıt maliyeti dosya sayısıyla büyümez. JSON
+        günlükten sonra atomik olarak yazılır; arada kesilen bir kaydın günlüğe
+        eklediği fazlalık okunurken yok sayılır ve sonraki kayıtta silinir.
+
+        Args:
+            checkpoint_file (str): Kontrol noktası JSON dosyası
+            fingerprint (Dict[str, Any]): Çalışmayı belirleyen ayarlar (girdi yolları, çıktı biçimi vb.)
+        """
+        self.checkpoint_file = checkpoint_file
+        self.journal_file = f"{checkpoint_file}.paths"
+        self.fingerprint = fingerprint
+        self.completed: Set[str] = set()
+        self.errors: Dict[str, str] = {}
+        self.writer_state: Optional[Dict[str, Any]] = None
+        self._journal_size = 0
+
+    @classmethod
+    def load(cls, checkpoint_file: str, fingerprint: Dict[str, Any]) -> Optional["Checkpoint"]:
+        """
+        Kontrol noktasını yükler
+
+        Args:
+            checkpoint_file (str): Kontrol noktası JSON dosyası
+            fingerprint (Dict[str, Any]): Beklenen çalışma ayarları
+
+        Returns:
+            Optional[Checkpoint]: Devam edilebilecek kontrol noktası veya None (baştan başlanır)
+        """
+        if not os.path.exists(checkpoint_file):
+            return None
+        try:
+            with open(checkpoint_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Kontrol noktası okunamadı {checkpoint_file}: {str(e)}")
+            return None
+
+        if data.get('version') != cls.CHECKPOINT_VERSION or data.get('fingerprint') != fingerprint:
+            logger.info("Kontrol noktası başka ayarlarla oluşturulmuş, çalışma baştan başlayacak.")
+            return None
+
+        checkpoint = cls(checkpoint_file, fingerprint)
+        try:
+            with open(checkpoint.journal_file, 'rb') as f:
+                journal = f.read(data['journal_size'])
+            if len(journal) != data['journal_size']:
+                raise ValueError("günlük eksik")
+            checkpoint.completed.update(json.loads(line) for line in journal.splitlines())
+        except (OSError, ValueError) as e:
+            logger.warning(f"Kontrol noktası günlüğü okunamadı {checkpoint.journal_file}: {str(e)}")
+            return None
+        checkpoint._journal_size = data['journal_size']
+        checkpoint.errors = data['errors']
+        checkpoint.writer_state = data['writer_state']
+        return checkpoint
+
+    def save(self, completed: Iterable[str], writer_state: Dict[str, Any], errors: Dict[str, str]) -> None:
+        """
+        Yeni tamamlanan yolları günlüğe ekler ve kontrol noktasını atomik olarak yazar
+
+        Çağrılmadan önce yazıcının çıktısı diske aktarılmış olmalıdır.
+
+        Args:
+            completed (Iterable[str]): Son kayıttan bu yana tamamlanan yollar
+            writer_state (Dict[str, Any]): Yazıcının devam etmek için gereken durumu
+            errors (Dict[str, str]): Şimdiye kadar hata veren dosyalar
+        """
+        new_paths = [path for path in completed if path not in self.completed]
+        # JSON dizesi olarak yazılır; satır sonu veya geçersiz UTF-8 içeren yollar da korunur
+        journal = ''.join(f"{json.dumps(path)}\n" for path in new_paths).encode('ascii')
+        with open(self.journal_file, 'r+b' if self._journal_size else 'wb') as f:
+            # Önceki kesintiden kalmış olabilecek fazlalık atılır
+            f.seek(self._journal_size)
+            f.truncate()
+            f.write(journal)
+            f.flush()
+            os.fsync(f.fileno())
+        self.completed.update(new_paths)
+        self._journal_size += len(journal)
+        self.writer_state = writer_state
+        self.errors = dict(errors)
+
+        temp_file = f"{self.checkpoint_file}.tmp"
+        with open(temp_file, 'w', encoding='utf-8') as f:
+            json.dump({
+                'version': self.CHECKPOINT_VERSION,
+                'fingerprint': self.fingerprint,
+                'time': time.time(),
+                'journal_size': self._journal_size,
+                'errors': self.errors,
+                'writer_state': writer_state,
+            }, f, ensure_ascii=False)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_file, self.checkpoint_file)
+
+    def remove(self) -> None:
+        """Çalışma tamamlandığında kontrol noktası dosyalarını siler"""
+        for path in (self.checkpoint_file, self.journal_file):
+            if os.path.exists(path):
+                os.remove(path)
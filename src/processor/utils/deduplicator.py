@@ -0,0 +1,139 @@
+import hashlib
+from typing import Dict, Optional, Set, Tuple
+from .file_probe import FileProbe
+from .logger import logger
+
+# Tekrar anahtarı: (boyut, içerik hash'i)
+ContentKey = Tuple[int, str]
+
+
+class ContentDeduplicator:
+    """Aynı içerikli dosyaları boyut grubu ve içerik hash'i ile tanır"""
+
+    # Dosya hash'lenirken okunan parça boyutu (byte)
+    HASH_CHUNK_SIZE: int = 1024 * 1024
+
+    def __init__(self):
+        """
+        ContentDeduplicator sınıfının başlatıcısı
+
+        Bir dosya yalnızca aynı boyutta başka bir dosya görülmüşse hash'lenir;
+        boyutunda ilk olan dosyanın hash'i ancak ikinci bir aday geldiğinde
+        diskten okunarak hesaplanır. Boş dosyalar tekrar sayılmaz.
+        """
+        self._sizes: Set[int] = set()
+        # Boyutunda tek olduğu için henüz hash'lenmemiş dosyalar
+        self._unhashed: Dict[int, str] = {}
+        self._originals: Dict[ContentKey, str] = {}
+        # İlk kopya olarak kaydedilmiş, çıkarımı henüz bitmemiş dosyalar
+        self._pending: Dict[str, Tuple[int, Optional[str]]] = {}
+        # Çıkarımı tamamlanan ilk kopyalar ve çıkarım süreleri
+        self.seconds: Dict[str, float] = {}
+        self.duplicates = 0
+        self.saved_bytes = 0
+        self.saved_seconds = 0.0
+
+    def check(self, probe: FileProbe) -> Optional[str]:
+        """
+        Dosyanın içeriği daha önce görülmüşse ilk kopyanın yolunu döndürür
+
+        Görülmemişse dosya o içeriğin ilk kopyası olarak kaydedilir; çıkarımı
+        bittiğinde confirm, başarısız olursa release çağrılmalıdır.
+
+        Args:
+            probe (FileProbe): Dosyanın probe'u
+
+        Returns:
+            Optional[str]: İlk kopyanın yolu veya None
+        """
+        size = probe.size
+        if size == 0:
+            return None
+        if size not in self._sizes:
+            self._sizes.add(size)
+            if probe.in_memory:
+                # Bellekteki içerik sonra tekrar okunamaz, hemen hash'lenir
+                self._add(probe.path, (size, self._hash(probe)))
+            else:
+                self._unhashed[size] = probe.path
+                self._pending[probe.path] = (size, None)
+            return None
+
+        first = self._unhashed.pop(size, None)
+        if first is not None:
+            try:
+                self._add(first, (size, self._hash_file(first)), claim=first in self._pending)
+            except OSError as e:
+                logger.warning(f"Tekrar kontrolü için dosya okunamadı {first}: {str(e)}")
+
+        key = (size, self._hash(probe))
+        original = self._originals.get(key)
+        if original is not None:
+            return original
+        self._add(probe.path, key)
+        return None
+
+    def confirm(self, file_path: str, seconds: float) -> None:
+        """
+        İlk kopyanın çıkarımının tamamlandığını ve süresini kaydeder
+
+        Args:
+            file_path (str): İlk kopyanın yolu
+            seconds (float): Çıkarım süresi
+        """
+        if self._pending.pop(file_path, None) is not None:
+            self.seconds[file_path] = seconds
+
+    def release(self, file_path: str) -> None:
+        """
+        Çıkarımı başarısız olan ilk kopyanın kaydını siler; aynı içerikli sonraki dosya işlenir
+
+        Args:
+            file_path (str): Dosya yolu
+        """
+        entry = self._pending.pop(file_path, None)
+        if entry is None:
+            return
+        size, digest = entry
+        if digest is None:
+            if self._unhashed.get(size) == file_path:
+                del self._unhashed[size]
+                self._sizes.discard(size)
+        elif self._originals.get((size, digest)) == file_path:
+            del self._originals[(size, digest)]
+
+    def is_confirmed(self, file_path: str) -> bool:
+        """İlk kopyanın çıkarımı tamamlandıysa True döndürür"""
+        return file_path in self.seconds
+
+    def record(self, size: int, original: str) -> None:
+        """
+        Atlanan bir kopyayı kazanç sayaçlarına ekler
+
+        Args:
+            size (int): Atlanan dosyanın boyutu (byte)
+            original (str): İlk kopyanın yolu
+        """
+        self.duplicates += 1
+        self.saved_bytes += size
+        self.saved_seconds += self.seconds.get(original, 0.0)
+
+    def _add(self, file_path: str, key: ContentKey, claim: bool = True) -> None:
+        """Dosyayı içeriğin ilk kopyası olarak kaydeder"""
+        self._originals.setdefault(key, file_path)
+        if claim:
+            self._pending[file_path] = key
+
+    def _hash(self, probe: FileProbe) -> str:
+        """Dosya içeriğinin hash'ini döndürür, içerik bellekteyse dosya tekrar okunmaz"""
+        if probe.complete:
+            return hashlib.blake2b(probe.data, digest_size=20).hexdigest()
+        return self._hash_file(probe.path)
+
+    def _hash_file(self, file_path: str) -> str:
+        """Dosya içeriğinin blake2b hash'ini diskten parça parça okuyarak döndürür"""
+        digest = hashlib.blake2b(digest_size=20)
+        with open(file_path, 'rb') as f:
+            for chunk in iter(lambda: f.read(self.HASH_CHUNK_SIZE), b''):
+                digest.update(chunk)
+        return digest.hexdigest()
@@ -0,0 +1,94 @@
+import os
+from typing import Iterable, Iterator, List, Optional, Tuple
+from .path_rules import PathRules
+from .logger import logger
+
+# Taranan dosya: (dosya yolu, stat sonucu)
+ScanEntry = Tuple[str, os.stat_result]
+
+
+class DirectoryScanner:
+    """Dizin ağacını os.scandir ile tarar; budanan dizinlere hiç girmez"""
+
+    # Varsayılan olarak içine girilmeyen dizin adları
+    DEFAULT_PRUNE_DIRS: Tuple[str, ...] = ('.git', '.hg', '.svn', 'node_modules', 'venv', '.venv',
+                                           '__pycache__')
+
+    def __init__(self, include: Optional[Iterable[str]] = None, exclude: Optional[Iterable[str]] = None,
+                 exclude_file: Optional[str] = None, prune_dirs: Iterable[str] = DEFAULT_PRUNE_DIRS):
+        """
+        DirectoryScanner sınıfının başlatıcısı
+
+        Dosyalar os.walk ile aynı sırada üretilir. Dizin türü DirEntry'den okunur,
+        stat yalnızca kurallardan geçen dosyalar için bir kez alınır ve yol ile
+        birlikte döndürülür; böylece sonraki adımlar dosyayı tekrar stat etmez.
+
+        Args:
+            include (Optional[Iterable[str]]): gitignore sözdiziminde dahil edilecek dosyalar
+                (verilirse yalnızca uyan dosyalar üretilir)
+            exclude (Optional[Iterable[str]]): gitignore sözdiziminde hariç tutulacak yollar;
+                uyan dizinlerin içine girilmez
+            exclude_file (Optional[str]): Hariç tutma kalıplarının okunacağı .gitignore biçimli dosya
+            prune_dirs (Iterable[str]): Adı bunlardan biri olan dizinlerin içine girilmez
+        """
+        self.include = PathRules(include) if include else None
+        self.exclude = PathRules.from_file(exclude_file) if exclude_file else PathRules()
+        for pattern in exclude or ():
+            self.exclude.add(pattern)
+        self.prune_dirs = frozenset(prune_dirs)
+
+    def scan(self, directory_path: str) -> Iterator[ScanEntry]:
+        """
+        Dizindeki dosyaları alt dizinleriyle birlikte üretir
+
+        Sembolik bağlantılı dizinlerin içine girilmez (os.walk varsayılanı gibi).
+
+        Args:
+            directory_path (str): Dizin yolu
+
+        Returns:
+            Iterator[ScanEntry]: (dosya yolu, stat sonucu) çiftleri
+        """
+        # Yığın, os.walk'taki gibi önce dizinin dosyalarını sonra alt dizinlerini sırayla verir
+        stack: List[Tuple[str, str]] = [(directory_path, '')]
+        while stack:
+            dir_path, rel_dir = stack.pop()
+            try:
+                with os.scandir(dir_path) as iterator:
+                    entries = list(iterator)
+            except OSError as e:
+                logger.warning(f"Dizin okunamadı {dir_path}: {str(e)}")
+                continue
+
+            subdirs: List[Tuple[str, str]] = []
+            for entry in entries:
+                rel_path = rel_dir + entry.name
+                if self._is_dir(entry):
+                    if not entry.is_symlink() and not self._pruned(entry.name, rel_path):
+                        subdirs.append((entry.path, rel_path + '/'))
+                    continue
+                if not self._wanted(rel_path):
+                    continue
+                try:
+                    yield entry.path, entry.stat()
+                except OSError as e:
+                    logger.warning(f"Dosya durumu okunamadı {entry.path}: {str(e)}")
+            stack.extend(reversed(subdirs))
+
+    @staticmethod
+    def _is_dir(entry: os.DirEntry) -> bool:
+        """Girdinin dizin olup olmadığını döndürür (çoğu sistemde ek stat gerektirmez)"""
+        try:
+            return entry.is_dir()
+        except OSError:
+            return False
+
+    def _pruned(self, name: str, rel_path: str) -> bool:
+        """Dizinin içine girilmeyecekse True döndürür"""
+        return name in self.prune_dirs or self.exclude.match(rel_path, is_dir=True) is True
+
+    def _wanted(self, rel_path: str) -> bool:
+        """Dosyanın kurallardan geçip geçmediğini döndürür"""
+        if self.exclude and self.exclude.match(rel_path) is True:
+            return False
+        return self.include is None or self.include.match(rel_path) is True
@@ -0,0 +1,234 @@
+import hashlib
+import json
+import os
+import sqlite3
+import time
+from typing import Any, Dict, Optional, Tuple
+from .file_probe import FileProbe
+from .logger import logger
+
+
+class ExtractionCache:
+    """Çıkarılan metinleri SQLite dosyasında saklayan kalıcı önbellek"""
+
+    # Hash hesaplanırken okunan parça boyutu (byte)
+    HASH_CHUNK_SIZE: int = 1024 * 1024
+    # Tablonun yapısı değiştiğinde artırılır (eski kayıtlar silinir)
+    SCHEMA_VERSION: int = 2
+
+    def __init__(self, cache_file: str, max_size_mb: Optional[float] = None,
+                 max_age_days: Optional[float] = None, use_hash: bool = False,
+                 settings: Optional[Dict[str, Any]] = None):
+        """
+        ExtractionCache sınıfının başlatıcısı
+
+        Kayıtlar (yol, çıkarım ayarları, boyut, mtime_ns, opsiyonel içerik hash'i)
+        ile eşleştirilir. Farklı ayarlarla (ör. satır veya sayfa sınırı) çıkarılan
+        metinler ayrı kayıtlarda tutulur. Hash açıksa yolu değişmiş fakat içeriği
+        aynı olan dosyalar da isabet sayılır. Her yazma kendi kısa işleminde
+        diske işlenir; aynı dosyayı kullanan diğer süreçler yazma kilidini beklemez.
+
+        Args:
+            cache_file (str): SQLite önbellek dosyasının yolu
+            max_size_mb (Optional[float]): Saklanacak toplam metin boyutu sınırı (MB)
+            max_age_days (Optional[float]): Son erişimden sonra kaydın saklanacağı gün sayısı
+            use_hash (bool): Dosya içeriğinin hash'ini de anahtara kat
+            settings (Optional[Dict[str, Any]]): Çıkarılan metni etkileyen ayarlar (JSON'a çevrilebilir)
+        """
+        self.cache_file = cache_file
+        self.max_size_mb = max_size_mb
+        self.max_age_days = max_age_days
+        self.use_hash = use_hash
+        self.settings_key = hashlib.blake2b(json.dumps(settings or {}, sort_keys=True).encode('utf-8'),
+                                            digest_size=16).hexdigest()
+        self.hits = 0
+        self.misses = 0
+
+        self._conn: Optional[sqlite3.Connection] = None
+        self._connect()
+
+    def _connect(self) -> sqlite3.Connection:
+        """
+        Bağlantıyı döndürür; kapatılmışsa yeniden açar ve tabloyu hazırlar
+
+        Returns:
+            sqlite3.Connection: Açık bağlantı
+        """
+        if self._conn is not None:
+            return self._conn
+        conn = sqlite3.connect(self.cache_file, timeout=60)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        if conn.execute("PRAGMA user_version").fetchone()[0] != self.SCHEMA_VERSION:
+            # Önbellek yeniden oluşturulabilir, eski yapıdaki kayıtlar taşınmaz
+            conn.execute("DROP TABLE IF EXISTS extractions")
+            conn.execute(f"PRAGMA user_version = {self.SCHEMA_VERSION}")
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS extractions (
+                path TEXT NOT NULL,
+                settings TEXT NOT NULL,
+                size INTEGER NOT NULL,
+                mtime_ns INTEGER NOT NULL,
+                content_hash TEXT,
+                extractor TEXT NOT NULL,
+                text TEXT NOT NULL,
+                text_bytes INTEGER NOT NULL,
+                created_at REAL NOT NULL,
+                accessed_at REAL NOT NULL,
+                PRIMARY KEY (path, settings)
+            )
+        """)
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_extractions_hash ON extractions (content_hash, size, settings)")
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_extractions_accessed ON extractions (accessed_at)")
+        conn.commit()
+        self._conn = conn
+        return conn
+
+    def _hash_file(self, file_path: str, probe: Optional[FileProbe] = None) -> str:
+        """Dosya içeriğinin blake2b hash'ini döndürür, içerik bellekteyse dosya tekrar okunmaz"""
+        digest = hashlib.blake2b(digest_size=20)
+        if probe is not None and probe.complete:
+            digest.update(probe.data)
+            return digest.hexdigest()
+        with open(file_path, 'rb') as f:
+            for chunk in iter(lambda: f.read(self.HASH_CHUNK_SIZE), b''):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    def get(self, file_path: str, stat_result: Optional[os.stat_result] = None,
+            probe: Optional[FileProbe] = None) -> Optional[Tuple[str, str]]:
+        """
+        Dosya için önbellekteki metni döndürür
+
+        Args:
+            file_path (str): Dosya yolu
+            stat_result (Optional[os.stat_result]): Önceden alınmış stat sonucu
+            probe (Optional[FileProbe]): Hash için kullanılacak, önceden okunmuş içerik
+
+        Returns:
+            Optional[Tuple[str, str]]: (metin, extractor adı) veya None
+        """
+        try:
+            st = stat_result or os.stat(file_path)
+            row = self._connect().execute(
+                "SELECT size, mtime_ns, content_hash, extractor, text FROM extractions "
+                "WHERE path = ? AND settings = ?", (file_path, self.settings_key)).fetchone()
+
+            content_hash = None
+            if row is not None and row[0] == st.st_size and row[1] == st.st_mtime_ns:
+                if self.use_hash:
+                    content_hash = self._hash_file(file_path, probe)
+                if not self.use_hash or row[2] == content_hash:
+                    self._touch(file_path)
+                    self.hits += 1
+                    return row[4], row[3]
+
+            if self.use_hash:
+                # İçerik adresli arama: aynı içerik başka bir yolda çıkarılmış olabilir
+                content_hash = content_hash or self._hash_file(file_path, probe)
+                row = self._connect().execute(
+                    "SELECT extractor, text FROM extractions "
+                    "WHERE content_hash = ? AND size = ? AND settings = ? LIMIT 1",
+                    (content_hash, st.st_size, self.settings_key)).fetchone()
+                if row is not None:
+                    self.hits += 1
+                    self.put(file_path, row[1], row[0], st, content_hash)
+                    return row[1], row[0]
+
+        except (OSError, sqlite3.Error) as e:
+            logger.warning(f"Önbellek okunamadı {file_path}: {str(e)}")
+
+        self.misses += 1
+        return None
+
+    def put(self, file_path: str, text: str, extractor_name: str,
+            stat_result: Optional[os.stat_result] = None, content_hash: Optional[str] = None,
+            probe: Optional[FileProbe] = None) -> None:
+        """
+        Çıkarılan metni önbelleğe yazar
+
+        Args:
+            file_path (str): Dosya yolu
+            text (str): Çıkarılan metin
+            extractor_name (str): Metni üreten extractor'ın adı
+            stat_result (Optional[os.stat_result]): Önceden alınmış stat sonucu
+            content_hash (Optional[str]): Önceden hesaplanmış içerik hash'i
+            probe (Optional[FileProbe]): Hash için kullanılacak, önceden okunmuş içerik
+        """
+        try:
+            st = stat_result or os.stat(file_path)
+            if self.use_hash and content_hash is None:
+                content_hash = self._hash_file(file_path, probe)
+            now = time.time()
+            with self._connect() as conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO extractions "
+                    "(path, settings, size, mtime_ns, content_hash, extractor, text, text_bytes, "
+                    "created_at, accessed_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    (file_path, self.settings_key, st.st_size, st.st_mtime_ns, content_hash, extractor_name,
+                     text, len(text.encode('utf-8')), now, now))
+        except (OSError, sqlite3.Error) as e:
+            logger.warning(f"Önbelleğe yazılamadı {file_path}: {str(e)}")
+
+    def _touch(self, file_path: str) -> None:
+        """Kaydın son erişim zamanını günceller"""
+        with self._connect() as conn:
+            conn.execute("UPDATE extractions SET accessed_at = ? WHERE path = ? AND settings = ?",
+                         (time.time(), file_path, self.settings_key))
+
+    def evict(self) -> int:
+        """
+        Yaş ve toplam boyut sınırlarını aşan kayıtları siler
+
+        Önce son erişimi max_age_days'den eski kayıtlar silinir, ardından toplam
+        boyut max_size_mb altına inene kadar en uzun süredir erişilmeyenler silinir.
+
+        Returns:
+            int: Silinen kayıt sayısı
+        """
+        removed = 0
+        try:
+            with self._connect() as conn:
+                if self.max_age_days is not None:
+                    cutoff = time.time() - self.max_age_days * 86400
+                    removed += conn.execute(
+                        "DELETE FROM extractions WHERE accessed_at < ?", (cutoff,)).rowcount
+
+                if self.max_size_mb is not None:
+                    limit = int(self.max_size_mb * 1024 * 1024)
+                    total = conn.execute(
+                        "SELECT COALESCE(SUM(text_bytes), 0) FROM extractions").fetchone()[0]
+                    if total > limit:
+                        stale = []
+                        for rowid, text_bytes in conn.execute(
+                                "SELECT rowid, text_bytes FROM extractions ORDER BY accessed_at"):
+                            if total <= limit:
+                                break
+                            stale.append((rowid,))
+                            total -= text_bytes
+                        conn.executemany("DELETE FROM extractions WHERE rowid = ?", stale)
+                        removed += len(stale)
+        except sqlite3.Error as e:
+            logger.warning(f"Önbellek temizlenemedi: {str(e)}")
+        return removed
+
+    def take_counters(self) -> Tuple[int, int]:
+        """
+        İsabet/ıskalama sayaçlarını döndürür ve sıfırlar
+
+        Returns:
+            Tuple[int, int]: (isabet, ıskalama)
+        """
+        counters = (self.hits, self.misses)
+        self.hits = 0
+        self.misses = 0
+        return counters
+
+    def close(self) -> None:
+        """Bağlantıyı kapatır; sonraki kullanımda yeniden açılır"""
+        if self._conn is None:
+            return
+        self._conn.close()
+        self._conn = None
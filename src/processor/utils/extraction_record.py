@@ -0,0 +1,73 @@
+import time
+from typing import Any, Dict, Iterator, Optional, Tuple, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from ..extractors.base_extractor import BaseExtractor
+
+
+class ExtractionRecord:
+    """Yapılandırılmış çıktı biçimleri için metni ve üst verileri taşıyan kayıt"""
+
+    # Yazıcıların kullandığı alan adları (çıktıdaki sırasıyla)
+    FIELDS: Tuple[str, ...] = ('path', 'size', 'mime_type', 'extractor', 'encoding', 'duplicate_of',
+                               'text', 'extraction_seconds')
+
+    def __init__(self, path: str, size: int, mime_type: str, extractor: Optional[str],
+                 encoding: Optional[str] = None, seconds: Optional[float] = None,
+                 text: Optional[str] = None, streamer: Optional["BaseExtractor"] = None,
+                 duplicate_of: Optional[str] = None):
+        """
+        ExtractionRecord sınıfının başlatıcısı
+
+        Metin ya doğrudan text ile verilir ya da streamer ile yazılırken parça
+        parça üretilir. Akış kayıtlarında kodlama ilk parçada, süre son parçada
+        doldurulur (süreye yazıcının harcadığı zaman da dahildir).
+
+        Args:
+            path (str): Dosya yolu
+            size (int): Dosya boyutu (byte)
+            mime_type (str): Dosyanın MIME type'ı
+            extractor (Optional[str]): Metni çıkaran extractor'ın sınıf adı (tekrar kayıtlarında None)
+            encoding (Optional[str]): Metin dosyalarında tespit edilen kodlama
+            seconds (Optional[float]): Çıkarım süresi (saniye)
+            text (Optional[str]): Çıkarılan metin
+            streamer (Optional[BaseExtractor]): Metni iter_text ile üretecek extractor
+            duplicate_of (Optional[str]): Aynı içerikli ilk kopyanın yolu (metin yazılmaz)
+        """
+        self.path = path
+        self.size = size
+        self.mime_type = mime_type
+        self.extractor = extractor
+        self.encoding = encoding
+        self.seconds = seconds
+        self.text = text
+        self.streamer = streamer
+        self.duplicate_of = duplicate_of
+
+    def iter_text(self) -> Iterator[str]:
+        """Metni parça parça üretir; metin yoksa hiçbir şey üretmez"""
+        if self.streamer is None:
+            if self.text:
+                yield self.text
+            return
+
+        start = time.perf_counter()
+        chunks = self.streamer.iter_text(self.path)
+        first = next(chunks, None)
+        if first is None:
+            return
+        self.encoding = self.streamer.last_encoding
+        yield first
+        yield from chunks
+        self.seconds = time.perf_counter() - start
+
+    def metadata(self) -> Dict[str, Any]:
+        """Metin ve süre dışındaki alanları döndürür"""
+        return {
+            'path': self.path,
+            'size': self.size,
+            'mime_type': self.mime_type,
+            'extractor': self.extractor,
+            'encoding': self.encoding,
+            'duplicate_of': self.duplicate_of,
+        }
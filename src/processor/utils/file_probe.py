@@ -0,0 +1,127 @@
+import io
+import os
+from typing import BinaryIO, Optional
+from .file_utils import FileUtils
+
+
+class FileProbe:
+    """Dosyanın tek stat ve tek okuma ile elde edilen bilgilerini taşır"""
+
+    # Binary ve MIME kontrolü için kullanılan baş kısmın boyutu (byte)
+    HEAD_SIZE: int = 8192
+
+    def __init__(self, file_path: str, read_limit: Optional[int] = None,
+                 stat_result: Optional[os.stat_result] = None):
+        """
+        FileProbe sınıfının başlatıcısı
+
+        Dosya içeriği ilk ihtiyaç duyulduğunda tek seferde okunur. Boyutu
+        read_limit'i aşan dosyalarda yalnızca baş kısım okunur; bu durumda
+        tam içerik isteyen extractor dosyayı kendisi açar.
+
+        Args:
+            file_path (str): Dosya yolu
+            read_limit (Optional[int]): Tamamı belleğe okunacak en büyük dosya boyutu (byte)
+            stat_result (Optional[os.stat_result]): Önceden alınmış stat sonucu
+
+        Raises:
+            OSError: Dosya bulunamazsa veya stat alınamazsa
+        """
+        self.path = file_path
+        self.stat = stat_result or os.stat(file_path)
+        self.size = self.stat.st_size
+        self.read_limit = read_limit
+        # Diskte karşılığı olmayan (ör. arşiv üyesi) probe'larda True
+        self.in_memory = False
+        self.name = os.path.basename(file_path).lower()
+        self.extension = FileUtils.get_extension(file_path)
+        self._data: Optional[bytes] = None
+        self._head: Optional[bytes] = None
+        self._is_binary: Optional[bool] = None
+        self._mime_type: Optional[str] = None
+
+    @classmethod
+    def from_bytes(cls, file_path: str, data: bytes,
+                   stat_result: Optional[os.stat_result] = None) -> "FileProbe":
+        """
+        Bellekteki veriden probe oluşturur (diskte karşılığı olmayan dosyalar için)
+
+        Args:
+            file_path (str): Raporlanacak dosya yolu
+            data (bytes): Dosya içeriği
+            stat_result (Optional[os.stat_result]): Kullanılacak stat sonucu
+
+        Returns:
+            FileProbe: Tam içeriği hazır probe
+        """
+        probe = cls.__new__(cls)
+        probe.path = file_path
+        probe.stat = stat_result or os.stat_result((0o100644, 0, 0, 1, 0, 0, len(data), 0, 0, 0),
+                                                   {'st_mtime_ns': 0})
+        probe.size = len(data)
+        probe.read_limit = None
+        probe.in_memory = True
+        probe.name = os.path.basename(file_path).lower()
+        probe.extension = FileUtils.get_extension(file_path)
+        probe._data = data
+        probe._head = None
+        probe._is_binary = None
+        probe._mime_type = None
+        return probe
+
+    @property
+    def size_mb(self) -> float:
+        """Dosya boyutunu MB cinsinden döndürür"""
+        return self.size / (1024 * 1024)
+
+    @property
+    def data(self) -> bytes:
+        """Okunan içeriği döndürür (sınırı aşan dosyalarda yalnızca baş kısım)"""
+        if self._data is None:
+            if self.read_limit is None or self.size <= self.read_limit:
+                limit = self.size
+            else:
+                limit = self.HEAD_SIZE
+            with open(self.path, 'rb') as f:
+                self._data = f.read(limit)
+        return self._data
+
+    @property
+    def complete(self) -> bool:
+        """Dosyanın tamamının bellekte olup olmadığını döndürür"""
+        return len(self.data) >= self.size
+
+    @property
+    def head(self) -> bytes:
+        """Dosyanın baş kısmını döndürür; içerik henüz okunmadıysa yalnızca baş kısmı okur"""
+        if self._data is not None:
+            return self._data[:self.HEAD_SIZE]
+        if self._head is None:
+            with open(self.path, 'rb') as f:
+                self._head = f.read(self.HEAD_SIZE)
+        return self._head
+
+    @property
+    def is_binary(self) -> bool:
+        """Dosyanın binary olup olmadığını döndürür"""
+        if self._is_binary is None:
+            self._is_binary = FileUtils.is_binary_data(self.head)
+        return self._is_binary
+
+    @property
+    def mime_type(self) -> str:
+        """Dosyanın MIME type'ını döndürür"""
+        if self._mime_type is None:
+            self._mime_type = FileUtils.get_mime_type(self.path, head=self.head)
+        return self._mime_type
+
+    def open_binary(self) -> BinaryIO:
+        """
+        İçeriği binary akış olarak döndürür; içerik bellekteyse dosya tekrar açılmaz
+
+        Returns:
+            BinaryIO: Okunabilir binary akış
+        """
+        if self.complete:
+            return io.BytesIO(self.data)
+        return open(self.path, 'rb')
@@ -1,5 +1,5 @@
 import os
-from typing import Set, Dict
+from typing import Set, Dict, Optional
 import mimetypes 
 
 class FileUtils:
@@ -250,15 +250,17 @@ class FileUtils:
             mimetypes.add_type(mime_type, ext)
 
     @staticmethod
-    def get_mime_type(file_path: str) -> str:
-        """Dosyanın MIME type'ını döndürür"""
+    def get_mime_type(file_path: str, head: Optional[bytes] = None) -> str:
+        """Dosyanın MIME type'ını döndürür, baş kısım verilirse dosya tekrar okunmaz"""
         try:
             # Önce dosya uzantısına göre MIME type'ı belirle
             mime_type, _ = mimetypes.guess_type(file_path)
 
             if mime_type is None:
                 # Uzantıya göre belirlenemezse binary kontrolü yap
-                if FileUtils.is_binary_file(file_path):
+                is_binary = (FileUtils.is_binary_data(head) if head is not None
+                             else FileUtils.is_binary_file(file_path))
+                if is_binary:
                     return 'application/octet-stream'
                 return 'text/plain'
 
@@ -277,29 +279,44 @@ class FileUtils:
         """Dosyanın binary olup olmadığını kontrol eder"""
         try:
             with open(file_path, 'rb') as f:
-                initial_bytes = f.read(8192)
-                
-                # Binary imza kontrolü
-                for signature in FileUtils.BINARY_SIGNATURES:
-                    if initial_bytes.startswith(signature):
-                        return True
-                
-                # Null byte kontrolü
-                if b'\x00' in initial_bytes:
-                    return True
-                
-                # Text olmayan karakter kontrolü
-                try:
-                    initial_bytes.decode('utf-8')
-                    return False
-                except UnicodeDecodeError:
-                    return True
+                return FileUtils.is_binary_data(f.read(8192))
                 
         except Exception as e:
             print(f"Dosya kontrolü sırasında hata oluştu: {str(e)}")
             return True
+
+    @staticmethod
+    def is_binary_data(initial_bytes: bytes) -> bool:
+        """Dosyanın baş kısmına bakarak binary olup olmadığını kontrol eder"""
+        # Binary imza kontrolü
+        for signature in FileUtils.BINARY_SIGNATURES:
+            if initial_bytes.startswith(signature):
+                return True
+        
+        # Null byte kontrolü
+        if b'\x00' in initial_bytes:
+            return True
+        
+        # Text olmayan karakter kontrolü
+        try:
+            initial_bytes.decode('utf-8')
+            return False
+        except UnicodeDecodeError:
+            return True
+
+    @staticmethod
+    def get_extension(file_path: str) -> str:
+        """
+        Dosya adının küçük harfli uzantısını tek bir os.path.splitext ile döndürür
         
-        return False
+        Yalnızca son uzantı alınır (arsiv.tar.gz -> .gz). Uzantısı olmayan nokta ile
+        başlayan dosyalarda (.gitignore) adın kendisi uzantı kabul edilir.
+        """
+        name = os.path.basename(file_path).lower()
+        root, ext = os.path.splitext(name)
+        if not ext and root.startswith('.'):
+            return root
+        return ext
 
     @staticmethod
     def get_file_size_mb(file_path: str) -> float:
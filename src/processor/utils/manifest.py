@@ -0,0 +1,82 @@
+import json
+import os
+from typing import Any, Dict, Optional
+from .logger import logger
+
+
+class OutputManifest:
+    """Çıktı dosyasındaki her kaydın konumunu ve kaynak dosyanın durumunu tutar"""
+
+    # Manifest dosyasının yapısı değiştiğinde artırılır
+    MANIFEST_VERSION: int = 1
+
+    def __init__(self, manifest_file: str, fingerprint: Dict[str, Any]):
+        """
+        OutputManifest sınıfının başlatıcısı
+
+        Her kayıt: {"mtime_ns", "size", "offset", "length"}. Çıktı üretmeyen
+        (desteklenmeyen, boş) dosyalarda offset None olur; böylece değişmedikleri
+        sürece sonraki çalışmalarda tekrar incelenmezler.
+
+        Args:
+            manifest_file (str): Manifest dosyasının yolu
+            fingerprint (Dict[str, Any]): Çıktı formatını belirleyen ayarlar
+        """
+        self.manifest_file = manifest_file
+        self.fingerprint = fingerprint
+        self.entries: Dict[str, Dict[str, Optional[int]]] = {}
+        self.output_size = 0
+        self.dead_bytes = 0
+
+    @classmethod
+    def load(cls, manifest_file: str, fingerprint: Dict[str, Any]) -> Optional["OutputManifest"]:
+        """
+        Manifest dosyasını yükler
+
+        Args:
+            manifest_file (str): Manifest dosyasının yolu
+            fingerprint (Dict[str, Any]): Beklenen format ayarları
+
+        Returns:
+            Optional[OutputManifest]: Kullanılabilir manifest veya None (tam yeniden oluşturma gerekir)
+        """
+        if not os.path.exists(manifest_file):
+            return None
+        try:
+            with open(manifest_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Manifest okunamadı {manifest_file}: {str(e)}")
+            return None
+
+        if data.get('version') != cls.MANIFEST_VERSION or data.get('fingerprint') != fingerprint:
+            logger.info("Çıktı formatı değişmiş, çıktı baştan oluşturulacak.")
+            return None
+        if not data.get('complete'):
+            logger.warning("Önceki artımlı güncelleme yarım kalmış, çıktı baştan oluşturulacak.")
+            return None
+
+        manifest = cls(manifest_file, fingerprint)
+        manifest.entries = data['entries']
+        manifest.output_size = data['output_size']
+        manifest.dead_bytes = data['dead_bytes']
+        return manifest
+
+    def save(self, complete: bool = True) -> None:
+        """
+        Manifest dosyasını atomik olarak yazar
+
+        Args:
+            complete (bool): False ise çıktı güncellenirken yarıda kaldığı işaretlenir
+        """
+        temp_file = f"{self.manifest_file}.tmp"
+        with open(temp_file, 'w', encoding='utf-8') as f:
+            json.dump({
+                'version': self.MANIFEST_VERSION,
+                'fingerprint': self.fingerprint,
+                'complete': complete,
+                'output_size': self.output_size,
+                'dead_bytes': self.dead_bytes,
+                'entries': self.entries,
+            }, f, ensure_ascii=False)
+        os.replace(temp_file, self.manifest_file)
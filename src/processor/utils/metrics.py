@@ -0,0 +1,379 @@
+import heapq
+import json
+import math
+import os
+import time
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, TypeVar
+from .logger import logger
+
+T = TypeVar('T')
+
+
+class LatencyHistogram:
+    """Süreleri logaritmik kovalarda sayan, sabit bellekli ve birleştirilebilir histogram"""
+
+    # İlk kovanın üst sınırı (saniye)
+    BASE: float = 1e-5
+    # Ardışık kova sınırlarının oranı (yüzdelikler en fazla ~%19 hatalıdır)
+    GROWTH: float = 2 ** 0.25
+    # Kova sayısı; son kova ~45 dakikanın üstündeki süreleri de toplar
+    BUCKETS: int = 120
+
+    def __init__(self):
+        """LatencyHistogram sınıfının başlatıcısı"""
+        self.counts: List[int] = [0] * self.BUCKETS
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def add(self, seconds: float) -> None:
+        """
+        Bir süreyi histograma ekler
+
+        Args:
+            seconds (float): Süre (saniye)
+        """
+        if seconds <= self.BASE:
+            index = 0
+        else:
+            index = min(math.ceil(math.log(seconds / self.BASE, self.GROWTH)), self.BUCKETS - 1)
+        self.counts[index] += 1
+        self.count += 1
+        self.total += seconds
+        if seconds > self.max:
+            self.max = seconds
+
+    def merge(self, other: "LatencyHistogram") -> None:
+        """Başka bir histogramın sayılarını bu histograma ekler"""
+        for index, count in enumerate(other.counts):
+            self.counts[index] += count
+        self.count += other.count
+        self.total += other.total
+        self.max = max(self.max, other.max)
+
+    def percentile(self, q: float) -> float:
+        """
+        Yüzdelik değeri kovanın üst sınırı olarak tahmin eder
+
+        Args:
+            q (float): 0 ile 1 arasında yüzdelik (ör. 0.95)
+
+        Returns:
+            float: Süre (saniye); histogram boşsa 0
+        """
+        if not self.count:
+            return 0.0
+        rank = max(1, math.ceil(q * self.count))
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen >= rank:
+                # Kova sınırı gerçek en büyük değeri aşmasın
+                return min(self.BASE * self.GROWTH ** index, self.max)
+        return self.max
+
+
+class GroupStats:
+    """Bir extractor'a veya uzantıya ait dosya, bayt ve süre toplamları"""
+
+    def __init__(self):
+        """GroupStats sınıfının başlatıcısı"""
+        self.files = 0
+        self.bytes = 0
+        self.errors = 0
+        self.latency = LatencyHistogram()
+
+    def add(self, size: int, seconds: float, ok: bool) -> None:
+        """Bir dosyanın sonucunu gruba ekler"""
+        self.files += 1
+        self.bytes += size
+        if not ok:
+            self.errors += 1
+        self.latency.add(seconds)
+
+    def merge(self, other: "GroupStats") -> None:
+        """Başka bir grubun toplamlarını bu gruba ekler"""
+        self.files += other.files
+        self.bytes += other.bytes
+        self.errors += other.errors
+        self.latency.merge(other.latency)
+
+    def summary(self) -> Dict[str, Any]:
+        """Grubun rapordaki özetini döndürür"""
+        seconds = self.latency.total
+        return {
+            'files': self.files,
+            'bytes': self.bytes,
+            'errors': self.errors,
+            'seconds': round(seconds, 6),
+            'files_per_second': round(self.files / seconds, 3) if seconds else None,
+            'bytes_per_second': round(self.bytes / seconds, 1) if seconds else None,
+            'p50': round(self.latency.percentile(0.50), 6),
+            'p95': round(self.latency.percentile(0.95), 6),
+            'p99': round(self.latency.percentile(0.99), 6),
+            'max': round(self.latency.max, 6),
+        }
+
+
+class PipelineMetrics:
+    """Çıkarım hattının aşama sürelerini ve dosya başına gecikmeleri toplar"""
+
+    # Raporlanan aşamalar (sırasıyla):
+    #   scan: dizin tarama ve stat, check: karantina, boyut ve tür (imza) kontrolü,
+    #   dedup: tekrar kontrolü için hash, cache: önbellek araması, read: içeriğin okunması,
+    #   extract: extractor (encoding dahil), encoding: metin dosyalarında kodlama tespiti,
+    #   format: başlık ve kayıt oluşturma, write: çıktıya yazma (akış kayıtlarında çıkarım dahil)
+    STAGES: Tuple[str, ...] = ('scan', 'check', 'dedup', 'cache', 'read', 'extract', 'encoding',
+                               'format', 'write')
+    # Raporda listelenen en yavaş dosya sayısı
+    DEFAULT_TOP_N: int = 20
+
+    def __init__(self, top_n: int = DEFAULT_TOP_N):
+        """
+        PipelineMetrics sınıfının başlatıcısı
+
+        Sürekli açık kalabilecek kadar ucuzdur: dosya başına birkaç perf_counter
+        çağrısı ve sabit boyutlu histogramlar tutulur; süreler listelenmez. En
+        yavaş dosyalar top_n boyutlu bir yığında saklanır. Worker süreçlerinin
+        topladıkları take ile alınıp ana süreçte merge ile birleştirilir.
+
+        Args:
+            top_n (int): Raporda listelenecek en yavaş dosya sayısı
+        """
+        self.top_n = top_n
+        self.started = time.time()
+        self._reset()
+
+    def _reset(self) -> None:
+        """Toplanan değerleri sıfırlar"""
+        self.stage_seconds: Dict[str, float] = {stage: 0.0 for stage in self.STAGES}
+        self.stage_counts: Dict[str, int] = {stage: 0 for stage in self.STAGES}
+        self.by_extractor: Dict[str, GroupStats] = {}
+        self.by_extension: Dict[str, GroupStats] = {}
+        self.total = GroupStats()
+        # (süre, yol, extractor, boyut, durum) en küçük süre başta olacak şekilde
+        self._slowest: List[Tuple[float, str, str, int, str]] = []
+
+    def add_stage(self, stage: str, seconds: float) -> None:
+        """
+        Bir aşamada harcanan süreyi ekler
+
+        Args:
+            stage (str): Aşama adı (STAGES)
+            seconds (float): Süre (saniye)
+        """
+        self.stage_seconds[stage] += seconds
+        self.stage_counts[stage] += 1
+
+    def timed(self, stage: str, iterable: Iterable[T]) -> Iterator[T]:
+        """
+        Bir üreticinin her öğeyi üretirken harcadığı süreyi aşamaya ekler
+
+        Args:
+            stage (str): Aşama adı
+            iterable (Iterable[T]): Süresi ölçülecek üretici
+
+        Returns:
+            Iterator[T]: Aynı öğeler
+        """
+        iterator = iter(iterable)
+        while True:
+            start = time.perf_counter()
+            try:
+                item = next(iterator)
+            except StopIteration:
+                self.stage_seconds[stage] += time.perf_counter() - start
+                return
+            self.add_stage(stage, time.perf_counter() - start)
+            yield item
+
+    def add_file(self, file_path: str, extension: str, extractor: str, size: int,
+                 seconds: float, status: str = 'ok') -> None:
+        """
+        Bir dosyanın toplam işlenme süresini gruplara ve en yavaşlar listesine ekler
+
+        Args:
+            file_path (str): Dosya yolu
+            extension (str): Dosya uzantısı (yoksa boş)
+            extractor (str): Extractor'ın sınıf adı
+            size (int): Dosya boyutu (byte)
+            seconds (float): Kontrolden çıkarımın sonuna kadar geçen süre
+            status (str): 'ok', 'empty' veya 'error'
+        """
+        ok = status == 'ok'
+        self.total.add(size, seconds, ok)
+        self._group(self.by_extractor, extractor).add(size, seconds, ok)
+        self._group(self.by_extension, extension or '(uzantısız)').add(size, seconds, ok)
+        if not self.top_n:
+            return
+        entry = (seconds, file_path, extractor, size, status)
+        if len(self._slowest) < self.top_n:
+            heapq.heappush(self._slowest, entry)
+        elif seconds > self._slowest[0][0]:
+            heapq.heapreplace(self._slowest, entry)
+
+    @staticmethod
+    def _group(groups: Dict[str, GroupStats], key: str) -> GroupStats:
+        """Grubu döndürür, yoksa oluşturur"""
+        group = groups.get(key)
+        if group is None:
+            group = groups[key] = GroupStats()
+        return group
+
+    def take(self) -> "PipelineMetrics":
+        """
+        Toplanan değerlerin kopyasını döndürür ve bu nesneyi sıfırlar (worker süreçleri için)
+
+        Returns:
+            PipelineMetrics: Sıfırlanmadan önceki değerleri taşıyan nesne
+        """
+        snapshot = PipelineMetrics(self.top_n)
+        snapshot.stage_seconds = self.stage_seconds
+        snapshot.stage_counts = self.stage_counts
+        snapshot.by_extractor = self.by_extractor
+        snapshot.by_extension = self.by_extension
+        snapshot.total = self.total
+        snapshot._slowest = self._slowest
+        self._reset()
+        return snapshot
+
+    def merge(self, other: "PipelineMetrics") -> None:
+        """
+        Başka bir süreçte toplanan değerleri bu nesneye ekler
+
+        Args:
+            other (PipelineMetrics): Eklenecek değerler
+        """
+        for stage in self.STAGES:
+            self.stage_seconds[stage] += other.stage_seconds[stage]
+            self.stage_counts[stage] += other.stage_counts[stage]
+        for groups, other_groups in ((self.by_extractor, other.by_extractor),
+                                     (self.by_extension, other.by_extension)):
+            for key, group in other_groups.items():
+                self._group(groups, key).merge(group)
+        self.total.merge(other.total)
+        for entry in other._slowest:
+            if len(self._slowest) < self.top_n:
+                heapq.heappush(self._slowest, entry)
+            elif entry[0] > self._slowest[0][0]:
+                heapq.heapreplace(self._slowest, entry)
+
+    def report(self, wall_seconds: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Toplanan değerlerin raporunu oluşturur
+
+        Dosya/saniye ve bayt/saniye çalışmanın duvar saati süresine göre,
+        grup içindeki değerler ise dosyaların işlenme sürelerinin toplamına
+        göre hesaplanır (paralel modda worker'ların süreleri toplanır).
+
+        Args:
+            wall_seconds (Optional[float]): Çalışmanın toplam süresi (None ise başlangıçtan beri)
+
+        Returns:
+            Dict[str, Any]: JSON'a yazılabilir rapor
+        """
+        if wall_seconds is None:
+            wall_seconds = time.time() - self.started
+        total = self.total.summary()
+        return {
+            'started': self.started,
+            'wall_seconds': round(wall_seconds, 6),
+            'files': self.total.files,
+            'bytes': self.total.bytes,
+            'errors': self.total.errors,
+            'files_per_second': round(self.total.files / wall_seconds, 3) if wall_seconds else None,
+            'bytes_per_second': round(self.total.bytes / wall_seconds, 1) if wall_seconds else None,
+            'latency': {key: total[key] for key in ('p50', 'p95', 'p99', 'max')},
+            'stages': {stage: {'seconds': round(self.stage_seconds[stage], 6),
+                               'count': self.stage_counts[stage]}
+                       for stage in self.STAGES},
+            'by_extractor': {key: group.summary() for key, group in sorted(self.by_extractor.items())},
+            'by_extension': {key: group.summary() for key, group in sorted(self.by_extension.items())},
+            'slowest': [{'path': path, 'seconds': round(seconds, 6), 'extractor': extractor,
+                         'size': size, 'status': status}
+                        for seconds, path, extractor, size, status in sorted(self._slowest, reverse=True)],
+        }
+
+    def write_json(self, output_file: str, wall_seconds: Optional[float] = None) -> None:
+        """
+        Raporu JSON dosyasına atomik olarak yazar
+
+        Args:
+            output_file (str): JSON dosyasının yolu
+            wall_seconds (Optional[float]): Çalışmanın toplam süresi
+        """
+        self._write(output_file, json.dumps(self.report(wall_seconds), ensure_ascii=False, indent=2))
+
+    def write_prometheus(self, output_file: str, wall_seconds: Optional[float] = None) -> None:
+        """
+        Raporu Prometheus metin biçiminde (node_exporter textfile collector için) yazar
+
+        Args:
+            output_file (str): .prom dosyasının yolu
+            wall_seconds (Optional[float]): Çalışmanın toplam süresi
+        """
+        self._write(output_file, self.prometheus_text(wall_seconds))
+
+    def prometheus_text(self, wall_seconds: Optional[float] = None) -> str:
+        """
+        Raporu Prometheus metin biçiminde döndürür
+
+        Değerler çalışmaya (serviste sürecin ömrüne) aittir ve yeni çalışmada
+        sıfırdan başlar; bu yüzden toplamlar counter değil gauge olarak yazılır.
+
+        Args:
+            wall_seconds (Optional[float]): Çalışmanın toplam süresi
+
+        Returns:
+            str: Prometheus metin biçimi (sonunda satır sonu ile)
+        """
+        report = self.report(wall_seconds)
+        lines = [
+            '# HELP textractor_run_seconds Son çalışmanın toplam süresi.',
+            '# TYPE textractor_run_seconds gauge',
+            f"textractor_run_seconds {report['wall_seconds']}",
+            '# HELP textractor_run_timestamp_seconds Son çalışmanın başlangıç zamanı.',
+            '# TYPE textractor_run_timestamp_seconds gauge',
+            f"textractor_run_timestamp_seconds {report['started']}",
+            '# HELP textractor_stage_seconds Aşamalarda harcanan toplam süre.',
+            '# TYPE textractor_stage_seconds gauge',
+        ]
+        for stage, values in report['stages'].items():
+            lines.append(f'textractor_stage_seconds{{stage="{stage}"}} {values["seconds"]}')
+
+        for label, groups in (('extractor', self.by_extractor), ('extension', self.by_extension)):
+            name = f'textractor_file_seconds_by_{label}'
+            lines.append(f'# HELP {name} Dosya başına işlenme süresi.')
+            lines.append(f'# TYPE {name} summary')
+            for key, group in sorted(groups.items()):
+                value = self._escape_label(key)
+                for q in (0.5, 0.95, 0.99):
+                    lines.append(f'{name}{{{label}="{value}",quantile="{q}"}} '
+                                 f'{group.latency.percentile(q):.6f}')
+                lines.append(f'{name}_sum{{{label}="{value}"}} {group.latency.total:.6f}')
+                lines.append(f'{name}_count{{{label}="{value}"}} {group.latency.count}')
+            for attr, help_text in (('files', 'İşlenen dosya sayısı.'),
+                                    ('bytes', 'İşlenen bayt sayısı.'),
+                                    ('errors', 'Metin çıkarılamayan dosya sayısı.')):
+                name = f'textractor_{attr}_by_{label}'
+                lines.append(f'# HELP {name} {help_text}')
+                lines.append(f'# TYPE {name} gauge')
+                for key, group in sorted(groups.items()):
+                    lines.append(f'{name}{{{label}="{self._escape_label(key)}"}} {getattr(group, attr)}')
+        return '\n'.join(lines) + '\n'
+
+    @staticmethod
+    def _escape_label(value: str) -> str:
+        """Prometheus etiket değerindeki özel karakterleri kaçışlar"""
+        return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+    @staticmethod
+    def _write(output_file: str, text: str) -> None:
+        """Metni geçici dosyaya yazıp hedefin yerine taşır"""
+        temp_file = f"{output_file}.tmp"
+        try:
+            with open(temp_file, 'w', encoding='utf-8') as f:
+                f.write(text)
+            os.replace(temp_file, output_file)
+        except OSError as e:
+            logger.warning(f"Ölçüm raporu yazılamadı {output_file}: {str(e)}")
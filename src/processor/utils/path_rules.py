@@ -0,0 +1,137 @@
+import re
+from typing import Iterable, List, Optional, Pattern, Tuple
+from .logger import logger
+
+
+class PathRules:
+    """gitignore sözdizimindeki kalıpları taranan köke göreli yollarla eşleştirir"""
+
+    def __init__(self, patterns: Iterable[str] = ()):
+        """
+        PathRules sınıfının başlatıcısı
+
+        Desteklenen sözdizimi gitignore ile aynıdır: '#' ile başlayan satırlar
+        yorumdur, '!' kalıbı tersine çevirir, '/' ile biten kalıplar yalnızca
+        dizinlere uyar, içinde '/' geçen kalıplar köke bağlıdır, diğerleri her
+        seviyedeki adla eşleşir. '*', '?', '[...]' ve '**' kullanılabilir.
+        Birden fazla kalıp uyarsa sonuncusu geçerlidir.
+
+        Args:
+            patterns (Iterable[str]): Kalıplar
+        """
+        self.rules: List[Tuple[Pattern[str], bool, bool]] = []
+        for pattern in patterns:
+            self.add(pattern)
+
+    @classmethod
+    def from_file(cls, rules_file: str) -> "PathRules":
+        """
+        Kalıpları .gitignore biçimindeki bir dosyadan okur
+
+        Args:
+            rules_file (str): Kalıp dosyası
+
+        Returns:
+            PathRules: Dosyadaki kalıplar (dosya okunamazsa boş)
+        """
+        try:
+            with open(rules_file, 'r', encoding='utf-8') as f:
+                return cls(f.read().splitlines())
+        except OSError as e:
+            logger.warning(f"Kalıp dosyası okunamadı {rules_file}: {str(e)}")
+            return cls()
+
+    def __bool__(self) -> bool:
+        return bool(self.rules)
+
+    def add(self, pattern: str) -> None:
+        """
+        Tek bir kalıp ekler; boş satırlar ve yorumlar yok sayılır
+
+        Args:
+            pattern (str): Kalıp
+        """
+        pattern = pattern.rstrip('\n\r')
+        if not pattern.endswith('\\ '):
+            pattern = pattern.rstrip(' ')
+        if not pattern or pattern.startswith('#'):
+            return
+
+        negated = pattern.startswith('!')
+        if negated or pattern.startswith('\\!') or pattern.startswith('\\#'):
+            pattern = pattern[1:]
+        dir_only = pattern.endswith('/')
+        pattern = pattern.rstrip('/')
+        if not pattern:
+            return
+
+        anchored = '/' in pattern
+        body = self._translate(pattern.lstrip('/'))
+        regex = re.compile(('^' if anchored else '^(?:.*/)?') + body + '$', re.DOTALL)
+        self.rules.append((regex, negated, dir_only))
+
+    def match(self, rel_path: str, is_dir: bool = False) -> Optional[bool]:
+        """
+        Yolun kalıplarla eşleşme sonucunu döndürür
+
+        Args:
+            rel_path (str): Köke göreli, '/' ile ayrılmış yol
+            is_dir (bool): Yol bir dizin mi
+
+        Returns:
+            Optional[bool]: Son uyan kalıp normalse True, '!' ile başlıyorsa False,
+                hiçbir kalıp uymazsa None
+        """
+        result = None
+        for regex, negated, dir_only in self.rules:
+            if dir_only and not is_dir:
+                continue
+            if regex.match(rel_path):
+                result = not negated
+        return result
+
+    @staticmethod
+    def _translate(pattern: str) -> str:
+        """
+        Glob kalıbını düzenli ifadeye çevirir; '*' ve '?' '/' karakterini aşmaz
+
+        Args:
+            pattern (str): Baştaki ve sondaki '/' atılmış kalıp
+
+        Returns:
+            str: Düzenli ifade gövdesi
+        """
+        parts = []
+        i, n = 0, len(pattern)
+        while i < n:
+            c = pattern[i]
+            if pattern.startswith('**', i):
+                i += 2
+                if i < n and pattern[i] == '/':
+                    # '**/' sıfır veya daha fazla dizine uyar
+                    parts.append('(?:.*/)?')
+                    i += 1
+                else:
+                    parts.append('.*')
+                continue
+            if c == '*':
+                parts.append('[^/]*')
+            elif c == '?':
+                parts.append('[^/]')
+            elif c == '[':
+                end = pattern.find(']', i + 2)
+                if end == -1:
+                    parts.append(re.escape(c))
+                else:
+                    members = pattern[i + 1:end].replace('\\', '\\\\')
+                    if members[0] in '!^':
+                        members = '^' + members[1:]
+                    parts.append(f'[{members}]')
+                    i = end
+            elif c == '\\' and i + 1 < n:
+                i += 1
+                parts.append(re.escape(pattern[i]))
+            else:
+                parts.append(re.escape(c))
+            i += 1
+        return ''.join(parts)
@@ -0,0 +1,62 @@
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Iterable, Iterator, Optional
+from .file_probe import FileProbe
+
+
+class Prefetcher:
+    """Sıradaki dosyaların içeriğini, mevcut dosya işlenirken iş parçacıklarında okur"""
+
+    # Her iş parçacığı için önceden okunabilecek dosya sayısı
+    FILES_PER_THREAD: int = 2
+
+    def __init__(self, threads: int):
+        """
+        Prefetcher sınıfının başlatıcısı
+
+        Okuma, probe'un içeriği ilk kez istendiğinde yapacağı okumanın aynısıdır;
+        yalnızca daha erken ve ana iş parçacığını bekletmeden yapılır. Bellekte
+        aynı anda en fazla threads * FILES_PER_THREAD dosya bekler.
+
+        Args:
+            threads (int): Okuma yapacak iş parçacığı sayısı
+        """
+        self.threads = threads
+        self.depth = threads * self.FILES_PER_THREAD
+
+    def iter_probes(self, probes: Iterable[FileProbe],
+                    wanted: Callable[[FileProbe], bool]) -> Iterator[FileProbe]:
+        """
+        Probe'ları giriş sırasıyla, içerikleri okunmuş olarak üretir
+
+        Args:
+            probes (Iterable[FileProbe]): Probe'lar
+            wanted (Callable[[FileProbe], bool]): İçeriği önceden okunacak probe'lar için True
+
+        Returns:
+            Iterator[FileProbe]: Aynı probe'lar
+        """
+        with ThreadPoolExecutor(max_workers=self.threads, thread_name_prefix='prefetch') as executor:
+            pending = deque()
+            for probe in probes:
+                future = executor.submit(self._load, probe) if wanted(probe) else None
+                pending.append((probe, future))
+                if len(pending) > self.depth:
+                    yield self._ready(*pending.popleft())
+            while pending:
+                yield self._ready(*pending.popleft())
+
+    @staticmethod
+    def _load(probe: FileProbe) -> None:
+        """İçeriği okur; hata olursa probe boş kalır ve hata işlenirken tekrar ortaya çıkar"""
+        try:
+            probe.data
+        except OSError:
+            pass
+
+    @staticmethod
+    def _ready(probe: FileProbe, future: Optional[Future]) -> FileProbe:
+        """Okuma bitene kadar bekler"""
+        if future is not None:
+            future.result()
+        return probe
@@ -0,0 +1,91 @@
+import json
+import os
+import time
+from typing import Dict, Optional, Union
+from .logger import logger
+
+
+class Quarantine:
+    """Süre veya bellek sınırını aşan dosyaların kalıcı listesi"""
+
+    def __init__(self, quarantine_file: str, read_only: bool = False):
+        """
+        Quarantine sınıfının başlatıcısı
+
+        Her kayıt: {"reason", "size", "mtime_ns", "time"}. Dosya değiştiğinde
+        (boyut veya mtime farklıysa) karantina kaydı yok sayılır ve dosya tekrar denenir.
+
+        Args:
+            quarantine_file (str): Karantina listesinin JSON dosyası
+            read_only (bool): Eklenen kayıtlar yalnızca bellekte tutulur, liste diske
+                yazılmaz (worker süreçlerinde; listeyi ana süreç yazar)
+        """
+        self.quarantine_file = quarantine_file
+        self.read_only = read_only
+        self.entries: Dict[str, Dict[str, Union[str, int, float]]] = {}
+
+        if os.path.exists(quarantine_file):
+            try:
+                with open(quarantine_file, 'r', encoding='utf-8') as f:
+                    self.entries = json.load(f)
+            except (OSError, ValueError) as e:
+                logger.warning(f"Karantina listesi okunamadı {quarantine_file}: {str(e)}")
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def reason_for(self, file_path: str, stat_result: Optional[os.stat_result] = None) -> Optional[str]:
+        """
+        Dosya karantinadaysa karantina nedenini döndürür
+
+        Args:
+            file_path (str): Dosya yolu
+            stat_result (Optional[os.stat_result]): Önceden alınmış stat sonucu
+
+        Returns:
+            Optional[str]: "timeout", "memory" veya None
+        """
+        entry = self.entries.get(file_path)
+        if entry is None:
+            return None
+        try:
+            st = stat_result or os.stat(file_path)
+        except OSError:
+            return None
+        if entry['size'] != st.st_size or entry['mtime_ns'] != st.st_mtime_ns:
+            return None
+        return entry['reason']
+
+    def add(self, file_path: str, reason: str, stat_result: Optional[os.stat_result] = None) -> None:
+        """
+        Dosyayı karantinaya ekler ve listeyi hemen diske yazar
+
+        Args:
+            file_path (str): Dosya yolu
+            reason (str): Karantina nedeni
+            stat_result (Optional[os.stat_result]): Önceden alınmış stat sonucu
+        """
+        try:
+            st = stat_result or os.stat(file_path)
+        except OSError as e:
+            logger.warning(f"Dosya karantinaya alınamadı {file_path}: {str(e)}")
+            return
+        self.entries[file_path] = {
+            'reason': reason,
+            'size': st.st_size,
+            'mtime_ns': st.st_mtime_ns,
+            'time': time.time(),
+        }
+        self.save()
+
+    def save(self) -> None:
+        """Karantina listesini atomik olarak yazar"""
+        if self.read_only:
+            return
+        temp_file = f"{self.quarantine_file}.tmp"
+        try:
+            with open(temp_file, 'w', encoding='utf-8') as f:
+                json.dump(self.entries, f, ensure_ascii=False)
+            os.replace(temp_file, self.quarantine_file)
+        except OSError as e:
+            logger.warning(f"Karantina listesi yazılamadı {self.quarantine_file}: {str(e)}")
@@ -0,0 +1,39 @@
+from typing import Iterator, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from ..extractors.base_extractor import BaseExtractor
+
+
+class StreamedContent:
+    """Yazılırken parça parça üretilen, biçimlendirilmiş dosya kaydı"""
+
+    def __init__(self, file_path: str, extractor: "BaseExtractor", header: str, footer: str):
+        """
+        StreamedContent sınıfının başlatıcısı
+
+        Yalnızca dosya yolunu ve extractor'ı taşır; içerik yazıcı kaydı
+        dolaştığı anda okunur, böylece metnin tamamı hiçbir zaman bellekte
+        tutulmaz. Çıkarım yazan süreçte çalıştığından yalnızca sıralı modda
+        kullanılır.
+
+        Args:
+            file_path (str): Dosya yolu
+            extractor (BaseExtractor): Metni parça parça üretecek extractor
+            header (str): format_content başlığı
+            footer (str): format_content kapanışı
+        """
+        self.file_path = file_path
+        self.extractor = extractor
+        self.header = header
+        self.footer = footer
+
+    def __iter__(self) -> Iterator[str]:
+        """Başlığı, metin parçalarını ve kapanışı sırasıyla üretir; metin yoksa hiçbir şey üretmez"""
+        chunks = self.extractor.iter_text(self.file_path)
+        first = next(chunks, None)
+        if first is None:
+            return
+        yield self.header
+        yield first
+        yield from chunks
+        yield self.footer
@@ -0,0 +1,149 @@
+import multiprocessing
+import os
+import time
+from multiprocessing.connection import Connection
+from typing import Any, Callable, Dict, Optional
+from .logger import logger
+
+
+class ExtractionLimitError(Exception):
+    """Çıkarım süre veya bellek sınırını aştığında fırlatılır"""
+
+    def __init__(self, reason: str, message: str):
+        """
+        ExtractionLimitError sınıfının başlatıcısı
+
+        Args:
+            reason (str): Aşılan sınır ("timeout" veya "memory")
+            message (str): Açıklama
+        """
+        super().__init__(message)
+        self.reason = reason
+
+
+class ExtractionSupervisor:
+    """Metin çıkarımını süre ve bellek sınırıyla ayrı bir süreçte çalıştırır"""
+
+    # Alt sürecin durumunun kontrol edilme aralığı (saniye)
+    POLL_INTERVAL: float = 0.05
+    # Bir dosyadan sonra RSS bu orana ulaşmışsa alt süreç yenilenir
+    RECYCLE_RATIO: float = 0.75
+
+    def __init__(self, target: Callable[[Connection, Dict[str, Any]], None], options: Dict[str, Any],
+                 timeout: Optional[float] = None, memory_limit_mb: Optional[float] = None):
+        """
+        ExtractionSupervisor sınıfının başlatıcısı
+
+        Alt süreç ilk dosyada başlatılır ve dosyalar arasında yeniden kullanılır.
+        Sınırı aşan alt süreç öldürülür; bir sonraki dosya için yenisi başlatılır.
+        Bellek sınırı alt sürecin RSS değerine uygulanır ve /proc üzerinden okunur.
+
+        Args:
+            target (Callable[[Connection, Dict[str, Any]], None]): Alt süreçte çalışacak döngü
+            options (Dict[str, Any]): target'a verilecek ayarlar
+            timeout (Optional[float]): Dosya başına süre sınırı (saniye)
+            memory_limit_mb (Optional[float]): Alt sürecin kullanabileceği en fazla bellek (MB)
+        """
+        self.target = target
+        self.options = options
+        self.timeout = timeout
+        self.memory_limit = int(memory_limit_mb * 1024 * 1024) if memory_limit_mb else None
+        self._process: Optional[multiprocessing.Process] = None
+        self._conn: Optional[Connection] = None
+        self._page_size = os.sysconf('SC_PAGE_SIZE') if hasattr(os, 'sysconf') else 4096
+
+        if self.memory_limit and not os.path.exists('/proc/self/statm'):
+            logger.warning("Bu platformda süreç belleği okunamıyor, bellek sınırı uygulanmayacak.")
+            self.memory_limit = None
+
+    def _start(self) -> None:
+        """Alt süreci başlatır"""
+        parent_conn, child_conn = multiprocessing.Pipe()
+        self._process = multiprocessing.Process(target=self.target, args=(child_conn, self.options),
+                                                daemon=True)
+        self._process.start()
+        child_conn.close()
+        self._conn = parent_conn
+
+    def _kill(self) -> Optional[int]:
+        """
+        Alt süreci öldürür
+
+        Returns:
+            Optional[int]: Alt sürecin çıkış kodu
+        """
+        process, self._process = self._process, None
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+        if process is None:
+            return None
+        if process.is_alive():
+            process.kill()
+        process.join()
+        return process.exitcode
+
+    def _rss(self) -> int:
+        """Alt sürecin bellekte kalan kısmını (byte) döndürür"""
+        try:
+            with open(f"/proc/{self._process.pid}/statm", 'rb') as f:
+                return int(f.read().split()[1]) * self._page_size
+        except (OSError, IndexError, ValueError):
+            return 0
+
+    def extract(self, file_path: str, data: Optional[bytes] = None) -> Optional[str]:
+        """
+        Dosyanın metnini alt süreçte çıkarır
+
+        Args:
+            file_path (str): Dosya yolu
+            data (Optional[bytes]): Diskte karşılığı olmayan dosyaların (ör. arşiv üyeleri) içeriği
+
+        Returns:
+            Optional[str]: Çıkarılan metin veya None
+
+        Raises:
+            ExtractionLimitError: Süre veya bellek sınırı aşılırsa
+            RuntimeError: Extractor hata verirse veya alt süreç beklenmedik şekilde sonlanırsa
+        """
+        if self._process is None or not self._process.is_alive():
+            self._kill()
+            self._start()
+
+        start = time.monotonic()
+        self._conn.send((file_path, data))
+        while not self._conn.poll(self.POLL_INTERVAL):
+            elapsed = time.monotonic() - start
+            if self.timeout is not None and elapsed > self.timeout:
+                self._kill()
+                raise ExtractionLimitError('timeout', f"{self.timeout:g} saniyelik süre sınırı aşıldı")
+            if self.memory_limit is not None and self._rss() > self.memory_limit:
+                self._kill()
+                raise ExtractionLimitError(
+                    'memory', f"{self.memory_limit / (1024 * 1024):g}MB bellek sınırı aşıldı")
+
+        try:
+            status, payload = self._conn.recv()
+        except (EOFError, OSError):
+            exitcode = self._kill()
+            raise RuntimeError(f"Çıkarım süreci beklenmedik şekilde sonlandı (çıkış kodu {exitcode})")
+
+        if status == 'memory':
+            self._kill()
+            raise ExtractionLimitError('memory', "Çıkarım sırasında bellek yetmedi")
+        # Büyümüş süreç sonraki dosyada sınırı haksız yere aşmasın diye yenilenir
+        if self.memory_limit is not None and self._rss() > self.memory_limit * self.RECYCLE_RATIO:
+            self.close()
+        if status == 'error':
+            raise RuntimeError(payload)
+        return payload
+
+    def close(self) -> None:
+        """Alt süreci kapatır"""
+        if self._process is not None and self._process.is_alive() and self._conn is not None:
+            try:
+                self._conn.send(None)
+                self._process.join(timeout=1)
+            except OSError:
+                pass
+        self._kill()
@@ -0,0 +1,49 @@
+from abc import ABC, abstractmethod
+from typing import Iterable, List, Union
+from ..utils.extraction_record import ExtractionRecord
+
+
+class BaseWriter(ABC):
+    """Temel çıktı yazıcı sınıfı"""
+
+    def __init__(self, output_file: str):
+        """
+        BaseWriter sınıfının başlatıcısı
+
+        Args:
+            output_file (str): Çıktı dosyasının adı
+        """
+        self.output_file = output_file
+        self.records_written = 0
+
+    @property
+    def outputs(self) -> List[str]:
+        """Yazılan çıktı dosyalarını döndürür"""
+        return [self.output_file]
+
+    @abstractmethod
+    def open(self) -> None:
+        """Çıktı hedefini yazmaya hazırlar"""
+        pass
+
+    @abstractmethod
+    def write_record(self, record: Union[str, Iterable[str], ExtractionRecord]) -> bool:
+        """
+        Tek bir kaydı çıktıya yazar, yazıldıysa True döndürür
+
+        Metin yazıcıları biçimlendirilmiş metni (tam veya parçalar halinde),
+        yapılandırılmış yazıcılar ExtractionRecord alır.
+        """
+        pass
+
+    @abstractmethod
+    def close(self, success: bool = True) -> None:
+        """Çıktıyı kapatır, başarısız ise yarım kalan çıktıyı temizler"""
+        pass
+
+    def __enter__(self) -> "BaseWriter":
+        self.open()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close(success=exc_type is None)
@@ -0,0 +1,179 @@
+import os
+from typing import BinaryIO, Iterable, Optional, Union
+from ..utils.manifest import OutputManifest
+
+
+class IncrementalWriter:
+    # Silinen bölgeler bu bayt ile doldurulur (boş satır olarak görünür)
+    FILL_BYTE: bytes = b'\n'
+    # Kopyalama ve doldurma sırasında kullanılan parça boyutu (byte)
+    CHUNK_SIZE: int = 1024 * 1024
+
+    def __init__(self, output_file: str, manifest: OutputManifest, compact_ratio: float = 0.25):
+        """
+        IncrementalWriter sınıfının başlatıcısı
+
+        Çıktı dosyasını manifest'teki konumlara göre yerinde günceller. Yeni
+        kayıt eskisinin yerine sığıyorsa üzerine yazılır, sığmıyorsa eski bölge
+        boşaltılıp kayıt dosya sonuna eklenir. Boşaltılan baytların oranı
+        compact_ratio'yu aştığında dosya sıkıştırılır.
+
+        Args:
+            output_file (str): Çıktı dosyasının adı
+            manifest (OutputManifest): Kayıt konumlarını tutan manifest
+            compact_ratio (float): Sıkıştırmayı tetikleyen boş bayt oranı
+        """
+        self.output_file = output_file
+        self.manifest = manifest
+        self.compact_ratio = compact_ratio
+        self._file: Optional[BinaryIO] = None
+
+    def open(self) -> None:
+        """Çıktı dosyasını okuma/yazma için açar, manifest boşsa dosyayı sıfırlar"""
+        if self.manifest.entries and os.path.exists(self.output_file):
+            self._file = open(self.output_file, 'r+b')
+        else:
+            self._file = open(self.output_file, 'w+b')
+            self.manifest.output_size = 0
+            self.manifest.dead_bytes = 0
+        # Yarıda kesilirse bir sonraki çalışma tam yeniden oluşturma yapsın
+        self.manifest.save(complete=False)
+
+    def _blank(self, offset: int, length: int) -> None:
+        """Verilen bölgeyi doldurma baytıyla boşaltır"""
+        self._file.seek(offset)
+        while length > 0:
+            size = min(length, self.CHUNK_SIZE)
+            self._file.write(self.FILL_BYTE * size)
+            length -= size
+
+    def remove(self, file_path: str) -> None:
+        """
+        Dosyanın kaydını çıktıdan ve manifest'ten kaldırır
+
+        Args:
+            file_path (str): Dosya yolu
+        """
+        entry = self.manifest.entries.pop(file_path, None)
+        if entry and entry['offset'] is not None:
+            self._blank(entry['offset'], entry['length'])
+            self.manifest.dead_bytes += entry['length']
+
+    def upsert(self, file_path: str, record: Optional[Union[str, Iterable[str]]],
+               stat_result: os.stat_result) -> None:
+        """
+        Dosyanın kaydını ekler veya günceller
+
+        Args:
+            file_path (str): Dosya yolu
+            record (Optional[Union[str, Iterable[str]]]): Formatlanmış kayıt veya parçaları (çıktı yoksa None)
+            stat_result (os.stat_result): Dosyanın tarama sırasındaki stat sonucu
+        """
+        if record is not None and not isinstance(record, str):
+            self._append_stream(file_path, record, stat_result)
+            return
+
+        data = (record + '\n').encode('utf-8') if record else b''
+        old = self.manifest.entries.get(file_path)
+        offset: Optional[int] = None
+
+        if old and old['offset'] is not None:
+            if data and len(data) <= old['length']:
+                # Yeni kayıt eski bölgeye sığıyor, yerinde yaz ve kalanı boşalt
+                offset = old['offset']
+                self._file.seek(offset)
+                self._file.write(data)
+                self._blank(offset + len(data), old['length'] - len(data))
+                self.manifest.dead_bytes += old['length'] - len(data)
+            else:
+                self._blank(old['offset'], old['length'])
+                self.manifest.dead_bytes += old['length']
+
+        if data and offset is None:
+            offset = self.manifest.output_size
+            self._file.seek(offset)
+            self._file.write(data)
+            self.manifest.output_size += len(data)
+
+        self.manifest.entries[file_path] = {
+            'mtime_ns': stat_result.st_mtime_ns,
+            'size': stat_result.st_size,
+            'offset': offset,
+            'length': len(data) if data else None,
+        }
+
+    def _append_stream(self, file_path: str, pieces: Iterable[str], stat_result: os.stat_result) -> None:
+        """Parça parça üretilen kaydı dosya sonuna ekler (uzunluk önceden bilinmediği için yerinde yazılmaz)"""
+        old = self.manifest.entries.get(file_path)
+        if old and old['offset'] is not None:
+            self._blank(old['offset'], old['length'])
+            self.manifest.dead_bytes += old['length']
+
+        offset = self.manifest.output_size
+        self._file.seek(offset)
+        length = 0
+        for piece in pieces:
+            data = piece.encode('utf-8')
+            self._file.write(data)
+            length += len(data)
+        if length:
+            self._file.write(b'\n')
+            length += 1
+        self.manifest.output_size += length
+
+        self.manifest.entries[file_path] = {
+            'mtime_ns': stat_result.st_mtime_ns,
+            'size': stat_result.st_size,
+            'offset': offset if length else None,
+            'length': length if length else None,
+        }
+
+    def needs_compaction(self) -> bool:
+        """Boş bayt oranının sınırı aşıp aşmadığını döndürür"""
+        return (self.manifest.output_size > 0 and
+                self.manifest.dead_bytes > self.manifest.output_size * self.compact_ratio)
+
+    def compact(self) -> None:
+        """Canlı kayıtları sırasıyla yeni dosyaya kopyalayarak boş bölgeleri atar"""
+        temp_file = f"{self.output_file}.tmp"
+        live = sorted((entry['offset'], path) for path, entry in self.manifest.entries.items()
+                      if entry['offset'] is not None)
+
+        new_offset = 0
+        with open(temp_file, 'wb') as out:
+            for offset, path in live:
+                entry = self.manifest.entries[path]
+                self._file.seek(offset)
+                remaining = entry['length']
+                while remaining > 0:
+                    chunk = self._file.read(min(remaining, self.CHUNK_SIZE))
+                    out.write(chunk)
+                    remaining -= len(chunk)
+                entry['offset'] = new_offset
+                new_offset += entry['length']
+
+        self._file.close()
+        os.replace(temp_file, self.output_file)
+        self._file = open(self.output_file, 'r+b')
+        self.manifest.output_size = new_offset
+        self.manifest.dead_bytes = 0
+
+    def close(self, success: bool = True) -> None:
+        """Dosyayı kapatır; başarılıysa manifest'i tamamlanmış olarak kaydeder"""
+        if self._file is None:
+            return
+        if success:
+            if self.needs_compaction():
+                self.compact()
+            self._file.truncate(self.manifest.output_size)
+        self._file.close()
+        self._file = None
+        if success:
+            self.manifest.save(complete=True)
+
+    def __enter__(self) -> "IncrementalWriter":
+        self.open()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close(success=exc_type is None)
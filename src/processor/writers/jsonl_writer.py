@@ -0,0 +1,45 @@
+import json
+from .text_writer import TextWriter
+from ..utils.extraction_record import ExtractionRecord
+
+
+class JSONLWriter(TextWriter):
+    """Her dosyayı tek satırlık bir JSON nesnesi olarak yazar (JSON Lines)"""
+
+    # Her satır kendi satır sonuyla biter
+    RECORD_SEPARATOR: str = ''
+
+    def write_record(self, record: ExtractionRecord) -> bool:
+        """
+        Kaydı tek satıra yazar; metin parça parça gelirse JSON dizesine parça parça eklenir
+
+        Satırdaki alanlar ExtractionRecord.FIELDS sırasıyladır. Metin üretmeyen
+        kayıtlar (tekrar kayıtları dışında) yazılmaz.
+
+        Args:
+            record (ExtractionRecord): Yazılacak kayıt
+
+        Returns:
+            bool: Kayıt yazıldıysa True
+        """
+        chunks = record.iter_text()
+        first = next(chunks, None)
+        if first is None and record.duplicate_of is None:
+            return False
+
+        # Kodlama akış kayıtlarında ilk parçayla birlikte belli olur
+        prefix = json.dumps(record.metadata(), ensure_ascii=False)[:-1]
+        self._begin_record()
+        self._file.write(f'{prefix}, "text": "')
+        if first is not None:
+            self._file.write(self._escape(first))
+            for chunk in chunks:
+                self._file.write(self._escape(chunk))
+        self._file.write(f'", "extraction_seconds": {json.dumps(record.seconds)}}}\n')
+        self._end_record()
+        return True
+
+    @staticmethod
+    def _escape(text: str) -> str:
+        """Metni tırnakları olmadan JSON dizesi içeriği olarak kaçışlar"""
+        return json.dumps(text, ensure_ascii=False)[1:-1]
@@ -0,0 +1,118 @@
+import os
+from typing import Any, Dict, List
+from .base_writer import BaseWriter
+from ..utils.extraction_record import ExtractionRecord
+# pyarrow yalnızca Parquet çıktısı istendiğinde içe aktarılır
+
+
+class ParquetWriter(BaseWriter):
+    """Kayıtları satır grupları halinde Parquet dosyasına yazar (pyarrow gerekir)"""
+
+    # Bir satır grubundaki en fazla kayıt sayısı
+    DEFAULT_ROW_GROUP_SIZE: int = 1000
+    # Bir satır grubunda biriktirilecek en fazla metin (karakter)
+    DEFAULT_ROW_GROUP_CHARS: int = 64 * 1024 * 1024
+
+    def __init__(self, output_file: str, row_group_size: int = DEFAULT_ROW_GROUP_SIZE,
+                 row_group_chars: int = DEFAULT_ROW_GROUP_CHARS, compression: str = 'zstd'):
+        """
+        ParquetWriter sınıfının başlatıcısı
+
+        Kayıtlar sütunlar halinde biriktirilir; kayıt sayısı veya metin boyutu
+        sınıra ulaştığında bir satır grubu olarak yazılır. Böylece bellekte en
+        fazla bir satır grubu tutulur ve çıktı sütun sütun okunabilir. Yazma
+        başarıyla biterse geçici dosya çıktı dosyasının yerine taşınır.
+
+        Args:
+            output_file (str): Çıktı dosyasının adı
+            row_group_size (int): Satır grubu başına kayıt sayısı
+            row_group_chars (int): Satır grubu başına metin uzunluğu (karakter)
+            compression (str): Parquet sıkıştırma yöntemi ('zstd', 'snappy', 'none' vb.)
+        """
+        super().__init__(output_file)
+        self.row_group_size = row_group_size
+        self.row_group_chars = row_group_chars
+        self.compression = compression
+        self.temp_file = f"{output_file}.tmp"
+        self._writer = None
+        self._schema = None
+        self._columns: Dict[str, List[Any]] = {}
+        self._pending_chars = 0
+
+    def open(self) -> None:
+        """Geçici Parquet dosyasını açar"""
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError:
+            raise ImportError("Parquet çıktısı için pyarrow gerekli: pip install pyarrow")
+
+        self.records_written = 0
+        self._schema = pa.schema([
+            ('path', pa.string()),
+            ('size', pa.int64()),
+            ('mime_type', pa.string()),
+            ('extractor', pa.string()),
+            ('encoding', pa.string()),
+            ('duplicate_of', pa.string()),
+            ('text', pa.large_string()),
+            ('extraction_seconds', pa.float64()),
+        ])
+        self._writer = pq.ParquetWriter(self.temp_file, self._schema, compression=self.compression)
+        self._reset_columns()
+
+    def _reset_columns(self) -> None:
+        """Satır grubu tamponunu boşaltır"""
+        self._columns = {field: [] for field in ExtractionRecord.FIELDS}
+        self._pending_chars = 0
+
+    def write_record(self, record: ExtractionRecord) -> bool:
+        """
+        Kaydı satır grubu tamponuna ekler, tampon dolduysa diske yazar
+
+        Args:
+            record (ExtractionRecord): Yazılacak kayıt
+
+        Returns:
+            bool: Kayıt yazıldıysa True (metin üretmeyen kayıtlar yazılmaz)
+        """
+        text = ''.join(record.iter_text())
+        if not text and record.duplicate_of is None:
+            return False
+
+        row = record.metadata()
+        row['text'] = text
+        row['extraction_seconds'] = record.seconds
+        for field in ExtractionRecord.FIELDS:
+            self._columns[field].append(row[field])
+        self._pending_chars += len(text)
+        self.records_written += 1
+
+        if len(self._columns['path']) >= self.row_group_size or self._pending_chars >= self.row_group_chars:
+            self._flush()
+        return True
+
+    def _flush(self) -> None:
+        """Biriken kayıtları tek bir satır grubu olarak yazar"""
+        if not self._columns['path']:
+            return
+        import pyarrow as pa
+        table = pa.Table.from_pydict(self._columns, schema=self._schema)
+        self._writer.write_table(table, row_group_size=len(self._columns['path']))
+        self._reset_columns()
+
+    def close(self, success: bool = True) -> None:
+        """Kalan kayıtları yazar, dosyayı kapatır; kayıt yazıldıysa çıktı dosyasının yerine taşır"""
+        if self._writer is None:
+            return
+        try:
+            if success:
+                self._flush()
+        finally:
+            self._writer.close()
+            self._writer = None
+
+        if success and self.records_written:
+            os.replace(self.temp_file, self.output_file)
+        elif os.path.exists(self.temp_file):
+            os.remove(self.temp_file)
@@ -0,0 +1,39 @@
+from typing import List, TextIO
+from .jsonl_writer import JSONLWriter
+
+
+class StreamWriter(JSONLWriter):
+    """Kayıtları dosya yerine açık bir metin akışına JSON Lines olarak yazar (ör. servis yanıtları)"""
+
+    def __init__(self, stream: TextIO, name: str = '<stream>'):
+        """
+        StreamWriter sınıfının başlatıcısı
+
+        Satır biçimi JSONLWriter ile aynıdır. Akış yazıcıya ait değildir;
+        close yalnızca akışı boşaltır, kapatmaz. Geçici dosya, sıkıştırma ve
+        parçalama kullanılmaz.
+
+        Args:
+            stream (TextIO): write ve flush metotları olan metin akışı
+            name (str): Loglarda kullanılacak ad
+        """
+        super().__init__(name)
+        self.stream = stream
+
+    @property
+    def outputs(self) -> List[str]:
+        """Akış yazıcısı dosya üretmez"""
+        return []
+
+    def open(self) -> None:
+        """Akışı yazmaya hazırlar"""
+        self.records_written = 0
+        self._shard_records = 0
+        self._file = self.stream
+
+    def close(self, success: bool = True) -> None:
+        """Akışta bekleyen veriyi gönderir"""
+        if self._file is None:
+            return
+        self._file.flush()
+        self._file = None
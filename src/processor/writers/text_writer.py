@@ -0,0 +1,256 @@
+import glob
+import gzip
+import io
+import os
+from typing import Any, BinaryIO, Dict, Iterable, List, Optional, TextIO, Tuple, Union
+from .base_writer import BaseWriter
+# zstandard yalnızca zstd sıkıştırması istendiğinde içe aktarılır
+
+
+class TextWriter(BaseWriter):
+    # Varsayılan yazma tamponu (byte)
+    DEFAULT_BUFFER_SIZE: int = 1024 * 1024
+    # Desteklenen sıkıştırmalar ve dosya adına eklenen uzantıları
+    COMPRESSION_SUFFIXES: Dict[str, str] = {'gzip': '.gz', 'zstd': '.zst'}
+    # Sıkıştırma seviyesi verilmezse kullanılan değerler
+    DEFAULT_COMPRESSION_LEVELS: Dict[str, int] = {'gzip': 6, 'zstd': 3}
+    # Kayıtlar arasına yazılan ayırıcı
+    RECORD_SEPARATOR: str = '\n'
+
+    def __init__(self, output_file: str, buffer_size: int = DEFAULT_BUFFER_SIZE,
+                 compression: Optional[str] = None, compression_level: Optional[int] = None,
+                 shard_size_mb: Optional[float] = None):
+        """
+        TextWriter sınıfının başlatıcısı
+
+        Kayıtlar hazır oldukça geçici dosyaya yazılır; tampon dolduğunda diske
+        aktarılır. Yazma başarıyla biterse geçici dosya çıktı dosyasının yerine
+        taşınır, böylece yarım kalan çalışma eski çıktıyı bozmaz.
+
+        Sıkıştırma açıksa metin yazılırken akış halinde sıkıştırılır ve dosya
+        adına uzantı eklenir (content.txt.zst). shard_size_mb verilirse çıktı
+        bu boyutu aşmayan parçalara bölünür (content-00001.txt.zst, ...). Kayıtlar
+        parçalar arasında bölünmez; sınır diskteki boyuta kayıt aralarında ve
+        sıkıştırıcının tamponu kadar yaklaşık olarak uygulanır.
+
+        Args:
+            output_file (str): Çıktı dosyasının adı
+            buffer_size (int): Yazma tamponunun boyutu (byte)
+            compression (Optional[str]): 'gzip', 'zstd' veya None
+            compression_level (Optional[int]): Sıkıştırma seviyesi (None ise gzip 6, zstd 3)
+            shard_size_mb (Optional[float]): Parça başına en fazla çıktı boyutu (MB)
+
+        Raises:
+            ValueError: Sıkıştırma desteklenmiyorsa
+        """
+        if compression is not None and compression not in self.COMPRESSION_SUFFIXES:
+            raise ValueError(f"Desteklenmeyen sıkıştırma: {compression} "
+                             f"(desteklenenler: {', '.join(self.COMPRESSION_SUFFIXES)})")
+        super().__init__(output_file)
+        self.buffer_size = buffer_size
+        self.compression = compression
+        self.compression_level = compression_level if compression_level is not None else \
+            self.DEFAULT_COMPRESSION_LEVELS.get(compression)
+        self.shard_size = int(shard_size_mb * 1024 * 1024) if shard_size_mb else None
+        self.temp_file = f"{self._shard_path(1)}.tmp"
+        # Bu çalışmada yazılan (geçici adları çıkarılmış) çıktı dosyaları
+        self.output_files: List[str] = []
+        self._file: Optional[TextIO] = None
+        self._raw: Optional[BinaryIO] = None
+        self._shard_records = 0
+
+    def _shard_path(self, index: int) -> str:
+        """
+        Parçanın (parçalama kapalıysa çıktının) dosya adını döndürür
+
+        Args:
+            index (int): Parça numarası (1'den başlar)
+
+        Returns:
+            str: Dosya adı
+        """
+        if not self.shard_size:
+            return ''.join(self._name_parts())
+        stem, ext = self._name_parts()
+        return f"{stem}-{index:05d}{ext}"
+
+    def _name_parts(self) -> Tuple[str, str]:
+        """Çıktı adını parça numarasının ekleneceği gövde ve uzantılar olarak ikiye ayırır"""
+        suffix = self.COMPRESSION_SUFFIXES.get(self.compression, '')
+        path = self.output_file
+        if suffix and path.endswith(suffix):
+            path = path[:-len(suffix)]
+        stem, ext = os.path.splitext(path)
+        return stem, ext + suffix
+
+    @property
+    def outputs(self) -> List[str]:
+        """Yazılan çıktı dosyalarını (parçalama açıksa parçaları) döndürür"""
+        return self.output_files
+
+    def open(self) -> None:
+        """İlk geçici çıktı dosyasını açar"""
+        self.records_written = 0
+        self.output_files = []
+        self._open_shard()
+
+    def _open_shard(self) -> None:
+        """Sıradaki parçanın geçici dosyasını açar, gerekiyorsa sıkıştırıcıyla sarar"""
+        path = self._shard_path(len(self.output_files) + 1)
+        self.output_files.append(path)
+        self.temp_file = f"{path}.tmp"
+        self._raw = open(self.temp_file, 'wb', buffering=self.buffer_size)
+        self._wrap_raw(path)
+        self._shard_records = 0
+
+    def _wrap_raw(self, path: str) -> None:
+        """
+        Açık ham dosyayı gerekiyorsa sıkıştırıcıyla, ardından metin katmanıyla sarar
+
+        Args:
+            path (str): Parçanın asıl (geçici olmayan) dosya adı
+        """
+        if self.compression == 'gzip':
+            # Başlıkta geçici ad değil, sıkıştırılmış dosyanın asıl adı yer alsın
+            stream = gzip.GzipFile(filename=os.path.basename(path), mode='wb',
+                                   compresslevel=self.compression_level, fileobj=self._raw)
+        elif self.compression == 'zstd':
+            try:
+                import zstandard
+            except ImportError:
+                raise ImportError("zstd sıkıştırması için zstandard gerekli: pip install zstandard")
+            stream = zstandard.ZstdCompressor(level=self.compression_level).stream_writer(self._raw)
+        else:
+            stream = self._raw
+        self._file = io.TextIOWrapper(stream, encoding='utf-8')
+
+    def _close_shard(self) -> None:
+        """Açık parçayı kapatır (sıkıştırıcının kalan verisi dahil)"""
+        self._file.close()
+        if not self._raw.closed:
+            self._raw.close()
+        self._file = None
+        self._raw = None
+
+    def _begin_record(self) -> None:
+        """Kayıt yazılmadan önce parça dolduysa yenisine geçer, gerekiyorsa ayırıcıyı yazar"""
+        if self.shard_size and self._shard_records and self._raw.tell() >= self.shard_size:
+            self._close_shard()
+            self._open_shard()
+        if self._shard_records and self.RECORD_SEPARATOR:
+            self._file.write(self.RECORD_SEPARATOR)
+
+    def _end_record(self) -> None:
+        """Kayıt sayaçlarını artırır"""
+        self._shard_records += 1
+        self.records_written += 1
+
+    def write_record(self, record: Union[str, Iterable[str]]) -> bool:
+        """Kaydı tampona yazar, kayıtlar arasına satır sonu ekler"""
+        pieces = (record,) if isinstance(record, str) else record
+        started = False
+        for piece in pieces:
+            if not started:
+                # Ayırıcı ancak kayıt gerçekten içerik ürettiğinde yazılır
+                self._begin_record()
+                started = True
+            self._file.write(piece)
+        if started:
+            self._end_record()
+        return started
+
+    def checkpoint_state(self) -> Dict[str, Any]:
+        """
+        Yazılanları diske aktarır ve resume ile devam etmek için gereken durumu döndürür
+
+        Sıkıştırma açıksa o ana kadarki veri ayrı bir gzip üyesi veya zstd
+        çerçevesi olarak kapatılır ve sonraki kayıtlar yenisine yazılır. Art arda
+        eklenmiş üyeler/çerçeveler gzip ve zstd araçlarıyla tek dosya gibi açılır.
+
+        Returns:
+            Dict[str, Any]: Parça adları, son parçanın geçerli boyutu ve kayıt sayaçları
+        """
+        stream = self._file.detach()
+        if self.compression == 'gzip':
+            # Üye bitirilir; GzipFile dışarıdan verilen ham dosyayı kapatmaz
+            stream.close()
+        elif self.compression == 'zstd':
+            import zstandard
+            stream.flush(zstandard.FLUSH_FRAME)
+        self._raw.flush()
+        os.fsync(self._raw.fileno())
+        state = {
+            'output_files': list(self.output_files),
+            'offset': self._raw.tell(),
+            'records_written': self.records_written,
+            'shard_records': self._shard_records,
+        }
+        # Yeni gzip üyesinin başlığı hemen yazıldığından durum ondan önce alınır
+        if self.compression == 'gzip':
+            self._wrap_raw(self.output_files[-1])
+        else:
+            self._file = io.TextIOWrapper(stream, encoding='utf-8')
+        return state
+
+    def resume(self, state: Dict[str, Any]) -> None:
+        """
+        checkpoint_state ile kaydedilmiş bir yazmaya open yerine kaldığı yerden devam eder
+
+        Son parçanın geçici dosyası kayıttaki boyuta kısaltılır, böylece kayıttan
+        sonra yazılmış (yarım kalmış olabilecek) veri atılır. Kayıttan sonra
+        açılmış parçaların geçici dosyaları silinir.
+
+        Args:
+            state (Dict[str, Any]): checkpoint_state'in döndürdüğü durum
+
+        Raises:
+            FileNotFoundError: Kayıttaki geçici parça dosyalarından biri yoksa
+        """
+        output_files = list(state['output_files'])
+        for path in output_files:
+            if not os.path.exists(f"{path}.tmp"):
+                raise FileNotFoundError(f"Geçici çıktı dosyası bulunamadı: {path}.tmp")
+        index = len(output_files) + 1
+        while self.shard_size and os.path.exists(f"{self._shard_path(index)}.tmp"):
+            os.remove(f"{self._shard_path(index)}.tmp")
+            index += 1
+
+        self.output_files = output_files
+        self.records_written = state['records_written']
+        self.temp_file = f"{output_files[-1]}.tmp"
+        self._raw = open(self.temp_file, 'r+b', buffering=self.buffer_size)
+        self._raw.truncate(state['offset'])
+        self._raw.seek(state['offset'])
+        self._wrap_raw(output_files[-1])
+        self._shard_records = state['shard_records']
+
+    def suspend(self) -> None:
+        """Dosyaları kapatır ama geçici dosyaları silmez; sonraki çalışma resume ile devam eder"""
+        if self._file is None:
+            return
+        self._close_shard()
+
+    def close(self, success: bool = True) -> None:
+        """Dosyaları kapatır; kayıt yazıldıysa çıktı dosyalarının yerine taşır"""
+        if self._file is None:
+            return
+        self._close_shard()
+
+        if success and self.records_written:
+            for path in self.output_files:
+                os.replace(f"{path}.tmp", path)
+            if self.shard_size:
+                self._remove_stale_shards()
+        else:
+            for path in self.output_files:
+                if os.path.exists(f"{path}.tmp"):
+                    os.remove(f"{path}.tmp")
+            self.output_files = []
+
+    def _remove_stale_shards(self) -> None:
+        """Önceki çalışmadan kalan, bu çalışmada yazılmayan parçaları siler"""
+        stem, ext = self._name_parts()
+        current = set(self.output_files)
+        for path in glob.glob(f"{glob.escape(stem)}-{'[0-9]' * 5}{glob.escape(ext)}"):
+            if path not in current:
+                os.remove(path)
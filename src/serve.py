@@ -0,0 +1,31 @@
+import argparse
+from processor.extraction_service import ExtractionService, serve
+
+
+def main():
+    """
+    Çıkarım servisini başlatır
+
+    Örnek istek:
+        curl --unix-socket /tmp/textractor.sock -d '{"path": "belgeler"}' http://localhost/jobs
+    """
+    parser = argparse.ArgumentParser(description="Dosya içeriği çıkarım servisi")
+    parser.add_argument('--socket', help="Dinlenecek Unix soketi (verilmezse TCP kullanılır)")
+    parser.add_argument('--host', default='127.0.0.1', help="TCP adresi [varsayılan: 127.0.0.1]")
+    parser.add_argument('--port', type=int, default=8750, help="TCP portu [varsayılan: 8750]")
+    parser.add_argument('--workers', type=int, default=2, help="Worker süreci sayısı [varsayılan: 2]")
+    parser.add_argument('--max-pending', type=int, default=16,
+                        help="Boş worker bekleyebilecek en fazla iş [varsayılan: 16]")
+    parser.add_argument('--queue-timeout', type=float, default=30.0,
+                        help="Bir işin boş worker için en fazla bekleme süresi (saniye) [varsayılan: 30]")
+    parser.add_argument('--max-processors', type=int, default=4,
+                        help="Worker başına sıcak tutulacak farklı ayar sayısı [varsayılan: 4]")
+    args = parser.parse_args()
+
+    service = ExtractionService(workers=args.workers, max_pending=args.max_pending,
+                                queue_timeout=args.queue_timeout, max_processors=args.max_processors)
+    serve(service, socket_path=args.socket, host=args.host, port=args.port)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,5 @@
+import os
+import sys
+
+# Paket kurulmadan src/ altındaki modüller içe aktarılabilsin
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src'))
@@ -0,0 +1,88 @@
+from processor.utils.deduplicator import ContentDeduplicator
+from processor.utils.file_probe import FileProbe
+
+
+def _file(tmp_path, name, content):
+    path = tmp_path / name
+    path.write_bytes(content)
+    return FileProbe(str(path))
+
+
+def test_first_file_of_a_size_is_not_hashed(tmp_path, monkeypatch):
+    dedup = ContentDeduplicator()
+    hashed = []
+    original_hash_file = dedup._hash_file
+    monkeypatch.setattr(dedup, '_hash_file', lambda path: hashed.append(path) or original_hash_file(path))
+
+    assert dedup.check(_file(tmp_path, 'a', b'aaaa')) is None
+    assert dedup.check(_file(tmp_path, 'b', b'bbbbb')) is None
+    assert hashed == []
+
+
+def test_duplicate_points_to_first_copy(tmp_path):
+    dedup = ContentDeduplicator()
+    first = _file(tmp_path, 'a', b'same')
+    assert dedup.check(first) is None
+    dedup.confirm(first.path, 0.5)
+
+    assert dedup.check(_file(tmp_path, 'b', b'diff')) is None
+    assert dedup.check(_file(tmp_path, 'c', b'same')) == first.path
+    dedup.record(4, first.path)
+    assert (dedup.duplicates, dedup.saved_bytes, dedup.saved_seconds) == (1, 4, 0.5)
+
+
+def test_empty_files_are_never_duplicates(tmp_path):
+    dedup = ContentDeduplicator()
+    assert dedup.check(_file(tmp_path, 'a', b'')) is None
+    assert dedup.check(_file(tmp_path, 'b', b'')) is None
+
+
+def test_in_memory_content_is_hashed_immediately(tmp_path):
+    dedup = ContentDeduplicator()
+    member = FileProbe.from_bytes('a.zip!/x.txt', b'payload')
+    assert dedup.check(member) is None
+    dedup.confirm(member.path, 0.1)
+    assert dedup.check(_file(tmp_path, 'y.txt', b'payload')) == member.path
+
+
+def test_released_original_is_replaced_by_next_copy(tmp_path):
+    dedup = ContentDeduplicator()
+    first = _file(tmp_path, 'a', b'same')
+    second = _file(tmp_path, 'b', b'same')
+    third = _file(tmp_path, 'c', b'same')
+
+    assert dedup.check(first) is None
+    # Çıkarımı başarısız olan ilk kopya referans gösterilmez
+    dedup.release(first.path)
+    assert not dedup.is_confirmed(first.path)
+    assert dedup.check(second) is None
+    dedup.confirm(second.path, 0.2)
+    assert dedup.check(third) == second.path
+
+
+def test_released_hashed_original(tmp_path):
+    dedup = ContentDeduplicator()
+    first = _file(tmp_path, 'a', b'aaaa')
+    second = _file(tmp_path, 'b', b'same')
+    third = _file(tmp_path, 'c', b'same')
+
+    assert dedup.check(first) is None
+    dedup.confirm(first.path, 0.1)
+    # Aynı boyutta ikinci dosya geldiği için hash'lenerek kaydedilir
+    assert dedup.check(second) is None
+    dedup.release(second.path)
+    assert dedup.check(third) is None
+    assert dedup.check(_file(tmp_path, 'd', b'aaaa')) == first.path
+
+
+def test_confirm_and_release_are_idempotent(tmp_path):
+    dedup = ContentDeduplicator()
+    first = _file(tmp_path, 'a', b'same')
+    dedup.check(first)
+    dedup.confirm(first.path, 0.3)
+    dedup.release(first.path)
+    dedup.confirm(first.path, 9.0)
+
+    assert dedup.is_confirmed(first.path)
+    assert dedup.seconds[first.path] == 0.3
+    assert dedup.check(_file(tmp_path, 'b', b'same')) == first.path
@@ -0,0 +1,165 @@
+import os
+import sqlite3
+import time
+
+import pytest
+
+from processor.file_processor import FileProcessor
+from processor.utils.extraction_cache import ExtractionCache
+from processor.writers.text_writer import TextWriter
+
+
+@pytest.fixture
+def source(tmp_path):
+    path = tmp_path / 'a.txt'
+    path.write_text('merhaba', encoding='utf-8')
+    return str(path)
+
+
+def test_hit_requires_same_size_and_mtime(tmp_path, source):
+    cache = ExtractionCache(str(tmp_path / 'c.db'))
+    assert cache.get(source) is None
+    cache.put(source, 'metin', 'TextExtractor')
+    assert cache.get(source) == ('metin', 'TextExtractor')
+
+    with open(source, 'a', encoding='utf-8') as f:
+        f.write('!')
+    assert cache.get(source) is None
+    assert cache.take_counters() == (1, 2)
+    cache.close()
+
+
+def test_hash_finds_moved_file(tmp_path, source):
+    cache = ExtractionCache(str(tmp_path / 'c.db'), use_hash=True)
+    cache.put(source, 'metin', 'TextExtractor')
+    moved = str(tmp_path / 'b.txt')
+    os.rename(source, moved)
+
+    assert cache.get(moved) == ('metin', 'TextExtractor')
+    cache.close()
+
+
+def test_close_is_idempotent_and_reopens(tmp_path, source):
+    cache_file = str(tmp_path / 'c.db')
+    cache = ExtractionCache(cache_file)
+    cache.put(source, 'metin', 'TextExtractor')
+    cache.close()
+    cache.close()
+
+    other = ExtractionCache(cache_file)
+    assert other.get(source) == ('metin', 'TextExtractor')
+    other.close()
+    # Kapatılan önbellek sonraki kullanımda yeniden açılır
+    assert cache.get(source) == ('metin', 'TextExtractor')
+    cache.close()
+
+
+def test_writes_do_not_hold_the_lock(tmp_path, source):
+    # Aynı dosyayı kullanan worker süreçleri gibi iki bağlantı
+    cache_file = str(tmp_path / 'c.db')
+    first = ExtractionCache(cache_file)
+    second = ExtractionCache(cache_file)
+    first.put(source, 'metin', 'TextExtractor')
+    assert first.get(source) is not None
+
+    other = tmp_path / 'b.txt'
+    other.write_text('dünya', encoding='utf-8')
+    start = time.monotonic()
+    second.put(str(other), 'başka metin', 'TextExtractor')
+    assert time.monotonic() - start < 5
+    assert first.get(str(other)) == ('başka metin', 'TextExtractor')
+    assert second.get(source) == ('metin', 'TextExtractor')
+    first.close()
+    second.close()
+
+
+def test_evict_by_size_removes_least_recently_used(tmp_path):
+    cache = ExtractionCache(str(tmp_path / 'c.db'), max_size_mb=1.5 / 1024)
+    paths = []
+    for i in range(3):
+        path = tmp_path / f"{i}.txt"
+        path.write_text(str(i), encoding='utf-8')
+        paths.append(str(path))
+        cache.put(str(path), 'x' * 1024, 'TextExtractor')
+    cache.get(paths[0])
+
+    assert cache.evict() == 2
+    assert cache.get(paths[0]) is not None
+    assert cache.get(paths[1]) is None and cache.get(paths[2]) is None
+    cache.close()
+
+
+def test_interrupted_run_keeps_cached_entries(tmp_path, monkeypatch):
+    root = tmp_path / 'corpus'
+    root.mkdir()
+    for i in range(5):
+        (root / f"{i}.txt").write_text(f"içerik {i}", encoding='utf-8')
+    cache_file = str(tmp_path / 'c.db')
+    write_record = TextWriter.write_record
+
+    def interrupted(writer, record):
+        if writer.records_written == 3:
+            raise KeyboardInterrupt
+        return write_record(writer, record)
+
+    monkeypatch.setattr(TextWriter, 'write_record', interrupted)
+    processor = FileProcessor(output_file=str(tmp_path / 'out.txt'), cache_file=cache_file)
+    with pytest.raises(KeyboardInterrupt):
+        processor.process(str(root))
+
+    # Her kayıt yazıldığı anda diske işlenmiş olmalı
+    cache = FileProcessor(output_file=str(tmp_path / 'out.txt'), cache_file=cache_file).cache
+    assert sum(cache.get(str(path)) is not None for path in root.iterdir()) >= 3
+    cache.close()
+
+
+def test_entries_are_kept_per_settings(tmp_path, source):
+    cache_file = str(tmp_path / 'c.db')
+    capped = ExtractionCache(cache_file, settings={'spreadsheet_max_rows': 3})
+    capped.put(source, 'kısaltılmış', 'OfficeExtractor')
+    capped.close()
+
+    uncapped = ExtractionCache(cache_file, settings={'spreadsheet_max_rows': None})
+    assert uncapped.get(source) is None
+    uncapped.put(source, 'tam metin', 'OfficeExtractor')
+    uncapped.close()
+
+    capped = ExtractionCache(cache_file, settings={'spreadsheet_max_rows': 3})
+    assert capped.get(source) == ('kısaltılmış', 'OfficeExtractor')
+    capped.close()
+
+
+def test_old_schema_is_replaced(tmp_path, source):
+    cache_file = str(tmp_path / 'c.db')
+    conn = sqlite3.connect(cache_file)
+    conn.execute("CREATE TABLE extractions (path TEXT PRIMARY KEY, text TEXT)")
+    conn.execute("INSERT INTO extractions VALUES (?, 'eski')", (source,))
+    conn.commit()
+    conn.close()
+
+    cache = ExtractionCache(cache_file)
+    assert cache.get(source) is None
+    cache.put(source, 'metin', 'TextExtractor')
+    assert cache.get(source) == ('metin', 'TextExtractor')
+    cache.close()
+
+
+def test_cached_run_with_other_extractor_settings(tmp_path):
+    openpyxl = pytest.importorskip('openpyxl')
+    root = tmp_path / 'corpus'
+    root.mkdir()
+    workbook = openpyxl.Workbook()
+    for i in range(6):
+        workbook.active.append([f"satır{i}", i])
+    workbook.save(root / 'tablo.xlsx')
+    cache_file = str(tmp_path / 'c.db')
+
+    capped_file = tmp_path / 'capped.txt'
+    assert FileProcessor(output_file=str(capped_file), cache_file=cache_file,
+                         spreadsheet_max_rows=3).process(str(root))
+    full_file = tmp_path / 'full.txt'
+    processor = FileProcessor(output_file=str(full_file), cache_file=cache_file)
+    assert processor.process(str(root))
+
+    assert 'satır5' not in capped_file.read_text(encoding='utf-8')
+    assert 'satır5' in full_file.read_text(encoding='utf-8')
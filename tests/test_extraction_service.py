@@ -0,0 +1,63 @@
+import multiprocessing
+import socket
+import threading
+from http.server import ThreadingHTTPServer
+
+import pytest
+
+from processor.extraction_service import ExtractionService, _ServiceHandler, _stream_job
+from processor.file_processor import FileProcessor
+
+
+@pytest.fixture
+def server():
+    # Başlık doğrulaması worker'a ulaşmadan yapılır; worker süreçleri başlatılmaz
+    server = ThreadingHTTPServer(('127.0.0.1', 0), _ServiceHandler)
+    server.daemon_threads = True
+    server.service = ExtractionService(workers=1)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def _post(server, content_length: str) -> bytes:
+    request = (f"POST /jobs HTTP/1.1\r\nHost: localhost\r\n"
+               f"Content-Length: {content_length}\r\n\r\n").encode('ascii')
+    with socket.create_connection(server.server_address, timeout=5) as conn:
+        conn.sendall(request)
+        response = b''
+        # Sunucu bağlantıyı kapatmalı; aksi halde zaman aşımı testi düşürür
+        while chunk := conn.recv(4096):
+            response += chunk
+    return response
+
+
+@pytest.mark.parametrize('content_length', ['abc', '-1', '1.5'])
+def test_invalid_content_length_is_rejected(server, content_length):
+    response = _post(server, content_length)
+
+    assert response.startswith(b'HTTP/1.1 400 ')
+    assert b'Content-Length' in response.split(b'\r\n\r\n', 1)[1]
+
+
+def test_oversized_body_is_rejected(server):
+    response = _post(server, str(_ServiceHandler.MAX_BODY_SIZE + 1))
+
+    assert response.startswith(b'HTTP/1.1 413 ')
+
+
+def test_stream_job_closes_cache(tmp_path):
+    root = tmp_path / 'corpus'
+    root.mkdir()
+    (root / 'a.txt').write_text('merhaba', encoding='utf-8')
+    processor = FileProcessor(cache_file=str(tmp_path / 'c.db'), output_format='jsonl')
+    parent, child = multiprocessing.Pipe()
+
+    assert _stream_job(child, processor, str(root)) is False
+    assert parent.recv()[0] == 'data'
+    # Sıcak tutulan işlemci iş bitince önbellek bağlantısını bırakır
+    assert processor.cache._conn is None
+    assert processor.cache.get(str(root / 'a.txt')) is not None
+    processor.cache.close()
@@ -0,0 +1,224 @@
+import gzip
+import os
+import time
+import zipfile
+
+import pytest
+
+from processor.extractors.text_extractor import TextExtractor
+from processor.file_processor import FileProcessor
+from processor.utils.quarantine import Quarantine
+from processor.writers.text_writer import TextWriter
+
+
+def _tree(root, files):
+    for rel_path, content in files.items():
+        path = root / rel_path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content, encoding='utf-8')
+
+
+def _read(path) -> str:
+    with open(path, 'r', encoding='utf-8') as f:
+        return f.read()
+
+
+@pytest.fixture
+def corpus(tmp_path):
+    root = tmp_path / 'corpus'
+    _tree(root, {f"dir{i % 3}/file{i:02d}.txt": f"içerik {i}\n" * (i + 1) for i in range(12)})
+    return root
+
+
+def test_incremental_update_matches_full_rebuild(tmp_path, corpus):
+    output_file = str(tmp_path / 'out.txt')
+    processor = FileProcessor(output_file=output_file, incremental=True, prefetch_threads=0)
+    assert processor.process(str(corpus))
+
+    (corpus / 'dir0' / 'file00.txt').write_text('kısa', encoding='utf-8')
+    (corpus / 'dir1' / 'file01.txt').write_text('çok daha uzun içerik\n' * 50, encoding='utf-8')
+    os.remove(corpus / 'dir2' / 'file02.txt')
+    (corpus / 'dir2' / 'new.txt').write_text('yeni dosya', encoding='utf-8')
+    assert FileProcessor(output_file=output_file, incremental=True, prefetch_threads=0).process(str(corpus))
+
+    full_file = str(tmp_path / 'full.txt')
+    assert FileProcessor(output_file=full_file, prefetch_threads=0).process(str(corpus))
+    # Artımlı çıktıda kayıt sırası ve boşluklar farklı olabilir, kayıtlar aynı olmalı
+    separator = '-' * 80 + '\nDosya: '
+    records = lambda text: sorted(part.strip() for part in text.split(separator)[1:])
+    assert records(_read(output_file)) == records(_read(full_file))
+
+
+def test_incremental_run_without_changes_keeps_output(tmp_path, corpus):
+    output_file = str(tmp_path / 'out.txt')
+    FileProcessor(output_file=output_file, incremental=True).process(str(corpus))
+    before = os.stat(output_file)
+    FileProcessor(output_file=output_file, incremental=True).process(str(corpus))
+
+    assert os.stat(output_file).st_mtime_ns == before.st_mtime_ns
+
+
+@pytest.mark.parametrize('options', [{}, {'output_compression': 'gzip'}, {'workers': 2}])
+def test_checkpoint_resume_matches_clean_run(tmp_path, corpus, monkeypatch, options):
+    clean_file = str(tmp_path / 'clean.txt')
+    assert FileProcessor(output_file=clean_file, **options).process(str(corpus))
+
+    output_file = str(tmp_path / 'out.txt')
+    checkpoint_file = str(tmp_path / 'run.ckpt')
+    write_record = TextWriter.write_record
+    calls = []
+
+    def interrupted(writer, record):
+        calls.append(record)
+        if len(calls) == 7:
+            raise KeyboardInterrupt
+        return write_record(writer, record)
+
+    monkeypatch.setattr(TextWriter, 'write_record', interrupted)
+    processor = FileProcessor(output_file=output_file, checkpoint_file=checkpoint_file,
+                              checkpoint_interval=0, **options)
+    with pytest.raises(KeyboardInterrupt):
+        processor.process(str(corpus))
+    assert os.path.exists(checkpoint_file)
+    monkeypatch.setattr(TextWriter, 'write_record', write_record)
+
+    processor = FileProcessor(output_file=output_file, checkpoint_file=checkpoint_file,
+                              checkpoint_interval=0, **options)
+    assert processor.process(str(corpus))
+    # Kontrol noktasından önce tamamlanan dosyalar yeniden işlenmez
+    assert 0 < len(processor.processed_files) < 12
+    assert not os.path.exists(checkpoint_file)
+    opener, suffix = (gzip.open, '.gz') if options.get('output_compression') else (open, '')
+    with opener(clean_file + suffix, 'rb') as expected, opener(output_file + suffix, 'rb') as actual:
+        assert actual.read() == expected.read()
+
+
+def test_checkpoint_with_other_settings_starts_over(tmp_path, corpus, monkeypatch):
+    output_file = str(tmp_path / 'out.txt')
+    checkpoint_file = str(tmp_path / 'run.ckpt')
+    write_record = TextWriter.write_record
+
+    def interrupted(writer, record):
+        if writer.records_written == 3:
+            raise KeyboardInterrupt
+        return write_record(writer, record)
+
+    monkeypatch.setattr(TextWriter, 'write_record', interrupted)
+    with pytest.raises(KeyboardInterrupt):
+        FileProcessor(output_file=output_file, checkpoint_file=checkpoint_file,
+                      checkpoint_interval=0).process(str(corpus))
+    monkeypatch.setattr(TextWriter, 'write_record', write_record)
+
+    processor = FileProcessor(output_file=output_file, checkpoint_file=checkpoint_file,
+                              checkpoint_interval=0, max_file_size_mb=1.0)
+    assert processor.process(str(corpus))
+    assert _read(output_file).count('Dosya: ') == 12
+
+
+@pytest.mark.parametrize('workers', [1, 2])
+def test_timed_out_archive_member_is_quarantined(tmp_path, monkeypatch, workers):
+    root = tmp_path / 'corpus'
+    root.mkdir()
+    with zipfile.ZipFile(root / 'a.zip', 'w') as archive:
+        archive.writestr('slow.txt', 'yavaş')
+        archive.writestr('fast.txt', 'hızlı')
+    (root / 'b.txt').write_text('düz dosya', encoding='utf-8')
+    extract_text = TextExtractor.extract_text
+
+    def slow(extractor, file_path, probe=None):
+        if file_path.endswith('slow.txt'):
+            time.sleep(30)
+        return extract_text(extractor, file_path, probe)
+
+    # Worker ve gözetimli alt süreçler fork ile başlatıldığından yama onlara da geçer
+    monkeypatch.setattr(TextExtractor, 'extract_text', slow)
+    quarantine_file = str(tmp_path / 'quarantine.json')
+    options = {'archives': True, 'workers': workers, 'file_timeout': 0.5, 'quarantine_file': quarantine_file}
+    processor = FileProcessor(output_file=str(tmp_path / 'out.txt'), **options)
+    assert processor.process(str(root))
+
+    member = f"{root / 'a.zip'}!/slow.txt"
+    assert processor.error_files == {member: 'timeout'}
+    assert Quarantine(quarantine_file).entries[member]['reason'] == 'timeout'
+
+    # Sonraki çalışmada karantinadaki üye denenmeden atlanır
+    processor = FileProcessor(output_file=str(tmp_path / 'out.txt'), **options)
+    started = time.monotonic()
+    assert processor.process(str(root))
+    assert time.monotonic() - started < 0.5
+    assert processor.error_files == {}
+    assert _read(tmp_path / 'out.txt').count('Dosya: ') == 2
+
+
+def test_large_files_are_not_streamed_around_the_supervisor(tmp_path, monkeypatch):
+    root = tmp_path / 'corpus'
+    root.mkdir()
+    (root / 'big.txt').write_text('büyük dosya\n' * 1000, encoding='utf-8')
+    (root / 'small.txt').write_text('küçük', encoding='utf-8')
+    extract_text = TextExtractor.extract_text
+
+    def slow(extractor, file_path, probe=None):
+        if file_path.endswith('big.txt'):
+            time.sleep(30)
+        return extract_text(extractor, file_path, probe)
+
+    monkeypatch.setattr(TextExtractor, 'extract_text', slow)
+    processor = FileProcessor(output_file=str(tmp_path / 'out.txt'), stream_threshold_mb=0.001,
+                              file_timeout=0.5)
+    assert processor.process(str(root))
+
+    assert processor.error_files == {str(root / 'big.txt'): 'timeout'}
+    assert _read(tmp_path / 'out.txt').count('Dosya: ') == 1
+
+
+def test_dedup_output_does_not_depend_on_worker_count(tmp_path):
+    root = tmp_path / 'corpus'
+    (root / 'sub').mkdir(parents=True)
+    with zipfile.ZipFile(root / 'a.zip', 'w') as archive:
+        archive.writestr('x.txt', 'ortak içerik')
+        archive.writestr('y.txt', 'arşive özgü')
+        archive.writestr('z.txt', 'arşive özgü')
+    # Alt dizindeki dosyalar arşivden sonra taranır
+    (root / 'sub' / 'b.txt').write_text('ortak içerik', encoding='utf-8')
+    (root / 'sub' / 'c.txt').write_text('başka içerik', encoding='utf-8')
+    (root / 'sub' / 'd.txt').write_text('başka içerik', encoding='utf-8')
+
+    outputs = []
+    for workers in (1, 2):
+        output_file = tmp_path / f"out{workers}.txt"
+        processor = FileProcessor(output_file=str(output_file), archives=True, dedup=True,
+                                  workers=workers, batch_size=1)
+        assert processor.process(str(root))
+        assert processor.deduplicator.duplicates == 3
+        outputs.append(output_file.read_text(encoding='utf-8'))
+
+    assert outputs[0] == outputs[1]
+    assert f"[Aynı içerik: {root / 'a.zip'}!/x.txt]" in outputs[0]
+    assert f"[Aynı içerik: {root / 'a.zip'}!/y.txt]" in outputs[0]
+
+
+def test_files_opened_by_their_extractor_are_not_prefetched(tmp_path):
+    processor = FileProcessor(output_file=str(tmp_path / 'out.txt'))
+    for name in ('a.npy', 'b.h5', 'c.txt'):
+        (tmp_path / name).write_bytes(b'\x00' * 16)
+
+    # Model dosyaları mmap/h5py ile yoldan açılır, önceden okunmaları boşa okumadır
+    assert not processor._should_prefetch(processor._probe(str(tmp_path / 'a.npy')))
+    assert not processor._should_prefetch(processor._probe(str(tmp_path / 'b.h5')))
+    assert processor._should_prefetch(processor._probe(str(tmp_path / 'c.txt')))
+
+
+def test_large_files_are_extracted_inside_workers(tmp_path, monkeypatch):
+    root = tmp_path / 'corpus'
+    _tree(root, {'big.txt': 'büyük dosya\n' * 1000, 'small.txt': 'küçük'})
+
+    def iter_text(extractor, file_path):
+        raise AssertionError("büyük dosya ana süreçte akış halinde çıkarıldı")
+
+    monkeypatch.setattr(TextExtractor, 'iter_text', iter_text)
+    output_file = tmp_path / 'out.txt'
+    processor = FileProcessor(output_file=str(output_file), stream_threshold_mb=0.001, workers=2)
+    assert processor.process(str(root))
+
+    assert processor.error_files == {}
+    assert _read(output_file).count('büyük dosya') == 1000
@@ -0,0 +1,126 @@
+import os
+
+import pytest
+
+from processor.utils.manifest import OutputManifest
+from processor.writers.incremental_writer import IncrementalWriter
+
+FINGERPRINT = {'format_version': 1}
+
+
+def _stat(size: int, mtime_ns: int = 1) -> os.stat_result:
+    return os.stat_result((0o100644, 0, 0, 1, 0, 0, size, 0, 0, 0), {'st_mtime_ns': mtime_ns})
+
+
+def _read_record(output_file: str, entry) -> str:
+    with open(output_file, 'rb') as f:
+        f.seek(entry['offset'])
+        return f.read(entry['length']).decode('utf-8')
+
+
+@pytest.fixture
+def paths(tmp_path):
+    output_file = str(tmp_path / 'out.txt')
+    return output_file, f"{output_file}.manifest.json"
+
+
+def _write(output_file, manifest, records, compact_ratio=0.25):
+    with IncrementalWriter(output_file, manifest, compact_ratio=compact_ratio) as writer:
+        for file_path, record in records:
+            if record is None:
+                writer.remove(file_path)
+            else:
+                writer.upsert(file_path, record, _stat(len(file_path)))
+    return OutputManifest.load(manifest.manifest_file, FINGERPRINT)
+
+
+def test_records_are_appended_with_offsets(paths):
+    output_file, manifest_file = paths
+    manifest = _write(output_file, OutputManifest(manifest_file, FINGERPRINT),
+                      [('a', 'AAAA'), ('b', 'BB')])
+
+    assert manifest.output_size == os.path.getsize(output_file) == len('AAAA\nBB\n')
+    assert _read_record(output_file, manifest.entries['a']) == 'AAAA\n'
+    assert _read_record(output_file, manifest.entries['b']) == 'BB\n'
+    assert manifest.dead_bytes == 0
+
+
+def test_shorter_record_is_patched_in_place(paths):
+    output_file, manifest_file = paths
+    manifest = _write(output_file, OutputManifest(manifest_file, FINGERPRINT),
+                      [('a', 'AAAA'), ('b', 'BB')])
+    manifest = _write(output_file, manifest, [('a', 'A')], compact_ratio=1.0)
+
+    assert manifest.entries['a']['offset'] == 0
+    assert _read_record(output_file, manifest.entries['a']) == 'A\n'
+    assert _read_record(output_file, manifest.entries['b']) == 'BB\n'
+    # Eski kaydın artan kısmı doldurma baytıyla boşaltılır
+    with open(output_file, 'rb') as f:
+        assert f.read() == b'A\n' + IncrementalWriter.FILL_BYTE * 3 + b'BB\n'
+    assert manifest.dead_bytes == 3
+
+
+def test_longer_record_moves_to_end(paths):
+    output_file, manifest_file = paths
+    manifest = _write(output_file, OutputManifest(manifest_file, FINGERPRINT),
+                      [('a', 'A'), ('b', 'BB')])
+    manifest = _write(output_file, manifest, [('a', 'AAAAAA')], compact_ratio=1.0)
+
+    assert manifest.entries['a']['offset'] == len('A\nBB\n')
+    assert _read_record(output_file, manifest.entries['a']) == 'AAAAAA\n'
+    assert _read_record(output_file, manifest.entries['b']) == 'BB\n'
+    assert manifest.dead_bytes == 2
+
+
+def test_remove_blanks_record(paths):
+    output_file, manifest_file = paths
+    manifest = _write(output_file, OutputManifest(manifest_file, FINGERPRINT),
+                      [('a', 'AAAA'), ('b', 'BB')])
+    manifest = _write(output_file, manifest, [('a', None)], compact_ratio=1.0)
+
+    assert 'a' not in manifest.entries
+    with open(output_file, 'rb') as f:
+        assert f.read() == IncrementalWriter.FILL_BYTE * 5 + b'BB\n'
+
+
+def test_compaction_drops_dead_bytes_and_keeps_order(paths):
+    output_file, manifest_file = paths
+    manifest = _write(output_file, OutputManifest(manifest_file, FINGERPRINT),
+                      [('a', 'A' * 10), ('b', 'B' * 10), ('c', 'C' * 10)])
+    manifest = _write(output_file, manifest, [('b', None), ('a', 'a' * 20)])
+
+    assert manifest.dead_bytes == 0
+    with open(output_file, 'rb') as f:
+        assert f.read() == b'C' * 10 + b'\n' + b'a' * 20 + b'\n'
+    assert manifest.output_size == os.path.getsize(output_file)
+    assert _read_record(output_file, manifest.entries['c']) == 'C' * 10 + '\n'
+    assert _read_record(output_file, manifest.entries['a']) == 'a' * 20 + '\n'
+
+
+def test_streamed_record_and_empty_entry(paths):
+    output_file, manifest_file = paths
+    manifest = _write(output_file, OutputManifest(manifest_file, FINGERPRINT),
+                      [('a', iter(['x', 'y', 'z'])), ('archive.zip', '')])
+
+    assert _read_record(output_file, manifest.entries['a']) == 'xyz\n'
+    # Çıktı üretmeyen dosyalar konumsuz kaydedilir
+    assert manifest.entries['archive.zip']['offset'] is None
+
+
+def test_interrupted_update_invalidates_manifest(paths):
+    output_file, manifest_file = paths
+    manifest = _write(output_file, OutputManifest(manifest_file, FINGERPRINT), [('a', 'A')])
+
+    with pytest.raises(RuntimeError):
+        with IncrementalWriter(output_file, manifest) as writer:
+            writer.upsert('b', 'B', _stat(1))
+            raise RuntimeError("kesildi")
+
+    assert OutputManifest.load(manifest_file, FINGERPRINT) is None
+
+
+def test_changed_fingerprint_invalidates_manifest(paths):
+    output_file, manifest_file = paths
+    _write(output_file, OutputManifest(manifest_file, FINGERPRINT), [('a', 'A')])
+
+    assert OutputManifest.load(manifest_file, {'format_version': 2}) is None
@@ -0,0 +1,18 @@
+from processor.utils.metrics import PipelineMetrics
+
+
+def _types(text: str) -> dict:
+    return dict(line.split()[2:4] for line in text.splitlines() if line.startswith('# TYPE'))
+
+
+def test_per_run_totals_are_gauges():
+    metrics = PipelineMetrics()
+    metrics.add_stage('extract', 1.5)
+    metrics.add_file('a.txt', '.txt', 'TextExtractor', 10, 0.2)
+    types = _types(metrics.prometheus_text(2.0))
+
+    # Toplamlar her çalışmada sıfırlanır; counter olarak yazılırsa rate() sıfırlanmayı yanlış yorumlar
+    assert types['textractor_stage_seconds'] == 'gauge'
+    assert types['textractor_files_by_extension'] == 'gauge'
+    assert 'counter' not in types.values()
+    assert 'textractor_stage_seconds{stage="extract"} 1.5' in metrics.prometheus_text(2.0)
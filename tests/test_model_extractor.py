@@ -0,0 +1,59 @@
+import io
+import mmap
+import warnings
+
+import pytest
+
+from processor.extractors import model_extractor
+from processor.extractors.model_extractor import ModelExtractor
+
+np = pytest.importorskip('numpy')
+
+
+@pytest.fixture
+def closed_mappings(monkeypatch):
+    closed = []
+
+    class RecordingMmap(mmap.mmap):
+        def close(self):
+            super().close()
+            closed.append(self)
+
+    monkeypatch.setattr(model_extractor.mmap, 'mmap', RecordingMmap)
+    return closed
+
+
+def test_npy_mapping_is_closed(tmp_path, closed_mappings):
+    path = tmp_path / 'a.npy'
+    np.save(path, np.arange(1000, dtype=np.float64))
+
+    summary = ModelExtractor().extract_text(str(path))
+    assert 'Şekil: (1000,)' in summary
+    assert len(closed_mappings) == 1
+
+
+def test_npz_mapping_is_closed(tmp_path, closed_mappings):
+    path = tmp_path / 'a.npz'
+    np.savez(path, x=np.arange(10), y=np.ones((3, 4)))
+
+    summary = ModelExtractor().extract_text(str(path))
+    assert 'NPZ arşivi: 2 dizi' in summary
+    assert len(closed_mappings) == 1
+
+
+def test_npy_3_0_header_is_utf8(tmp_path):
+    path = tmp_path / 'a.npy'
+    with warnings.catch_warnings():
+        # NumPy 3.0 biçimiyle yazıldığını uyarır
+        warnings.simplefilter('ignore', UserWarning)
+        np.save(path, np.zeros(3, dtype=[('ağırlık', '<i4'), ('b', '<f8')]))
+    assert path.read_bytes()[6:8] == b'\x03\x00'
+
+    summary = ModelExtractor().extract_text(str(path))
+    assert "('ağırlık', '<i4')" in summary
+
+
+def test_unknown_npy_version_is_rejected():
+    stream = io.BytesIO(b'\x93NUMPY\x04\x00' + b'\x00' * 16)
+    with pytest.raises(ValueError, match="4.0"):
+        ModelExtractor._read_header(stream)
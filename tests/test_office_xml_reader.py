@@ -0,0 +1,48 @@
+import pytest
+
+from processor.extractors.office_extractor import OfficeExtractor
+
+odf = pytest.importorskip('odf')
+
+
+def _odt(path) -> str:
+    from odf import draw, style, table, text
+    from odf.opendocument import OpenDocumentText
+
+    doc = OpenDocumentText()
+    layout = style.PageLayout(name='pm1')
+    doc.automaticstyles.addElement(layout)
+    master = style.MasterPage(name='Standard', pagelayoutname=layout)
+    header = style.Header()
+    header.addElement(text.P(text='üst bilgi'))
+    master.addElement(header)
+    doc.masterstyles.addElement(master)
+
+    doc.text.addElement(text.H(outlinelevel=1, text='Başlık'))
+    doc.text.addElement(text.P(text='Paragraf'))
+    row = table.TableRow()
+    cell = table.TableCell()
+    cell.addElement(text.P(text='hücre'))
+    row.addElement(cell)
+    grid = table.Table(name='T')
+    grid.addElement(row)
+    doc.text.addElement(grid)
+    outer = text.P(text='dış ')
+    frame = draw.Frame(width='1cm', height='1cm', anchortype='as-char')
+    box = draw.TextBox()
+    box.addElement(text.P(text='iç'))
+    frame.addElement(box)
+    outer.addElement(frame)
+    doc.text.addElement(outer)
+    doc.save(str(path))
+    return str(path)
+
+
+def test_odt_xml_reader_matches_odfpy(tmp_path):
+    path = _odt(tmp_path / 'a.odt')
+
+    expected = OfficeExtractor().extract_text(path)
+    assert expected == 'Paragraf\nhücre\ndış iç\niç\nüst bilgi'
+    xml_extractor = OfficeExtractor(xml_formats={'.odt'})
+    assert xml_extractor.extract_text(path) == expected
+    assert ''.join(xml_extractor.iter_text(path)) == expected
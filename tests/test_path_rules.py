@@ -0,0 +1,120 @@
+import os
+
+import pytest
+
+from processor.utils.directory_scanner import DirectoryScanner
+from processor.utils.path_rules import PathRules
+
+
+@pytest.mark.parametrize('pattern, path, is_dir, expected', [
+    # Eğik çizgisiz kalıplar her seviyedeki adla eşleşir
+    ('*.log', 'a.log', False, True),
+    ('*.log', 'deep/dir/a.log', False, True),
+    ('*.log', 'a.log.txt', False, None),
+    # İçinde '/' geçen kalıplar köke bağlıdır
+    ('docs/*.md', 'docs/a.md', False, True),
+    ('docs/*.md', 'sub/docs/a.md', False, None),
+    ('/build', 'build', True, True),
+    ('/build', 'src/build', True, None),
+    # '*' ve '?' dizin ayracını aşmaz
+    ('docs/*.md', 'docs/sub/a.md', False, None),
+    ('a?c', 'abc', False, True),
+    ('a?c', 'a/c', False, None),
+    # '**' sıfır veya daha fazla dizine uyar
+    ('**/test_*.py', 'test_a.py', False, True),
+    ('**/test_*.py', 'x/y/test_a.py', False, True),
+    ('docs/**', 'docs/a/b.md', False, True),
+    ('a/**/b', 'a/b', False, True),
+    ('a/**/b', 'a/x/y/b', False, True),
+    # '/' ile biten kalıplar yalnızca dizinlere uyar
+    ('build/', 'build', True, True),
+    ('build/', 'build', False, None),
+    # Karakter sınıfları ve olumsuzlanmış sınıflar
+    ('file[0-9].txt', 'file3.txt', False, True),
+    ('file[!0-9].txt', 'file3.txt', False, None),
+    ('file[!0-9].txt', 'filex.txt', False, True),
+    # Kaçışlı özel karakterler
+    ('\\#notes', '#notes', False, True),
+    ('\\!important', '!important', False, True),
+    ('a\\*b', 'a*b', False, True),
+    ('a\\*b', 'axb', False, None),
+])
+def test_single_pattern(pattern, path, is_dir, expected):
+    assert PathRules([pattern]).match(path, is_dir=is_dir) is expected
+
+
+def test_comments_and_blank_lines_are_ignored():
+    rules = PathRules(['# yorum', '', '   ', '*.tmp'])
+    assert len(rules.rules) == 1
+    assert rules.match('# yorum') is None
+
+
+def test_trailing_spaces_are_trimmed_unless_escaped():
+    assert PathRules(['a.txt   ']).match('a.txt') is True
+    assert PathRules(['a.txt\\ ']).match('a.txt ') is True
+
+
+def test_last_matching_pattern_wins():
+    rules = PathRules(['*.log', '!keep.log'])
+    assert rules.match('x.log') is True
+    assert rules.match('keep.log') is False
+    assert PathRules(['!keep.log', '*.log']).match('keep.log') is True
+
+
+def test_from_file_reads_gitignore(tmp_path):
+    rules_file = tmp_path / '.gitignore'
+    rules_file.write_text('# derleme çıktıları\nbuild/\n*.pyc\n!keep.pyc\n', encoding='utf-8')
+    rules = PathRules.from_file(str(rules_file))
+
+    assert rules.match('build', is_dir=True) is True
+    assert rules.match('a/b.pyc') is True
+    assert rules.match('keep.pyc') is False
+
+
+def test_missing_rules_file_gives_empty_rules(tmp_path):
+    assert not PathRules.from_file(str(tmp_path / 'yok'))
+
+
+def _tree(root, files):
+    for rel_path in files:
+        path = root / rel_path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(rel_path, encoding='utf-8')
+
+
+def _scan(root, **options):
+    return [os.path.relpath(path, root).replace(os.sep, '/')
+            for path, _ in DirectoryScanner(**options).scan(str(root))]
+
+
+def test_scanner_order_matches_os_walk(tmp_path):
+    _tree(tmp_path, ['b.txt', 'a.txt', 'x/c.txt', 'x/y/d.txt', 'z/e.txt'])
+    expected = [os.path.relpath(os.path.join(dir_path, name), tmp_path).replace(os.sep, '/')
+                for dir_path, _, names in os.walk(tmp_path) for name in names]
+    assert sorted(_scan(tmp_path)) == sorted(expected)
+    # Bir dizinin dosyaları alt dizinlerinden önce gelir
+    scanned = _scan(tmp_path)
+    assert scanned.index('x/c.txt') < scanned.index('x/y/d.txt')
+
+
+def test_scanner_prunes_excluded_dirs_and_default_dirs(tmp_path):
+    _tree(tmp_path, ['src/a.py', 'build/out.py', 'src/build/gen.py', 'node_modules/m.js',
+                     'src/a.min.js', 'src/b.js'])
+    assert sorted(_scan(tmp_path, exclude=['/build/', '*.min.js'])) == \
+        ['src/a.py', 'src/b.js', 'src/build/gen.py']
+
+
+def test_scanner_negation_cannot_reinclude_file_in_pruned_dir(tmp_path):
+    # gitignore'daki gibi: hariç tutulan dizinin içine hiç girilmez
+    _tree(tmp_path, ['logs/keep.log', 'logs/a.log', 'b.log'])
+    assert _scan(tmp_path, exclude=['logs/', '*.log', '!keep.log']) == []
+    assert _scan(tmp_path, exclude=['*.log', '!keep.log']) == ['logs/keep.log']
+
+
+def test_scanner_include_and_exclude_file(tmp_path):
+    _tree(tmp_path, ['a.py', 'b.txt', 'docs/c.md', 'docs/d.py', 'tests/test_a.py'])
+    exclude_file = tmp_path / 'ignore'
+    exclude_file.write_text('tests/\n', encoding='utf-8')
+
+    assert sorted(_scan(tmp_path, include=['*.py', 'docs/**'], exclude_file=str(exclude_file))) == \
+        ['a.py', 'docs/c.md', 'docs/d.py']
@@ -0,0 +1,99 @@
+import os
+import time
+
+import pytest
+
+from processor.utils.supervisor import ExtractionLimitError, ExtractionSupervisor
+
+
+def _target(conn, options):
+    """Dosya adına göre davranan sahte çıkarım döngüsü"""
+    hog = []
+    while True:
+        request = conn.recv()
+        if request is None:
+            break
+        file_path, data = request
+        if file_path == 'sleep':
+            time.sleep(60)
+        elif file_path == 'alloc':
+            while True:
+                hog.append(bytearray(16 * 1024 * 1024))
+                time.sleep(0.01)
+        elif file_path == 'exit':
+            os._exit(3)
+        elif file_path == 'error':
+            conn.send(('error', "bozuk dosya"))
+        elif file_path == 'memory':
+            conn.send(('memory', None))
+        else:
+            conn.send(('ok', f"{file_path}:{data!r}:{os.getpid()}"))
+
+
+@pytest.fixture
+def supervisor():
+    supervisor = ExtractionSupervisor(_target, {}, timeout=1.0, memory_limit_mb=128)
+    yield supervisor
+    supervisor.close()
+
+
+def _pid(result: str) -> str:
+    return result.rsplit(':', 1)[1]
+
+
+def test_child_is_reused_between_files(supervisor):
+    first = supervisor.extract('a.txt')
+    second = supervisor.extract('b.txt', b'veri')
+
+    assert first.startswith('a.txt:None:')
+    assert second.startswith("b.txt:b'veri':")
+    assert _pid(first) == _pid(second)
+
+
+def test_timeout_kills_child_and_next_file_gets_new_one(supervisor):
+    pid = _pid(supervisor.extract('a.txt'))
+    start = time.monotonic()
+    with pytest.raises(ExtractionLimitError) as error:
+        supervisor.extract('sleep')
+
+    assert error.value.reason == 'timeout'
+    assert time.monotonic() - start < 10
+    assert _pid(supervisor.extract('b.txt')) != pid
+
+
+@pytest.mark.skipif(not os.path.exists('/proc/self/statm'), reason="RSS /proc üzerinden okunur")
+def test_memory_limit_kills_child(supervisor):
+    supervisor.timeout = 30
+    with pytest.raises(ExtractionLimitError) as error:
+        supervisor.extract('alloc')
+
+    assert error.value.reason == 'memory'
+    assert supervisor.extract('a.txt').startswith('a.txt:')
+
+
+def test_memory_error_in_child_is_a_limit_error(supervisor):
+    with pytest.raises(ExtractionLimitError) as error:
+        supervisor.extract('memory')
+    assert error.value.reason == 'memory'
+
+
+def test_extractor_error_keeps_child(supervisor):
+    pid = _pid(supervisor.extract('a.txt'))
+    with pytest.raises(RuntimeError, match="bozuk dosya"):
+        supervisor.extract('error')
+    assert _pid(supervisor.extract('b.txt')) == pid
+
+
+def test_crashed_child_is_reported_and_replaced(supervisor):
+    with pytest.raises(RuntimeError, match="çıkış kodu 3"):
+        supervisor.extract('exit')
+    assert supervisor.extract('a.txt').startswith('a.txt:')
+
+
+def test_close_stops_child(supervisor):
+    supervisor.extract('a.txt')
+    process = supervisor._process
+    supervisor.close()
+
+    assert not process.is_alive()
+    assert supervisor._process is None
@@ -0,0 +1,149 @@
+import glob
+import gzip
+import io
+import json
+
+import random
+import string
+
+import pytest
+
+from processor.utils.extraction_record import ExtractionRecord
+from processor.writers.jsonl_writer import JSONLWriter
+from processor.writers.text_writer import TextWriter
+
+# Parçalama sınırı sıkıştırılmış boyuta uygulandığından içerik kolay sıkışmamalı
+_random = random.Random(0)
+RECORDS = [f"kayıt {i}\n" + ''.join(_random.choices(string.ascii_letters, k=i * 397 % 3000))
+           for i in range(40)]
+SHARD_SIZE_MB = 8 / 1024
+
+
+def _decompress(path: str, compression):
+    with open(path, 'rb') as f:
+        data = f.read()
+    if compression == 'gzip':
+        return gzip.decompress(data)
+    if compression == 'zstd':
+        import zstandard
+        return zstandard.ZstdDecompressor().stream_reader(io.BytesIO(data), read_across_frames=True).read()
+    return data
+
+
+def _outputs(writer: TextWriter, compression):
+    return [_decompress(path, compression) for path in writer.outputs]
+
+
+def _clean_run(output_file, **options):
+    writer = TextWriter(output_file, **options)
+    with writer:
+        for record in RECORDS:
+            writer.write_record(record)
+    return _outputs(writer, options.get('compression'))
+
+
+def _interrupted_run(output_file, **options):
+    """İlk yarıdan sonra kontrol noktası alınan, sonra kesilen ve devam ettirilen çalışma"""
+    writer = TextWriter(output_file, **options)
+    writer.open()
+    for record in RECORDS[:20]:
+        writer.write_record(record)
+    state = writer.checkpoint_state()
+    # Kontrol noktasından sonra yazılanlar kaybolmalı
+    for record in RECORDS[20:30]:
+        writer.write_record(record)
+    writer.suspend()
+
+    resumed = TextWriter(output_file, **options)
+    resumed.resume(state)
+    for record in RECORDS[20:]:
+        resumed.write_record(record)
+    resumed.close()
+    return resumed, _outputs(resumed, options.get('compression'))
+
+
+@pytest.mark.parametrize('compression', [None, 'gzip', 'zstd'])
+def test_resume_matches_clean_run(tmp_path, compression):
+    if compression == 'zstd':
+        pytest.importorskip('zstandard')
+    expected = _clean_run(str(tmp_path / 'clean.txt'), compression=compression)
+    writer, actual = _interrupted_run(str(tmp_path / 'resumed.txt'), compression=compression)
+
+    assert actual == expected
+    assert writer.records_written == len(RECORDS)
+    assert not glob.glob(str(tmp_path / '*.tmp'))
+
+
+@pytest.mark.parametrize('compression', [None, 'gzip'])
+def test_resume_with_shards(tmp_path, compression):
+    options = {'compression': compression, 'shard_size_mb': SHARD_SIZE_MB}
+    expected = _clean_run(str(tmp_path / 'clean.txt'), **options)
+    writer, actual = _interrupted_run(str(tmp_path / 'resumed.txt'), **options)
+
+    assert len(expected) > 1 and len(actual) > 1
+    # Parça sınırları yaklaşıktır; parçalar ayırıcıyla birleştirilince kayıt akışı aynı olmalı
+    assert b'\n'.join(actual) == b'\n'.join(expected)
+    assert not glob.glob(str(tmp_path / '*.tmp'))
+
+
+def test_resume_removes_shards_opened_after_checkpoint(tmp_path):
+    output_file = str(tmp_path / 'out.txt')
+    writer = TextWriter(output_file, shard_size_mb=SHARD_SIZE_MB)
+    writer.open()
+    writer.write_record(RECORDS[0])
+    state = writer.checkpoint_state()
+    for record in RECORDS[1:]:
+        writer.write_record(record)
+    assert len(writer.outputs) > 2
+    writer.suspend()
+
+    resumed = TextWriter(output_file, shard_size_mb=SHARD_SIZE_MB)
+    resumed.resume(state)
+    assert resumed.outputs == state['output_files']
+    assert sorted(glob.glob(str(tmp_path / '*.tmp'))) == [f"{path}.tmp" for path in state['output_files']]
+    resumed.close()
+
+
+def test_resume_without_temp_file_fails(tmp_path):
+    output_file = str(tmp_path / 'out.txt')
+    writer = TextWriter(output_file)
+    writer.open()
+    writer.write_record(RECORDS[0])
+    state = writer.checkpoint_state()
+    writer.close(success=False)
+
+    with pytest.raises(FileNotFoundError):
+        TextWriter(output_file).resume(state)
+
+
+def test_failed_close_keeps_previous_output(tmp_path):
+    output_file = tmp_path / 'out.txt'
+    output_file.write_text('eski çıktı', encoding='utf-8')
+    writer = TextWriter(str(output_file))
+    writer.open()
+    writer.write_record(RECORDS[0])
+    writer.close(success=False)
+
+    assert output_file.read_text(encoding='utf-8') == 'eski çıktı'
+    assert not glob.glob(str(tmp_path / '*.tmp'))
+
+
+def test_jsonl_resume(tmp_path):
+    output_file = str(tmp_path / 'out.jsonl')
+    records = [ExtractionRecord(f"{i}.txt", 1, 'text/plain', 'TextExtractor', text=f"metin {i}")
+               for i in range(3)]
+    writer = JSONLWriter(output_file)
+    writer.open()
+    writer.write_record(records[0])
+    state = writer.checkpoint_state()
+    writer.write_record(records[1])
+    writer.suspend()
+
+    resumed = JSONLWriter(output_file)
+    resumed.resume(state)
+    resumed.write_record(records[2])
+    resumed.close()
+
+    with open(output_file, 'r', encoding='utf-8') as f:
+        lines = [json.loads(line) for line in f]
+    assert [line['text'] for line in lines] == ['metin 0', 'metin 2']